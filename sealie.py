@@ -1,6 +1,7 @@
 import sys
+import csv
 import json
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import re
 import logging
 import webbrowser
@@ -16,16 +17,24 @@ from ttkbootstrap.constants import *
 import serial
 import serial.tools.list_ports
 import threading
+import queue
 import time
+import random
 import numpy as np
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d import Axes3D
 from math import radians, sin, cos
 import os
 import pandas as pd
 import io
 import contextlib
+import functools
+import bisect
+import hashlib
+import shelve
+from concurrent.futures import ThreadPoolExecutor
+import importlib.metadata
+import itertools
+from collections import deque
+from array import array
 
 try:
     from gpt4all import GPT4All
@@ -51,6 +60,478 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Plot styling, applied once when matplotlib is first imported
+MPL_RC = {
+    "axes.titlesize": 14,
+    "axes.titleweight": "bold",
+    "axes.labelsize": 12,
+    "axes.labelweight": "bold",
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "legend.fontsize": 10,
+    "legend.frameon": True,
+    "legend.loc": "upper right",
+    "axes.grid": True,
+    "grid.alpha": 0.3,
+    "axes.facecolor": "#f8f9fa",
+    "figure.facecolor": "#f8f9fa",
+    "axes.edgecolor": "#22262A",
+    "axes.linewidth": 1.2,
+}
+
+
+@functools.cache
+def _mpl_tk():
+    """Import matplotlib's Figure and Tk canvas on first use (first plot shown)."""
+    import matplotlib
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    from mpl_toolkits.mplot3d import Axes3D  # registers the "3d" projection
+
+    matplotlib.rcParams.update(MPL_RC)
+    return Figure, FigureCanvasTkAgg
+
+
+@functools.cache
+def _scipy_stats():
+    """Import scipy.stats on first use (advanced analysis)."""
+    from scipy import stats
+
+    return stats
+
+
+@functools.cache
+def _as7341_cmaps():
+    """One colormap per AS7341 bar (AS7341_BAR_COLORS), built on first use."""
+    from matplotlib.colors import LinearSegmentedColormap
+
+    return tuple(
+        LinearSegmentedColormap.from_list(f"bar{i}", colors)
+        for i, colors in enumerate(AS7341_BAR_COLORS)
+    )
+
+
+@functools.cache
+def _static_system_info():
+    """Host facts shown in System Information that cannot change at runtime."""
+    try:
+        mpl_version = importlib.metadata.version("matplotlib")
+    except importlib.metadata.PackageNotFoundError:
+        mpl_version = "Unknown"
+    return {
+        "architecture": platform.architecture()[0],
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": psutil.cpu_count(),
+        "mem_total_gb": psutil.virtual_memory().total / (1024**3),
+        "matplotlib": mpl_version,
+    }
+
+
+# DHT samples kept for plotting (time_data / temp_data / hum_data)
+DHT_HISTORY_LEN = 100
+# Boxcar width of the plotted DHT rolling mean (temp_smooth / hum_smooth)
+DHT_SMOOTH_WINDOW = 5
+
+# AS7341 channels in baseline / bar order (the first 8 are the spectral bars)
+AS7341_CHANNELS = ("F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "CLEAR", "NIR")
+# For the "frame complete" test in _try_parse_as7341
+_AS7341_CHANNEL_SET = frozenset(AS7341_CHANNELS)
+# Low/high intensity colour of each AS7341 bar, violet through red
+AS7341_BAR_COLORS = (
+    ((148 / 255, 0, 211 / 255), (75 / 255, 0, 130 / 255)),
+    ((75 / 255, 0, 130 / 255), (0, 0, 1)),
+    ((0, 0, 1), (0, 1, 1)),
+    ((0, 1, 1), (0, 1, 0)),
+    ((0, 1, 0), (1, 1, 0)),
+    ((1, 1, 0), (1, 127 / 255, 0)),
+    ((1, 127 / 255, 0), (1, 0, 0)),
+    ((1, 0, 0), (148 / 255, 0, 211 / 255)),
+)
+
+# data_log entries kept (settings "log_capacity"); the oldest tenth is dropped
+# whenever it overflows
+LOG_CAPACITY = 1_000_000
+
+# shelve database of LLM replies, kept across sessions (see _cached_reply)
+LLM_CACHE_FILE = "llm_cache"
+
+# Bytes of sealink.log shown by the log viewer unless the full log is requested
+LOG_TAIL_BYTES = 256 * 1024
+
+# How long a serial port enumeration is reused by the sensor dialogs
+PORTS_CACHE_SECONDS = 5.0
+
+# Samples kept per sensor in generic_streams
+GENERIC_STREAM_LEN = 200
+
+# Interval at which sensor readings queued by the serial thread are ingested
+SENSOR_DRAIN_MS = 50
+# Most queued readings ingested per drain tick
+SENSOR_DRAIN_BATCH = 500
+
+# Raw serial lines kept for the Serial Debug Log window
+SERIAL_DEBUG_LINES = 200
+
+# Columns of a data_log row in the data table, recordings and CSV exports
+LOG_COLUMNS = ("Timestamp", "Sensor", *(f"Value{i}" for i in range(1, 11)))
+
+# The recording writer thread appends at most this many queued rows per write
+RECORD_BATCH_ROWS = 64
+# Rows that may wait for the recording writer before new ones are dropped
+RECORD_QUEUE_SIZE = 4096
+# Characters other than the separator that make a recorded field need
+# csv.writer's quoting
+CSV_SPECIAL = re.compile(r'["\r\n]')
+
+# CSV exports hand rows to writerows() in batches of this size
+CSV_BATCH_ROWS = 1000
+# File buffer for CSV exports
+CSV_BUFFER_BYTES = 1 << 20
+
+# Size of the uniform sample of readings the Shapiro-Wilk test runs on
+SHAPIRO_SAMPLE = 5000
+
+# Readings in the log above which the data report summarises sensors in
+# parallel; below it thread start-up costs more than the NumPy reductions
+REPORT_PARALLEL_MIN = 500_000
+
+# Analysis line plots draw at most about this many points per series
+PLOT_MAX_POINTS = 2000
+
+# Upper bound on live plot repaints per second (see _blit_update)
+MAX_REDRAW_HZ = 10
+
+# tb.Meter options shared by the compact gauges on the sensor cards
+CARD_METER_OPTIONS = dict(
+    metertype="full",
+    stripethickness=6,
+    interactive=False,
+    textfont=("Segoe UI", 10, "bold"),
+    subtextfont=("Segoe UI", 9),
+    metersize=90,
+)
+
+# Enhanced meter status (text, bootstyle) for the low, middle and top 30/40/30%
+# of its range, indexed by (pct >= 0.3) + (pct >= 0.7)
+METER_STATUS = (("🟢 Low", "success"), ("🟡 Normal", "warning"), ("🔴 High", "danger"))
+
+# make_cube vertex index bits map to x/y/z, so the 12 edges are the index
+# pairs differing in exactly one bit
+_CUBE_EDGES = [
+    (i, j) for i in range(8) for j in range(i + 1, 8) if bin(i ^ j).count("1") == 1
+]
+# Edges as one polyline over [vertices..., NaN]: i, j, gap, i, j, gap, ...
+_CUBE_EDGE_PATH = np.array([(i, j, 8) for i, j in _CUBE_EDGES]).ravel()
+
+# process_ai_query statistics, tried in order: (query words, reply name,
+# statistic from _ai_stats)
+AI_STAT_OPS = (
+    (("mean", "average"), "Mean", "mean"),
+    (("std", "standard deviation"), "Std", "std"),
+    (("min",), "Min", "min"),
+    (("max",), "Max", "max"),
+)
+# Columns those questions can name: (query word, column, reply label, only
+# rows of this sensor or None)
+AI_STAT_COLUMNS = (
+    ("temp", "Value1", "temperature", None),
+    ("humidity", "Value2", "humidity", None),
+    ("yaw", "Value1", "yaw", "3D Orientation"),
+)
+
+# _simple_ai topics in priority order: (topic, keywords found anywhere in the
+# lower-cased prompt, reply). "chemistry" also needs "water" in the prompt.
+SIMPLE_AI_TOPICS = (
+    (
+        "greeting",
+        ("hello", "hi", "hey", "greetings"),
+        "Hello! I'm your IoT assistant. I can help you with sensor data analysis, Arduino projects, and technical questions. What would you like to know?",
+    ),
+    (
+        "chat",
+        ("how are you", "how's it going", "what's up"),
+        "I'm doing great! I'm here to help you with your IoT project. I can see you have sensors connected and data flowing in. What would you like to explore?",
+    ),
+    (
+        "weather",
+        ("weather", "temperature outside", "hot", "cold"),
+        "I can see your sensor data, but I don't have access to external weather data. However, I can help you interpret your temperature sensor readings! Your sensors show real-time environmental data.",
+    ),
+    (
+        "chemistry",
+        ("chemical formula",),
+        "The chemical formula for water is H₂O - two hydrogen atoms and one oxygen atom. This is a fundamental compound in chemistry and essential for life!",
+    ),
+    (
+        "tech",
+        ("computer", "laptop", "technology", "programming"),
+        "I can help with programming and technology questions! For your IoT project, I can assist with Arduino code, sensor integration, and data analysis. What specific tech topic interests you?",
+    ),
+    (
+        "temp",
+        ("temperature", "temp"),
+        "Temperature sensors like DHT11/DHT22 measure ambient temperature. Normal range is 0-50°C for most applications. Your current readings show real-time temperature data from your connected sensors.",
+    ),
+    (
+        "hum",
+        ("humidity", "hum"),
+        "Humidity sensors measure water vapor in air. Normal indoor range is 30-70% RH. Your sensor data shows current humidity levels that you can monitor in real-time.",
+    ),
+    (
+        "imu",
+        ("imu", "gyro", "accelerometer", "motion", "orientation", "mpu6050"),
+        "IMU sensors (MPU6050) measure orientation and motion. Values are in degrees for pitch/roll/yaw. You can see the 3D orientation visualization in the Sensors tab when your MPU6050 is connected.",
+    ),
+    (
+        "tds",
+        ("tds", "water", "quality", "ppm"),
+        "TDS sensors measure water quality in parts per million (ppm). Lower values indicate purer water. Your TDS readings are displayed in real-time on the dashboard.",
+    ),
+    (
+        "light",
+        ("spectrometer", "as7341", "light", "color", "spectrum"),
+        "AS7341 spectrometer measures light across different wavelengths. It's useful for color analysis and light sensing. The bar chart in the Sensors tab shows the spectral data from your AS7341 sensor.",
+    ),
+    (
+        "help",
+        ("help", "what", "how", "explain"),
+        "I can help you with:\n• Sensor data interpretation\n• Arduino project guidance\n• IoT system troubleshooting\n• Data analysis and insights\n• General technical questions\n\nWhat specific question do you have?",
+    ),
+)
+# Every keyword -> the topics of the keywords it starts with, since a match
+# hides shorter keywords beginning at the same position
+_SIMPLE_AI_KEYWORDS = {
+    word: {t for t, words, _ in SIMPLE_AI_TOPICS for w in words if word.startswith(w)}
+    for _, words, _ in SIMPLE_AI_TOPICS
+    for word in words
+}
+# All keywords in one pass; the lookahead also reports overlapping matches and
+# longest-first order picks "how are you" over "how"
+_SIMPLE_AI_RX = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_SIMPLE_AI_KEYWORDS, key=len, reverse=True)))
+    + "))"
+)
+_SIMPLE_AI_REPLIES = {topic: reply for topic, _, reply in SIMPLE_AI_TOPICS}
+
+
+def _simple_ai_topic(prompt_lower, topics):
+    """The first of topics, in SIMPLE_AI_TOPICS order, the prompt mentions."""
+    found = set()
+    for word in _SIMPLE_AI_RX.findall(prompt_lower):
+        found |= _SIMPLE_AI_KEYWORDS[word]
+    if "water" not in prompt_lower:
+        found.discard("chemistry")
+    return next((t for t in topics if t in found), None)
+
+
+# The sensor topics _simple_ai_fallback answers after a GPT4All failure
+SIMPLE_AI_FALLBACK_TOPICS = ("greeting", "temp", "hum", "imu", "tds", "light")
+
+# Quick stats line formatters: with DHT readings, and orientation only
+_QUICK_STATS_DHT = "Temp: {:.1f}°C, Humidity: {:.1f}%, Yaw: {:.1f}°".format
+_QUICK_STATS_IMU = "Yaw: {:.1f}°, Pitch: {:.1f}°, Roll: {:.1f}°".format
+
+# Matches the opening of a named group, e.g. "(?P<TEMP>"
+_NAMED_GROUP_RX = re.compile(r"\(\?P<\w+>")
+
+# KEY:value tokens of a legacy "YAW:.. PITCH:.. ROLL:.. TEMP:.. HUM:.." line; a
+# token is keyed by its prefix, so "TEMPF:72" reads as TEMP
+_LEGACY_FIELD_RX = re.compile(
+    r"(?<![^\s,])(YAW|PITCH|ROLL|TEMP|HUM)[^\s,:]*:([^\s,:]*)"
+)
+
+# AS7341 channel readings, e.g. "F1:123" or "F1 415nm: 123"
+_AS7341_RX = re.compile(
+    r"\b(F[1-8]|CLEAR|NIR)\b(?:\s*\d*nm)?\s*:\s*(-?\d+(?:\.\d+)?)", re.IGNORECASE
+)
+
+
+def _csv_floats(fields):
+    """Floats for CSV value strings; unparsable entries read as 0.0."""
+    try:
+        return list(map(float, fields))
+    except ValueError:
+        values = []
+        for v in fields:
+            try:
+                values.append(float(v))
+            except ValueError:
+                values.append(0.0)
+        return values
+
+
+def _padded(values, width):
+    """values truncated or padded with "" to exactly width items."""
+    values = tuple(values)[:width]
+    return values + ("",) * (width - len(values))
+
+
+@functools.cache
+def _record_format(fields):
+    """Bound str.format writing a recording line from the first `fields`
+    columns, leaving the rest of LOG_COLUMNS empty."""
+    template = ",".join(["{}"] * fields) + "," * (len(LOG_COLUMNS) - fields)
+    return (template + "\r\n").format
+
+
+def _write_csv_rows(writer, rows):
+    """Write an iterable of rows in CSV_BATCH_ROWS sized writerows() calls."""
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, CSV_BATCH_ROWS)):
+        writer.writerows(batch)
+
+
+def _welford_add(agg, x):
+    """Fold reading x into a running [n, mean, M2, min, max] aggregate."""
+    n = agg[0] + 1
+    delta = x - agg[1]
+    agg[0] = n
+    agg[1] += delta / n
+    agg[2] += delta * (x - agg[1])
+    if x < agg[3]:
+        agg[3] = x
+    if x > agg[4]:
+        agg[4] = x
+
+
+def _welford_of(values):
+    """The _welford_add aggregate of a float array, computed in one pass."""
+    if not len(values):
+        return [0, 0.0, 0.0, float("inf"), float("-inf")]
+    mean = values.mean()
+    m2 = np.square(values - mean).sum()
+    return [
+        len(values),
+        float(mean),
+        float(m2),
+        float(values.min()),
+        float(values.max()),
+    ]
+
+
+def _nan_corrcoef(mat):
+    """Pearson r between the columns of mat, each pair over the rows where
+    both are present (as DataFrame.corr does); one np.corrcoef call when no
+    value is missing."""
+    present = ~np.isnan(mat)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if present.all():
+            return np.corrcoef(mat, rowvar=False)
+        k = mat.shape[1]
+        corr = np.full((k, k), np.nan)
+        for i, j in itertools.combinations_with_replacement(range(k), 2):
+            rows = present[:, i] & present[:, j]
+            if np.count_nonzero(rows) > 1:
+                r = np.corrcoef(mat[rows, i], mat[rows, j])[0, 1]
+                corr[i, j] = corr[j, i] = r
+        return corr
+
+
+def _sensor_summary(sensor, values):
+    """The data report's DETAILED ANALYSIS block for one sensor's readings."""
+    block = f"DETAILED ANALYSIS: {sensor}\n{'─' * 40}\n"
+    if not len(values):
+        return block + "No numeric data available\n\n"
+    return block + (
+        f"Data Points: {len(values)}\n"
+        f"Mean: {np.mean(values):.4f}\n"
+        f"Std Dev: {np.std(values):.4f}\n"
+        f"Min: {np.min(values):.4f}\n"
+        f"Max: {np.max(values):.4f}\n"
+        f"Range: {np.ptp(values):.4f}\n\n"
+    )
+
+
+def _linear_fit(x, y):
+    """Least-squares slope, intercept and Pearson r of y against x."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mx, my = x.mean(), y.mean()
+    dx, dy = x - mx, y - my
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        r = sxy / np.sqrt(sxx * syy)
+    return slope, my - slope * mx, r
+
+
+class SharedMeterCanvas:
+    """A round gauge on one plain canvas: a cached trough image plus one arc.
+
+    Stands in for tb.Meter on the dashboard, which builds its own PIL images
+    and style on every instantiation and every value change.
+    """
+
+    # (size, thickness, trough colour) -> PhotoImage of the empty gauge
+    _raw_cache = {}
+
+    def __init__(self, parent, total, subtext, suffix, bootstyle, size=140, width=10):
+        colors = tb.Style().colors
+        self.total = total
+        self.suffix = suffix
+        self.canvas = tk.Canvas(
+            parent, width=size, height=size, bg=colors.light, highlightthickness=0
+        )
+        self.canvas.create_image(
+            0, 0, anchor="nw", image=self._raw_render(size, width, colors.border)
+        )
+        # Tk strokes the arc centred on its box; the trough image is drawn
+        # inward from a 1px margin, so inset by half the stroke to line up
+        pad = width / 2 + 1
+        self._arc = self.canvas.create_arc(
+            pad,
+            pad,
+            size - pad,
+            size - pad,
+            start=225,
+            extent=0,
+            style="arc",
+            width=width,
+            outline=colors.get(bootstyle),
+        )
+        self._text = self.canvas.create_text(
+            size / 2, size / 2 - 6, font=("Segoe UI", 14, "bold"), fill=colors.fg
+        )
+        self.canvas.create_text(
+            size / 2,
+            size / 2 + 16,
+            text=subtext,
+            font=("Segoe UI", 10),
+            fill=colors.secondary,
+        )
+
+    @classmethod
+    def _raw_render(cls, size, width, trough):
+        """The static 270° trough, rendered once per size and colour."""
+        key = (size, width, trough)
+        image = cls._raw_cache.get(key)
+        if image is None:
+            scale = 4  # draw large and downsample for smooth edges
+            big = Image.new("RGBA", (size * scale, size * scale))
+            ImageDraw.Draw(big).arc(
+                (scale, scale, (size - 1) * scale, (size - 1) * scale),
+                135,
+                45,
+                fill=trough,
+                width=width * scale,
+            )
+            image = ImageTk.PhotoImage(big.resize((size, size), Image.LANCZOS))
+            cls._raw_cache[key] = image
+        return image
+
+    def update(self, value):
+        """Sweep the arc to value and show it as text."""
+        frac = min(max(value / self.total, 0.0), 1.0)
+        self.canvas.itemconfigure(self._arc, extent=-270 * frac)
+        self.canvas.itemconfigure(self._text, text=f"{value:.0f}{self.suffix}")
+        return self
+
+
 class SeaLinkApp(tb.Window):
     """
     Main application class for the SeaLink Dashboard.
@@ -120,40 +601,91 @@ class SeaLinkApp(tb.Window):
         self.serial_conn = None
         self.is_connected = False
         self.read_thread = None
-        self.after_job = None
+        self._stop = threading.Event()  # set to ask read_thread to exit
+        self._last_ports = None  # (devices, board names) shown in port_menu
+        self._ports_cache = ((), float("-inf"))  # (devices, time.monotonic())
+        self._err_popup = None  # connection error Toplevel, built once
+        # platform.processor() etc. can shell out; have them ready off the UI thread
+        threading.Thread(target=_static_system_info, daemon=True).start()
         # Sidebar state defaults (initialized early to avoid callback races)
         self.sidebar_expanded = True
         self.sidebar_min_width = 48
         self.sidebar_max_width = 220
+        self.current_tab = 0  # index into self.tabs of the raised tab
+        self._tabs_built = set()  # lazily built tab indices (settings, about)
 
         # Sensor data
-        self.time_data, self.temp_data, self.hum_data = [], [], []
+        # Bounded so long sessions don't grow memory or the plotted polylines
+        self.time_data = deque(maxlen=DHT_HISTORY_LEN)
+        self.temp_data = deque(maxlen=DHT_HISTORY_LEN)
+        self.hum_data = deque(maxlen=DHT_HISTORY_LEN)
+        # Rolling means of temp/hum_data, kept index-aligned with them
+        self.temp_smooth = deque(maxlen=DHT_HISTORY_LEN)
+        self.hum_smooth = deque(maxlen=DHT_HISTORY_LEN)
+        self._temp_win = deque(maxlen=DHT_SMOOTH_WINDOW)
+        self._hum_win = deque(maxlen=DHT_SMOOTH_WINDOW)
         self.yaw, self.pitch, self.roll = 0, 0, 0
         self.cal_yaw, self.cal_pitch, self.cal_roll = 0, 0, 0
+        self._R = np.empty((3, 3))  # orientation matrix, reused every update
+        self._rot_buf = np.empty((3, 8))  # rotated make_cube() corners
         self.start_time = time.time()
 
         self.active_sensors = []  # List of dicts: {type, name, port, ...}
         self._template_cache = None  # lazy-loaded sensor templates
-        self.generic_streams = {}  # name -> {"time":[], field->[...]} for non-DHT/IMU
+        self._template_rx = None  # combined template regex; reset when sensors change
+        self._sensor_by_type = None  # _sensor_for_type index; reset likewise
+        self.generic_streams = {}  # name -> ring buffer (_new_stream), non-DHT/IMU
         self._sensors_refresh_pending = False
         self._as7341_buf = {"data": {}, "t": 0.0}
-        self.as7341_state = {}  # name -> {"bars":[], "canvas":..., "baseline":dict, "smoothed":list}
+        self.as7341_state = {}  # name -> {"bars", "baseline", "smoothed"}
         self.imu_widgets = {}  # sensor name -> {yaw:Meter, pitch:Meter, roll:Meter}
+        self._blit = {}  # plot key -> {"canvas", "ax", "artists", "bg"}
+        self._gradient_cache = {}  # (color, width) -> _meter_gradient PhotoImage
+        self._logo = None  # 48x48 PhotoImage of Sealielogo.png, see _logo_photo
+        self._dash_layout = None  # _dashboard_layout() the dashboard was built for
+        self._dash_meters = []  # (SharedMeterCanvas, value getter) on the dashboard
+        self._dash_bars = []  # (_draw_enhanced_meter widgets, value getter)
+        self._dash_pending = False  # a build_dashboard is queued with after_idle
+        self._notif = None  # topbar label reused by show_notification
+        self._notif_after = None  # after() id that hides it again
+        # Live plot handles, set when their sensor cards are built
+        self.fig = self.ax1 = self.canvas = None  # DHT
+        self.cube_data = self.ax3d = self.canvas3d = None  # orientation cube
+        self.cube_data_data_tab = self.ax3d_data = self.canvas3d_data = None
+        self._temp_line = self._hum_line = None  # DHT Line2D handles
+        self._dht_fig_key = None  # build_dht_plot inputs self.fig was drawn from
 
         self.data_log = []  # List of dicts: {timestamp, sensor, values}
+        self._log_version = 0  # bumped whenever data_log changes
+        self._log_stamp = (None, "")  # (epoch second, log_data timestamp text)
+        self._df_cache = (None, None)  # (_log_version, get_data_df frame)
+        self._ai_answers = (None, {})  # (_log_version, {query: stats answer})
+        self._corr_cache = (None, None)  # (_log_version, _correlation_frame)
+        self._ai_stats_cache = (None, {})  # (_log_version, {_ai_stats key: value})
+        self._llm_cache = None  # LLM_CACHE_FILE shelf, opened on first question
+        self._llm_cache_lock = threading.Lock()  # _ai_pool vs on_close
+        self._serial_debug_log = deque(maxlen=SERIAL_DEBUG_LINES)
+        self._chat_buffer = []  # append_ai_chat text waiting for _flush_chat
+        self._ai_pool = ThreadPoolExecutor(max_workers=1)  # runs ai_func calls
+        self._reset_log_index()
         self.is_recording = False
         self.recording_file = None
+        self._record_queue = None  # rows for _record_worker while recording
+        self._record_thread = None
+        self._ingest_q = queue.Queue()  # (handler, *args) for _drain_sensor_queue
+        self._drain_job = None
 
         if GPT4ALL_AVAILABLE:
             # NOTE: Model will be downloaded automatically on first use
             self.llm = None  # Will be initialized in init_ai() when needed
         else:
             self.llm = None
+        self.ai_status_lbl = None  # topbar label, created by build_layout
 
         self.build_menu_bar()
         self.build_layout()
         self.refresh_ports()
-        self.schedule_simulation()
+        self._drain_sensor_queue()
         self.apply_theme()
         self.init_ai()
 
@@ -236,8 +768,6 @@ class SeaLinkApp(tb.Window):
         )
         if file:
             try:
-                import csv
-
                 imported_count = 0
                 with open(file, "r", encoding="utf-8") as f:
                     reader = csv.DictReader(f)
@@ -253,7 +783,7 @@ class SeaLinkApp(tb.Window):
                             "sensor": row.get("Sensor", ""),
                             "values": values,
                         }
-                        self.data_log.append(entry)
+                        self._append_log_entry(entry)
                         imported_count += 1
 
                 # Refresh the data table
@@ -498,6 +1028,7 @@ AI Assistant:
                 settings.setdefault("theme", "superhero")
                 settings.setdefault("ai_provider", "none")  # auto|openai|gpt4all|none
                 settings.setdefault("openai_api_key", "")
+                settings.setdefault("log_capacity", LOG_CAPACITY)
                 return settings
         except:
             # Return default settings if file doesn't exist or is invalid
@@ -506,6 +1037,7 @@ AI Assistant:
                 "theme": "superhero",
                 "ai_provider": "simple",
                 "openai_api_key": "",
+                "log_capacity": LOG_CAPACITY,
             }
 
     def save_settings(self):
@@ -534,12 +1066,9 @@ AI Assistant:
             )
             self.recording_file = open(filepath, "w", newline="")
             self.recording_path = filepath
-            import csv
-
             self.csv_writer = csv.writer(self.recording_file)
             # Wide header to accommodate sensors with many fields
-            header = ["Timestamp", "Sensor"] + [f"Value{i}" for i in range(1, 11)]
-            self.csv_writer.writerow(header)
+            self.csv_writer.writerow(LOG_COLUMNS)
             self.show_notification(
                 f"Recording to {os.path.basename(filepath)}", style="success"
             )
@@ -557,19 +1086,156 @@ AI Assistant:
             if hasattr(self, "rec_status_lbl") and self.rec_status_lbl.winfo_exists():
                 self.rec_status_lbl.config(text="Not recording")
 
-    def log_data(self, sensor, values):
-        import datetime
+    def _reset_log_index(self):
+        """Rebuild the columnar copies of data_log used by the analysis tools."""
+        self._sensor_codes = {}  # sensor name -> small int code
+        self._sensor_rows = {}  # sensor name -> data_log row indices
+        self._row_codes = array("l")  # sensor code of each data_log row
+        self._flat_values = array("d")  # every numeric reading, in log order
+        self._flat_rows = array("l")  # data_log row of each reading
+        self._float_cache = {}  # sensor name (None = all) -> _get_floats array
+        self._sample = array("d")  # reservoir sample of _flat_values
+        self._agg = {}  # sensor name (None = all) -> _welford_add aggregate
+        self._log_version += 1
+        for entry in self.data_log:
+            self._index_log_entry(entry)
+
+    def _index_log_entry(self, entry):
+        row = len(self._row_codes)
+        codes = self._sensor_codes
+        self._row_codes.append(codes.setdefault(entry["sensor"], len(codes)))
+        self._sensor_rows.setdefault(entry["sensor"], []).append(row)
+        self._float_cache.pop(entry["sensor"], None)
+        self._float_cache.pop(None, None)
+        new_agg = [0, 0.0, 0.0, float("inf"), float("-inf")]
+        aggs = (
+            self._agg.setdefault(entry["sensor"], new_agg),
+            self._agg.setdefault(None, new_agg[:]),
+        )
+        for value in entry["values"]:
+            if value is None or value == "":
+                continue
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            seen = len(self._flat_values)
+            self._flat_values.append(value)
+            self._flat_rows.append(row)
+            for agg in aggs:
+                _welford_add(agg, value)
+            # Algorithm R keeps _sample uniform over every reading so far
+            if seen < SHAPIRO_SAMPLE:
+                self._sample.append(value)
+            else:
+                j = random.randrange(seen + 1)
+                if j < SHAPIRO_SAMPLE:
+                    self._sample[j] = value
 
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = {"timestamp": timestamp, "sensor": sensor, "values": values}
+    def _append_log_entry(self, entry):
         self.data_log.append(entry)
+        self._log_version += 1
+        self._index_log_entry(entry)
+        capacity = self.settings.get("log_capacity", LOG_CAPACITY)
+        if len(self.data_log) > capacity:
+            self._trim_log(len(self.data_log) - capacity + capacity // 10)
+
+    def _trim_log(self, count):
+        """Drop the oldest count entries from data_log and the data table."""
+        del self.data_log[:count]
+        self._trim_log_index(count)
+        try:
+            if hasattr(self, "data_table") and self.data_table.winfo_exists():
+                rows = self.data_table.get_children()
+                if len(rows) == len(self.data_log) + count:
+                    self.data_table.delete(*rows[:count])
+                else:
+                    self._fill_data_table()  # table and log have drifted apart
+        except Exception as e:
+            logger.error(f"Data table trim failed: {e}")
+
+    def _trim_log_index(self, count):
+        """
+        Drop the first count rows from the columnar index without re-indexing
+        the survivors: slice the arrays, renumber rows and recompute the
+        aggregates and sample from the remaining readings with numpy.
+        """
+        cut = bisect.bisect_left(self._flat_rows, count)
+        self._row_codes = self._row_codes[count:]
+        self._flat_values = self._flat_values[cut:]
+        # Copies, not views: a buffer export would stop the arrays growing
+        rows = np.array(self._flat_rows[cut:], dtype="l") - count
+        self._flat_rows = array("l", rows.tobytes())
+        self._float_cache = {}
+        self._log_version += 1
+
+        codes = np.array(self._row_codes, dtype="l")
+        values = np.array(self._flat_values, dtype=float)
+        value_codes = codes[rows]
+        self._sensor_rows = {}
+        self._agg = {None: _welford_of(values)}
+        for sensor, code in self._sensor_codes.items():
+            # Codes of sensors with no rows left stay reserved, so new sensors
+            # cannot reuse them
+            sensor_rows = np.flatnonzero(codes == code)
+            if not len(sensor_rows):
+                continue
+            self._sensor_rows[sensor] = sensor_rows.tolist()
+            self._agg[sensor] = _welford_of(values[value_codes == code])
+
+        # A uniform sample of the survivors is a valid Algorithm R reservoir
+        if len(values) > SHAPIRO_SAMPLE:
+            pick = np.random.default_rng().choice(
+                len(values), SHAPIRO_SAMPLE, replace=False
+            )
+            self._sample = array("d", values[pick].tobytes())
+        else:
+            self._sample = array("d", values.tobytes())
+
+    def _sensor_entries(self, sensor):
+        """data_log entries recorded for sensor, in log order."""
+        return [self.data_log[i] for i in self._sensor_rows.get(sensor, ())]
+
+    def _log_values(self, sensor=None):
+        """Return (values, rows, entries) for sensor, or for every sensor if None.
+
+        values is a float64 array of the numeric readings in log order, rows the
+        data_log row each reading came from and entries the number of rows.
+        """
+        values = np.array(self._flat_values, dtype=float)
+        rows = np.array(self._flat_rows, dtype=np.intp)
+        if sensor is None:
+            return values, rows, len(self._row_codes)
+        code = self._sensor_codes.get(sensor)
+        if code is None:
+            return values[:0], rows[:0], 0
+        mask = (np.array(self._row_codes) == code)[rows]
+        return values[mask], rows[mask], len(self._sensor_rows.get(sensor, ()))
+
+    def _get_floats(self, sensor=None):
+        """Read-only float64 readings for sensor (all sensors if None), cached."""
+        floats = self._float_cache.get(sensor)
+        if floats is None:
+            floats = self._log_values(sensor)[0]
+            floats.flags.writeable = False
+            self._float_cache[sensor] = floats
+        return floats
+
+    def log_data(self, sensor, values):
+        # Readings arrive many times a second; format each second's stamp once
+        second = int(time.time())
+        if second != self._log_stamp[0]:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._log_stamp = (second, stamp)
+        timestamp = self._log_stamp[1]
+        entry = {"timestamp": timestamp, "sensor": sensor, "values": values}
+        self._append_log_entry(entry)
         # Append to Data table live if present
         try:
             if hasattr(self, "data_table") and self.data_table.winfo_exists():
-                vals = list(values)[:10]
-                if len(vals) < 10:
-                    vals += [""] * (10 - len(vals))
-                self.data_table.insert("", "end", values=(timestamp, sensor, *vals))
+                self.data_table.insert(
+                    "", "end", values=(timestamp, sensor, *_padded(values, 10))
+                )
 
                 # Update data summary
                 if hasattr(self, "data_summary"):
@@ -578,20 +1244,74 @@ AI Assistant:
             pass
         if (
             self.is_recording
-            and hasattr(self, "recording_path")
-            and self.recording_path
+            and self._record_queue is not None
+            and self._record_thread.is_alive()
         ):
-            row = [timestamp, sensor] + list(values)[:10]
-            if len(row) < 12:
-                row += [""] * (12 - len(row))
             try:
-                import csv
+                row = (timestamp, sensor, *tuple(values)[: len(LOG_COLUMNS) - 2])
+                self._record_queue.put_nowait(row)
+            except queue.Full:
+                logger.error("Recording writer is behind; dropped a row")
+
+    def _start_record_writer(self, path):
+        """Start appending logged rows to path from a background thread."""
+        self._record_queue = queue.Queue(maxsize=RECORD_QUEUE_SIZE)
+        self._record_thread = threading.Thread(
+            target=self._record_worker, args=(path, self._record_queue), daemon=True
+        )
+        self._record_thread.start()
 
-                with open(self.recording_path, "a", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(row)
-            except Exception as e:
-                logger.error(f"Failed to write to recording file: {e}")
+    def _stop_record_writer(self, timeout=None):
+        """Let the writer flush what is queued and exit; wait up to timeout."""
+        if self._record_queue is None:
+            return
+        self._record_queue.put(None)
+        self._record_queue = None
+        if timeout is not None:
+            self._record_thread.join(timeout)
+
+    def _record_worker(self, path, rows):
+        """Append rows from the queue to path until a None sentinel arrives."""
+        try:
+            with open(path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                row = ()
+                while row is not None:
+                    batch = []
+                    row = rows.get()
+                    # Take whatever else is already waiting in the same write
+                    while row is not None:
+                        batch.append(row)
+                        if len(batch) >= RECORD_BATCH_ROWS or rows.empty():
+                            break
+                        row = rows.get_nowait()
+                    for values in batch:
+                        # csv.writer writes None as an empty field; format()
+                        # would write "None"
+                        if None in values:
+                            writer.writerow(_padded(values, len(LOG_COLUMNS)))
+                            continue
+                        line = _record_format(len(values))(*values)
+                        # A line of plain numbers and names has exactly the
+                        # column separators and nothing csv.writer would quote
+                        if line.count(",") == len(LOG_COLUMNS) - 1 and not (
+                            CSV_SPECIAL.search(line, 0, len(line) - 2)
+                        ):
+                            f.write(line)
+                        else:
+                            writer.writerow(_padded(values, len(LOG_COLUMNS)))
+                    f.flush()
+        except Exception as e:
+            logger.error(f"Failed to write to recording file: {e}")
+            self._ingest_q.put((self._record_failed, rows, e))
+
+    def _record_failed(self, rows, error):
+        """Stop recording after the writer thread for rows died on error."""
+        if self._record_queue is not rows:
+            return  # that recording was already stopped
+        self._record_queue = None  # nobody reads it any more; don't wait on it
+        self.stop_recording()
+        self.show_notification(f"Recording stopped: {error}", style="danger")
 
     def save_board_names(self):
         with open(self.board_names_file, "w") as f:
@@ -742,11 +1462,10 @@ AI Assistant:
         for tab in self.tabs:
             tab.place(relx=0.02, rely=0.04, relwidth=0.96, relheight=0.92)
             tab.configure(borderwidth=2, relief="groove")
-        self.build_dashboard()
         self.build_sensors_tab()
         self.build_data_tab()
-        self.build_settings_tab()
-        self.build_about_tab()
+        # Settings and About are built by show_tab the first time they open;
+        # the dashboard is built when show_tab(0) runs its scheduled rebuild
         self.show_tab(0)
 
         # Sidebar (classic packed)
@@ -832,14 +1551,14 @@ AI Assistant:
                 pass
         # Update plot backgrounds if needed
         try:
-            if hasattr(self, "fig") and hasattr(self, "ax1"):
+            if self.fig is not None and self.ax1 is not None:
                 self.fig.patch.set_facecolor(c["card"])
                 self.ax1.set_facecolor(c["card"])
-                if hasattr(self, "canvas"):
-                    self.canvas.draw()
-            if hasattr(self, "ax3d") and hasattr(self, "canvas3d"):
+                if self.canvas is not None:
+                    self.canvas.draw_idle()
+            if self.ax3d is not None and self.canvas3d is not None:
                 self.ax3d.set_facecolor(c["card"])
-                self.canvas3d.draw()
+                self.canvas3d.draw_idle()
         except Exception:
             pass
 
@@ -860,8 +1579,27 @@ AI Assistant:
             "SeaLink Dashboard\nVersion 1.0\n\nA professional dashboard for sensor data visualization.\n© 2024 Your Company",
         )
 
+    def _list_ports(self, max_age=PORTS_CACHE_SECONDS):
+        """
+        Serial port device names. comports() can take hundreds of ms on
+        Windows, so results younger than max_age seconds are reused.
+        """
+        ports, stamp = self._ports_cache
+        now = time.monotonic()
+        if now - stamp > max_age:
+            ports = tuple(p.device for p in serial.tools.list_ports.comports())
+            self._ports_cache = (ports, now)
+        return ports
+
     def refresh_ports(self):
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+        # Explicit refresh: always enumerate (and refresh the dialogs' cache)
+        ports = self._list_ports(max_age=0)
+        # Nothing plugged/unplugged or renamed since last refresh: keep the
+        # combobox (and the user's current selection) as is
+        key = (ports, tuple(self.board_names.get(p) for p in ports))
+        if key == self._last_ports:
+            return
+        self._last_ports = key
         # Show saved board names if available
         display_ports = []
         for port in ports:
@@ -894,6 +1632,7 @@ AI Assistant:
             self.disconnect_btn.config(state=NORMAL)
             self.calib_btn.config(state=NORMAL)
             self.send_flash()
+            self._stop.clear()
             self.read_thread = threading.Thread(target=self.read_serial, daemon=True)
             self.read_thread.start()
             # Prompt to name the board if not already named
@@ -906,15 +1645,38 @@ AI Assistant:
 
     def show_connection_error_popup(self, port, error_msg):
         """Show a custom, professional connection error popup."""
+        # Built once and withdrawn on close; later failures only refresh the text
+        if self._err_popup is None:
+            self._build_connection_error_popup()
+        popup = self._err_popup
+        self._err_port_lbl.config(text=f"Port: {port}")
+        self._err_baud_lbl.config(
+            text=f"Baud Rate: {self.settings.get('baud_rate', 9600)}"
+        )
+        self._err_text.config(state="normal")
+        self._err_text.delete("1.0", END)
+        self._err_text.insert("1.0", error_msg)
+        self._err_text.config(state="disabled")
+        popup.deiconify()
+        popup.lift()
+        popup.grab_set()
+        popup.focus_set()
+
+    def _hide_connection_error_popup(self):
+        self._err_popup.grab_release()
+        self._err_popup.withdraw()
+
+    def _build_connection_error_popup(self):
         popup = tk.Toplevel(self)
+        popup.withdraw()
         popup.title("Connection Failed")
         popup.geometry("450x300")
         popup.resizable(False, False)
         popup.configure(bg="#2c3e50")
+        popup.protocol("WM_DELETE_WINDOW", self._hide_connection_error_popup)
 
         # Center the popup
         popup.transient(self)
-        popup.grab_set()
 
         # Header
         header_frame = tk.Frame(popup, bg="#e74c3c", height=60)
@@ -948,23 +1710,21 @@ AI Assistant:
             fg="#ecf0f1",
         ).pack(anchor="w", pady=(0, 5))
 
-        port_label = tk.Label(
+        self._err_port_lbl = tk.Label(
             content_frame,
-            text=f"Port: {port}",
             font=("Segoe UI", 11),
             bg="#2c3e50",
             fg="#bdc3c7",
         )
-        port_label.pack(anchor="w", pady=2)
+        self._err_port_lbl.pack(anchor="w", pady=2)
 
-        baud_label = tk.Label(
+        self._err_baud_lbl = tk.Label(
             content_frame,
-            text=f"Baud Rate: {self.settings.get('baud_rate', 9600)}",
             font=("Segoe UI", 11),
             bg="#2c3e50",
             fg="#bdc3c7",
         )
-        baud_label.pack(anchor="w", pady=2)
+        self._err_baud_lbl.pack(anchor="w", pady=2)
 
         # Error message
         error_frame = tk.Frame(content_frame, bg="#34495e", relief="solid", bd=1)
@@ -978,7 +1738,7 @@ AI Assistant:
             fg="#ecf0f1",
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
-        error_text = tk.Text(
+        self._err_text = tk.Text(
             error_frame,
             height=4,
             wrap="word",
@@ -988,9 +1748,7 @@ AI Assistant:
             relief="flat",
             bd=0,
         )
-        error_text.pack(fill=X, padx=10, pady=(0, 10))
-        error_text.insert("1.0", error_msg)
-        error_text.config(state="disabled")
+        self._err_text.pack(fill=X, padx=10, pady=(0, 10))
 
         # Troubleshooting tips
         tk.Label(
@@ -1024,10 +1782,10 @@ AI Assistant:
 
         def refresh_ports_and_close():
             self.refresh_ports()
-            popup.destroy()
+            self._hide_connection_error_popup()
 
         def open_settings_and_close():
-            popup.destroy()
+            self._hide_connection_error_popup()
             self.show_settings()
 
         refresh_btn = tk.Button(
@@ -1061,7 +1819,7 @@ AI Assistant:
         close_btn = tk.Button(
             button_frame,
             text="Close",
-            command=popup.destroy,
+            command=self._hide_connection_error_popup,
             bg="#e74c3c",
             fg="white",
             font=("Segoe UI", 10, "bold"),
@@ -1072,35 +1830,28 @@ AI Assistant:
         )
         close_btn.pack(side=RIGHT, padx=5)
 
-        # Hover effects
+        # Hover effects: widget -> (normal bg, hover bg)
+        hover_colors = {
+            refresh_btn: ("#3498db", "#2980b9"),
+            settings_btn: ("#95a5a6", "#7f8c8d"),
+            close_btn: ("#e74c3c", "#c0392b"),
+        }
+
         def on_enter(e):
-            e.widget.configure(
-                bg="#2980b9"
-                if e.widget == refresh_btn
-                else "#7f8c8d"
-                if e.widget == settings_btn
-                else "#c0392b"
-            )
+            e.widget.configure(bg=hover_colors[e.widget][1])
 
         def on_leave(e):
-            e.widget.configure(
-                bg="#3498db"
-                if e.widget == refresh_btn
-                else "#95a5a6"
-                if e.widget == settings_btn
-                else "#e74c3c"
-            )
+            e.widget.configure(bg=hover_colors[e.widget][0])
 
-        for btn in [refresh_btn, settings_btn, close_btn]:
+        for btn in hover_colors:
             btn.bind("<Enter>", on_enter)
             btn.bind("<Leave>", on_leave)
 
-        # Focus and center
-        popup.focus_set()
-        popup.wait_window()
+        self._err_popup = popup
 
     def disconnect_serial(self):
         self.is_connected = False
+        self._stop.set()
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
         self.status_lbl.config(text="Disconnected", bootstyle="warning")
@@ -1141,184 +1892,269 @@ AI Assistant:
         Continuously read data from the serial port in a background thread.
         """
         no_data_counter = 0
-        while self.is_connected:
+        self._rx_buf = bytearray()
+        while not self._stop.is_set():
             try:
-                line = (
-                    self.serial_conn.readline()
-                    .decode("utf-8", errors="replace")
-                    .strip()
-                )
-                if not line:
-                    no_data_counter += 1
-                    if no_data_counter == 10:
-                        print("[WARNING] No serial data received after 10 reads.")
-                        self.show_notification(
-                            "No serial data received! Check Arduino.", style="warning"
-                        )
-                    continue
-                no_data_counter = 0
-                self.log_serial_debug(line)
-                print(f"[SERIAL] {line}")
-
-                # AS7341 multi-line aggregator
-                if self._try_parse_as7341(line):
-                    continue
-
-                # CSV-like sensor line (e.g., 'MPU6050,3.2,1.0')
-                if self._parse_csv_sensor_line(line):
-                    continue
-
-                # Template-first parsing for selected sensors
-                parsed_any = False
-                for sensor in list(self.active_sensors):
-                    rx = sensor.get("_compiled")
-                    if not rx:
-                        continue
-                    m = rx.match(line)
-                    if not m:
-                        continue
-                    data = m.groupdict()
-                    self._ingest_template_sensor(sensor, data)
-                    parsed_any = True
-                    break
-                if parsed_any:
-                    continue
-
-                # Legacy formats fallback (DHT/IMU)
-                # ... existing legacy parsing remains unchanged ...
-                if line.startswith("YAW"):
-                    try:
-                        parts = line.replace(",", " ").split()
-                        self.yaw = float(
-                            [p for p in parts if p.startswith("YAW")][0].split(":")[1]
-                        )
-                        self.pitch = float(
-                            [p for p in parts if p.startswith("PITCH")][0].split(":")[1]
-                        )
-                        self.roll = float(
-                            [p for p in parts if p.startswith("ROLL")][0].split(":")[1]
-                        )
-                        temp_f = float(
-                            [p for p in parts if p.startswith("TEMP")][0].split(":")[1]
-                        )
-                        hum = float(
-                            [p for p in parts if p.startswith("HUM")][0].split(":")[1]
-                        )
-                        # Convert Fahrenheit to Celsius
-                        temp_c = (temp_f - 32) * 5 / 9
-                        self.append_dht_data(temp_c, hum)
-                        self.log_data(
-                            "3D Orientation", (self.yaw, self.pitch, self.roll)
-                        )
-                        self.update_3d_orientation()
-                        self.update_all_meters()  # Update meters with new data
-                        print(
-                            f"[PARSED] YAW:{self.yaw}, PITCH:{self.pitch}, ROLL:{self.roll}, TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{hum}"
-                        )
-                        self.show_notification("Data received", style="success")
-                        self.status_lbl.config(
-                            text="Data received", bootstyle="success"
-                        )
-                        self.after(
-                            1000,
-                            lambda: self.status_lbl.config(
-                                text="Connected", bootstyle="success"
-                            ),
-                        )
-                    except Exception as e:
-                        print(f"[ERROR] YAW parse error: {e}")
-                        self.show_notification(f"YAW parse error: {e}", style="danger")
-                elif line.startswith("TEMP") or line.startswith("DHT"):
-                    # Example: TEMP:23.5 HUM:45.2 or DHT:23.5 HUM:45.2
-                    try:
-                        parts = line.replace(",", " ").split()
-                        temp_f = float(
-                            [
-                                p
-                                for p in parts
-                                if p.startswith("TEMP") or p.startswith("DHT")
-                            ][0].split(":")[1]
-                        )
-                        hum = float(
-                            [p for p in parts if p.startswith("HUM")][0].split(":")[1]
-                        )
-                        # Convert Fahrenheit to Celsius
-                        temp_c = (temp_f - 32) * 5 / 9
-                        self.append_dht_data(temp_c, hum)
-                        self.log_data("DHT Sensor", (temp_c, hum))
-                        print(f"[PARSED] TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{hum}")
-                        self.show_notification("DHT data received", style="success")
-                    except Exception as e:
-                        print(f"[ERROR] DHT parse error: {e}")
-                        self.show_notification(f"DHT parse error: {e}", style="danger")
-                elif line:
-                    # Try to parse generic key:value pairs
-                    try:
-                        data = dict()
-                        for part in line.replace(",", " ").split():
-                            if ":" in part:
-                                k, v = part.split(":", 1)
-                                data[k.strip().upper()] = float(v.strip())
-
-                        # Check for MPU6050 data (common formats)
-                        if "YAW" in data and "PITCH" in data and "ROLL" in data:
-                            self.yaw = data["YAW"]
-                            self.pitch = data["PITCH"]
-                            self.roll = data["ROLL"]
-                            self.log_data(
-                                "3D Orientation", (self.yaw, self.pitch, self.roll)
-                            )
-                            self.update_3d_orientation()
-                            self.update_all_meters()  # Update meters with new data
-                            print(
-                                f"[PARSED] MPU6050 - YAW:{self.yaw}, PITCH:{self.pitch}, ROLL:{self.roll}"
-                            )
-                            self.show_notification(
-                                "MPU6050 data received", style="success"
-                            )
-                        elif "TEMP" in data and "HUM" in data:
-                            # Convert Fahrenheit to Celsius
-                            temp_f = data["TEMP"]
-                            temp_c = (temp_f - 32) * 5 / 9
-                            self.append_dht_data(temp_c, data["HUM"])
-                            self.log_data("DHT Sensor", (temp_c, data["HUM"]))
-                            print(
-                                f"[PARSED] DHT - TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{data['HUM']}"
-                            )
-                            self.show_notification(
-                                "DHT data received (generic)", style="success"
-                            )
-                        elif "TEMP" in data:
-                            # If only temperature is available, convert and use it
-                            temp_f = data["TEMP"]
-                            temp_c = (temp_f - 32) * 5 / 9
-                            self.append_dht_data(temp_c, 0)  # Set humidity to 0
-                            self.log_data("Temperature", (temp_c,))
-                            print(f"[PARSED] TEMP only: {temp_f}°F->{temp_c:.1f}°C")
-                            self.show_notification(
-                                "Temperature data received", style="success"
-                            )
-                        elif "HUM" in data:
-                            # If only humidity is available, use it
-                            self.append_dht_data(0, data["HUM"])  # Set temperature to 0
-                            self.log_data("Humidity", (data["HUM"],))
-                            print(f"[PARSED] HUM only: {data['HUM']}")
-                            self.show_notification(
-                                "Humidity data received", style="success"
-                            )
-                        else:
-                            print(f"[WARNING] Unrecognized data format: {line}")
-                            self.show_notification(
-                                f"Unrecognized data: {line}", style="warning"
-                            )
-                    except Exception as e:
-                        print(f"[ERROR] Parse error: {e}")
-                        self.show_notification(f"Parse error: {e}", style="danger")
-                # Add more formats as needed
+                lines = self._read_serial_lines()
             except Exception as e:
                 self.log_serial_debug(f"Error: {e}")
                 print(f"[SERIAL ERROR] {e}")
+                # Port gone or closed under us: back off instead of spinning
+                self._stop.wait(0.1)
                 continue
+            if lines is None:
+                no_data_counter += 1
+                if no_data_counter == 10:
+                    print("[WARNING] No serial data received after 10 reads.")
+                    self._ingest_q.put(
+                        (
+                            self.show_notification,
+                            "No serial data received! Check Arduino.",
+                            "warning",
+                        )
+                    )
+                continue
+            no_data_counter = 0
+            for line in lines:
+                try:
+                    self._handle_serial_line(line)
+                except Exception as e:
+                    self.log_serial_debug(f"Error: {e}")
+                    print(f"[SERIAL ERROR] {e}")
+
+    def _read_serial_lines(self):
+        """
+        Read everything buffered on the port in one call and split it into lines.
+        Blocks for up to the port timeout when nothing is waiting and returns
+        None if that timeout passes with no bytes; a partial trailing line is
+        kept in self._rx_buf until the rest arrives.
+        """
+        chunk = self.serial_conn.read(max(self.serial_conn.in_waiting, 1))
+        if not chunk:
+            return None
+        self._rx_buf += chunk
+        if b"\n" not in chunk:
+            return []
+        *complete, rest = self._rx_buf.split(b"\n")
+        self._rx_buf = bytearray(rest)
+        lines = []
+        for raw in complete:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                lines.append(line)
+        return lines
+
+    def _handle_serial_line(self, line):
+        """
+        Parse and dispatch a single decoded line received from the serial port.
+        """
+        self.log_serial_debug(line)
+        print(f"[SERIAL] {line}")
+
+        # AS7341 multi-line aggregator
+        if self._try_parse_as7341(line):
+            return
+
+        # CSV-like sensor line (e.g., 'MPU6050,3.2,1.0')
+        if self._parse_csv_sensor_line(line):
+            return
+
+        # Template-first parsing for selected sensors
+        sensor = self._match_template_sensor(line)
+        if sensor is not None:
+            m = sensor["_compiled"].match(line)
+            self._ingest_q.put((self._ingest_template_sensor, sensor, m.groupdict()))
+            return
+
+        # Legacy formats fallback (DHT/IMU)
+        # ... existing legacy parsing remains unchanged ...
+        if line.startswith("YAW"):
+            try:
+                # Reversed so the first token for a key wins
+                fields = dict(reversed(_LEGACY_FIELD_RX.findall(line)))
+                ypr = (
+                    float(fields["YAW"]),
+                    float(fields["PITCH"]),
+                    float(fields["ROLL"]),
+                )
+                temp_f = float(fields["TEMP"])
+                hum = float(fields["HUM"])
+                # Convert Fahrenheit to Celsius
+                temp_c = (temp_f - 32) * 5 / 9
+                # Plots and widgets are updated on the UI thread
+                self._ingest_q.put((self._ingest_orientation, ypr, temp_c, hum))
+                print(
+                    f"[PARSED] YAW:{ypr[0]}, PITCH:{ypr[1]}, ROLL:{ypr[2]}, TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{hum}"
+                )
+            except Exception as e:
+                print(f"[ERROR] YAW parse error: {e}")
+                self._ingest_q.put(
+                    (self.show_notification, f"YAW parse error: {e}", "danger")
+                )
+        elif line.startswith("TEMP") or line.startswith("DHT"):
+            # Example: TEMP:23.5 HUM:45.2 or DHT:23.5 HUM:45.2
+            try:
+                parts = line.replace(",", " ").split()
+                temp_f = float(
+                    [p for p in parts if p.startswith("TEMP") or p.startswith("DHT")][
+                        0
+                    ].split(":")[1]
+                )
+                hum = float([p for p in parts if p.startswith("HUM")][0].split(":")[1])
+                # Convert Fahrenheit to Celsius
+                temp_c = (temp_f - 32) * 5 / 9
+                self._ingest_q.put((self._ingest_dht, temp_c, hum))
+                print(f"[PARSED] TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{hum}")
+            except Exception as e:
+                print(f"[ERROR] DHT parse error: {e}")
+                self._ingest_q.put(
+                    (self.show_notification, f"DHT parse error: {e}", "danger")
+                )
+        elif line:
+            # Try to parse generic key:value pairs
+            try:
+                data = dict()
+                for part in line.replace(",", " ").split():
+                    if ":" in part:
+                        k, v = part.split(":", 1)
+                        data[k.strip().upper()] = float(v.strip())
+
+                # Check for MPU6050 data (common formats)
+                if "YAW" in data and "PITCH" in data and "ROLL" in data:
+                    ypr = (data["YAW"], data["PITCH"], data["ROLL"])
+                    self._ingest_q.put((self._ingest_imu, ypr))
+                    print(
+                        f"[PARSED] MPU6050 - YAW:{ypr[0]}, PITCH:{ypr[1]}, ROLL:{ypr[2]}"
+                    )
+                elif "TEMP" in data and "HUM" in data:
+                    # Convert Fahrenheit to Celsius
+                    temp_f = data["TEMP"]
+                    temp_c = (temp_f - 32) * 5 / 9
+                    self._ingest_q.put(
+                        (
+                            self._ingest_dht,
+                            temp_c,
+                            data["HUM"],
+                            "DHT data received (generic)",
+                        )
+                    )
+                    print(
+                        f"[PARSED] DHT - TEMP:{temp_f}°F->{temp_c:.1f}°C, HUM:{data['HUM']}"
+                    )
+                elif "TEMP" in data:
+                    # If only temperature is available, convert and use it
+                    temp_f = data["TEMP"]
+                    temp_c = (temp_f - 32) * 5 / 9
+                    self._ingest_q.put((self._ingest_temperature, temp_c))
+                    print(f"[PARSED] TEMP only: {temp_f}°F->{temp_c:.1f}°C")
+                elif "HUM" in data:
+                    # If only humidity is available, use it
+                    self._ingest_q.put((self._ingest_humidity, data["HUM"]))
+                    print(f"[PARSED] HUM only: {data['HUM']}")
+                else:
+                    print(f"[WARNING] Unrecognized data format: {line}")
+                    self._ingest_q.put(
+                        (
+                            self.show_notification,
+                            f"Unrecognized data: {line}",
+                            "warning",
+                        )
+                    )
+            except Exception as e:
+                print(f"[ERROR] Parse error: {e}")
+                self._ingest_q.put(
+                    (self.show_notification, f"Parse error: {e}", "danger")
+                )
+        # Add more formats as needed
+
+    def _sensor_for_type(self, sensor_type):
+        """
+        First active sensor of the upper-cased `sensor_type`, or None. "MPU6050"
+        also matches an ITG/MPU6050, as CSV lines only carry the short name.
+        """
+        # Read once: the serial thread calls this while the UI thread may reset it
+        index = self._sensor_by_type
+        if index is None:
+            index = {}
+            for s in self.active_sensors:
+                t = s.get("type", "").upper()
+                index.setdefault(t, s)
+                if t == "ITG/MPU6050":
+                    index.setdefault("MPU6050", s)
+            self._sensor_by_type = index
+        return index.get(sensor_type)
+
+    def _ingest_orientation(self, ypr, temp_c, hum):
+        """UI-thread half of a legacy YAW/PITCH/ROLL/TEMP/HUM line."""
+        self.yaw, self.pitch, self.roll = ypr
+        self.append_dht_data(temp_c, hum)
+        self.log_data("3D Orientation", ypr)
+        self.update_3d_orientation()
+        self.update_all_meters()  # Update meters with new data
+        self.show_notification("Data received", style="success")
+        self.status_lbl.config(text="Data received", bootstyle="success")
+        self.after(
+            1000, lambda: self.status_lbl.config(text="Connected", bootstyle="success")
+        )
+
+    def _ingest_dht(self, temp_c, hum, notice="DHT data received"):
+        """UI-thread half of a legacy TEMP/DHT + HUM line."""
+        self.append_dht_data(temp_c, hum)
+        self.log_data("DHT Sensor", (temp_c, hum))
+        self.show_notification(notice, style="success")
+
+    def _ingest_imu(self, ypr):
+        """UI-thread half of a key:value YAW/PITCH/ROLL line."""
+        self.yaw, self.pitch, self.roll = ypr
+        self.log_data("3D Orientation", ypr)
+        self.update_3d_orientation()
+        self.update_all_meters()  # Update meters with new data
+        self.show_notification("MPU6050 data received", style="success")
+
+    def _ingest_temperature(self, temp_c):
+        """UI-thread half of a key:value line with only TEMP."""
+        self.append_dht_data(temp_c, 0)  # Set humidity to 0
+        self.log_data("Temperature", (temp_c,))
+        self.show_notification("Temperature data received", style="success")
+
+    def _ingest_humidity(self, hum):
+        """UI-thread half of a key:value line with only HUM."""
+        self.append_dht_data(0, hum)  # Set temperature to 0
+        self.log_data("Humidity", (hum,))
+        self.show_notification("Humidity data received", style="success")
+
+    def _match_template_sensor(self, line):
+        """
+        Return the first active sensor whose template regex matches the line, or None.
+        All template patterns are combined into one alternation so a line that
+        matches no sensor costs a single regex scan instead of one per sensor.
+        """
+        # Read once: the UI thread may reset it while the serial thread matches
+        template_rx = self._template_rx
+        if template_rx is None:
+            sensors = [s for s in self.active_sensors if s.get("_compiled")]
+            # Inner named groups would clash between templates (TEMP, HUM, ...);
+            # only the outer s<i> group is needed to tell which sensor matched
+            alternatives = [
+                f"(?P<s{i}>{_NAMED_GROUP_RX.sub('(?:', s['_compiled'].pattern)})"
+                for i, s in enumerate(sensors)
+            ]
+            try:
+                combined = re.compile("|".join(alternatives)) if alternatives else None
+            except re.error:
+                combined = None
+            template_rx = self._template_rx = (combined, sensors)
+        combined, sensors = template_rx
+        if combined is None:
+            # No templates, or patterns that cannot be merged: match one by one
+            for sensor in sensors:
+                if sensor["_compiled"].match(line):
+                    return sensor
+            return None
+        m = combined.match(line)
+        if not m:
+            return None
+        return sensors[int(m.lastgroup[1:])]
 
     def append_dht_data(self, temp, hum):
         """
@@ -1328,17 +2164,24 @@ AI Assistant:
         self.time_data.append(t)
         self.temp_data.append(temp)
         self.hum_data.append(hum)
-        # Keep only the last 100 points for plotting
-        self.time_data = self.time_data[-100:]
-        self.temp_data = self.temp_data[-100:]
-        self.hum_data = self.hum_data[-100:]
+        # Smooth only the new sample rather than re-rolling the whole history
+        self._temp_win.append(temp)
+        self._hum_win.append(hum)
+        self.temp_smooth.append(sum(self._temp_win) / len(self._temp_win))
+        self.hum_smooth.append(sum(self._hum_win) / len(self._hum_win))
         self.update_dht_plot()
         self.update_all_meters()  # Update meters with new data
 
     def update_dht_plot(self):
+        # The plot lives on the sensors tab; show_tab(1) catches it up
+        if self.current_tab != 1:
+            return
         # Redraw the DHT plot if it exists
-        if hasattr(self, "fig") and hasattr(self, "ax1"):
+        if self.fig is not None and self.ax1 is not None:
+            if self._update_dht_lines():
+                return
             self.ax1.clear()
+            self._dht_fig_key = None  # no longer the figure build_dht_plot made
             if self.is_connected and self.time_data:
                 self.ax1.plot(
                     self.time_data, self.temp_data, color="#304674", label="Temp"
@@ -1352,14 +2195,133 @@ AI Assistant:
             else:
                 self.ax1.set_title("No data")
             self.ax1.grid(True)
-            if hasattr(self, "canvas"):
-                self.canvas.draw()
+            if self.canvas is not None:
+                self.canvas.draw_idle()
+
+    def _update_dht_lines(self):
+        """
+        Push new samples into the existing DHT lines and blit them. Returns
+        False when the plot was built without lines and needs a full redraw.
+        """
+        lines = [
+            (line, data)
+            for line, data in zip(
+                (self._temp_line, self._hum_line), self._dht_smoothed()
+            )
+            if line is not None and line.axes is self.ax1
+        ]
+        if not lines or not self.is_connected or not self.time_data:
+            return False
+        for line, data in lines:
+            line.set_data(self.time_data, data)
+        # Blitting only repaints the lines; rescale (a full draw) only when
+        # the data leaves the current view
+        t = self.time_data
+        x0, x1 = self.ax1.get_xlim()
+        rescale = t[0] < x0 or t[-1] > x1
+        if rescale:
+            span = max(t[-1] - t[0], 1.0)
+            self.ax1.set_xlim(t[0], t[-1] + 0.25 * span)
+        if self.ax1.get_autoscaley_on():
+            y0, y1 = self.ax1.get_ylim()
+            lo = min(min(d) for _, d in lines)
+            hi = max(max(d) for _, d in lines)
+            if lo < y0 or hi > y1:
+                self.ax1.relim()
+                self.ax1.autoscale_view(scalex=False)
+                rescale = True
+        if rescale:
+            self.canvas.draw_idle()
+        else:
+            self._blit_update("dht")
+        return True
+
+    def _dht_smoothed(self):
+        """Temperature and humidity series as plotted (DHT_SMOOTH_WINDOW mean)."""
+        if len(self.time_data) > 10:
+            return self.temp_smooth, self.hum_smooth
+        return self.temp_data, self.hum_data
+
+    def _enable_blit(self, key, canvas, ax, artists):
+        """
+        Render `artists` separately from the rest of `ax` so data updates can
+        restore a cached background and repaint just those artists.
+        """
+        old = self._blit.get(key)
+        if old is not None:
+            # The figure may be reattached to a new canvas; drop old hooks
+            for cid in old["cids"]:
+                old["canvas"].mpl_disconnect(cid)
+        for a in artists:
+            a.set_animated(True)
+        state = {
+            "canvas": canvas,
+            "ax": ax,
+            "artists": artists,
+            "bg": None,
+            "last": 0.0,  # time.monotonic() of the last paint
+            "pending": False,  # a deferred paint is scheduled
+        }
+        self._blit[key] = state
+
+        def on_draw(event):
+            # Every full draw (first show, resize, theme, rescale) refreshes
+            # the background; animated artists are skipped by it, so add them
+            state["bg"] = canvas.copy_from_bbox(ax.bbox)
+            for a in artists:
+                ax.draw_artist(a)
+
+        def on_resize(event):
+            state["bg"] = None
+
+        state["cids"] = (
+            canvas.mpl_connect("draw_event", on_draw),
+            canvas.mpl_connect("resize_event", on_resize),
+        )
+
+    def _blit_update(self, key):
+        state = self._blit.get(key)
+        if state is None:
+            return
+        # Sensors can outpace the display; paint at most MAX_REDRAW_HZ and
+        # fold anything faster into one deferred paint of the newest data
+        now = time.monotonic()
+        wait = state["last"] + 1.0 / MAX_REDRAW_HZ - now
+        if wait > 0:
+            if not state["pending"]:
+                state["pending"] = True
+                self.after(int(wait * 1000) + 1, self._flush_blit, key)
+            return
+        state["last"] = now
+        canvas, ax = state["canvas"], state["ax"]
+        if state["bg"] is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(state["bg"])
+        for a in state["artists"]:
+            ax.draw_artist(a)
+        canvas.blit(ax.bbox)
+
+    def _flush_blit(self, key):
+        state = self._blit.get(key)
+        # Skip if the plot was rebuilt or its widget destroyed meanwhile
+        if state is None or not state["pending"]:
+            return
+        state["pending"] = False
+        if state["canvas"].get_tk_widget().winfo_exists():
+            self._blit_update(key)
 
     def update_all_meters(self):
         """Update lightweight UI (quick stats) without rebuilding full views to avoid flashing."""
+        # Quick stats live on the dashboard, which is rebuilt when shown again
+        if self.current_tab != 0:
+            return
         try:
             if hasattr(self, "quick_stats"):
-                self.quick_stats.config(text=self.get_quick_stats())
+                text = self.get_quick_stats()
+                if text != self._last_quick_stats:
+                    self._last_quick_stats = text
+                    self.quick_stats.config(text=text)
         except Exception:
             pass
 
@@ -1422,7 +2384,7 @@ AI Assistant:
         tb.Button(
             header_row,
             text="Configure",
-            command=lambda s=sensor: self.configure_sensor(s),
+            command=functools.partial(self.configure_sensor, sensor),
             bootstyle="primary-outline",
         ).pack(side=RIGHT)
         tb.Button(
@@ -1435,145 +2397,75 @@ AI Assistant:
         s_type = sensor.get("type", "").upper()
         s_name = sensor.get("name", s_type)
         if s_type in ("DHT", "DHT11", "DHT22"):
-            temp_val = self.temp_data[-1] if self.temp_data else 0
-            hum_val = self.hum_data[-1] if self.hum_data else 0
+            temp_val = self._last("temp_data")
+            hum_val = self._last("hum_data")
             meter_row = tb.Frame(shadow_frame)
             meter_row.pack(pady=10, padx=15)
             tb.Meter(
                 meter_row,
                 amountused=temp_val,
-                metertype="full",
                 subtext="Temp (°C)",
                 bootstyle="danger",
-                stripethickness=6,
-                interactive=False,
                 amounttotal=60,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
+                **CARD_METER_OPTIONS,
             ).pack(side=LEFT, padx=10)
             tb.Meter(
                 meter_row,
                 amountused=hum_val,
-                metertype="full",
                 subtext="Humidity (%)",
                 bootstyle="info",
-                stripethickness=6,
-                interactive=False,
                 amounttotal=100,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
+                **CARD_METER_OPTIONS,
             ).pack(side=LEFT, padx=10)
             self.build_dht_plot(parent=card, compact=True, sensor_name=sensor["name"])
-        elif s_type == "MPU6050":
-            meter_row = tb.Frame(shadow_frame)
-            meter_row.pack(pady=10, padx=15)
-            yaw_m = tb.Meter(
-                meter_row,
-                amountused=self.yaw,
-                metertype="full",
-                subtext="Yaw (°)",
-                bootstyle="primary",
-                stripethickness=6,
-                interactive=False,
-                amounttotal=180,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
-            )
-            yaw_m.pack(side=LEFT, padx=10)
-            pitch_m = tb.Meter(
-                meter_row,
-                amountused=self.pitch,
-                metertype="full",
-                subtext="Pitch (°)",
-                bootstyle="warning",
-                stripethickness=6,
-                interactive=False,
-                amounttotal=90,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
-            )
-            pitch_m.pack(side=LEFT, padx=10)
-            roll_m = tb.Meter(
-                meter_row,
-                amountused=self.roll,
-                metertype="full",
-                subtext="Roll (°)",
-                bootstyle="success",
-                stripethickness=6,
-                interactive=False,
-                amounttotal=180,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
-            )
-            roll_m.pack(side=LEFT, padx=10)
-            self.imu_widgets[s_name] = {"yaw": yaw_m, "pitch": pitch_m, "roll": roll_m}
-            self.build_3d_plot(parent=card, compact=True)
-        elif s_type == "ITG/MPU6050":
+        elif s_type in ("MPU6050", "ITG/MPU6050"):
             meter_row = tb.Frame(shadow_frame)
             meter_row.pack(pady=10, padx=15)
             yaw_m = tb.Meter(
                 meter_row,
                 amountused=self.yaw,
-                metertype="full",
                 subtext="Yaw (°)",
                 bootstyle="primary",
-                stripethickness=6,
-                interactive=False,
                 amounttotal=180,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
+                **CARD_METER_OPTIONS,
             )
             yaw_m.pack(side=LEFT, padx=10)
             pitch_m = tb.Meter(
                 meter_row,
                 amountused=self.pitch,
-                metertype="full",
                 subtext="Pitch (°)",
                 bootstyle="warning",
-                stripethickness=6,
-                interactive=False,
                 amounttotal=90,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
+                **CARD_METER_OPTIONS,
             )
             pitch_m.pack(side=LEFT, padx=10)
             roll_m = tb.Meter(
                 meter_row,
                 amountused=self.roll,
-                metertype="full",
                 subtext="Roll (°)",
                 bootstyle="success",
-                stripethickness=6,
-                interactive=False,
                 amounttotal=180,
-                textfont=("Segoe UI", 10, "bold"),
-                subtextfont=("Segoe UI", 9),
-                metersize=90,
+                **CARD_METER_OPTIONS,
             )
             roll_m.pack(side=LEFT, padx=10)
             self.imu_widgets[s_name] = {"yaw": yaw_m, "pitch": pitch_m, "roll": roll_m}
             self.build_3d_plot(parent=card, compact=True)
         elif s_type in ("BMP280", "TDS", "SOIL", "LDR", "DS18B20", "UV"):
             # simple compact plot using generic_streams
-            stream = self.generic_streams.get(s_name, {})
-            if not stream:
+            stream = self.generic_streams.get(s_name)
+            if not stream or stream["idx"] == 0:
                 tb.Label(card, text="No data", font=("Segoe UI", 10, "italic")).pack(
                     pady=5
                 )
             else:
+                Figure, FigureCanvasTkAgg = _mpl_tk()
                 fig = Figure(figsize=(3.6, 2.0), dpi=100)
                 ax = fig.add_subplot(111)
-                t = stream.get("time", [])
-                for f in sensor.get("fields", []):
+                samples = self._stream_view(stream)
+                t = samples[:, 0]
+                for col, f in enumerate(stream["fields"], start=1):
                     ax.plot(
-                        t, stream.get(f, []), label=sensor.get("_labels", {}).get(f, f)
+                        t, samples[:, col], label=sensor.get("_labels", {}).get(f, f)
                     )
                 ax.set_xlabel("Time (s)")
                 ax.set_ylabel("Value")
@@ -1585,12 +2477,14 @@ AI Assistant:
         elif s_type == "AS7341":
             # Build bar chart for spectrometer
             state = self.as7341_state.setdefault(
-                s_name, {"baseline": {}, "smoothed": [0.0] * 10}
+                s_name, {"baseline": np.zeros(10), "smoothed": np.zeros(8)}
             )
+            Figure, FigureCanvasTkAgg = _mpl_tk()
             fig = Figure(figsize=(5, 2.4), dpi=100)
             ax = fig.add_subplot(111)
             wavelengths = ["415", "445", "480", "515", "555", "590", "630", "680"]
-            bars = ax.bar(wavelengths, [0] * 8, color="#20CFCF")
+            # Start from the last smoothed frame so a rebuilt card doesn't flash to zero
+            bars = ax.bar(wavelengths, state["smoothed"][:8], color="#20CFCF")
             ax.set_ylim(0, 1.2)
             ax.set_ylabel("Normalized Intensity")
             ax.set_xlabel("Wavelength (nm)")
@@ -1598,29 +2492,17 @@ AI Assistant:
             fig.tight_layout(pad=1.0)
             canvas = FigureCanvasTkAgg(fig, master=shadow_frame)
             canvas.get_tk_widget().pack(padx=15, pady=10)
-            state["bars"] = list(bars)
-            state["canvas"] = canvas
+            state["bars"] = bars  # BarContainer; heights are updated in place
+            self._enable_blit(f"as7341:{s_name}", canvas, ax, list(bars))
 
             # Controls
             def calibrate_dark():
                 # Use last seen raw values as baseline if available
                 buf = self._as7341_buf.get("data", {})
                 if buf:
-                    state["baseline"] = {
-                        k: float(buf.get(k, 0.0))
-                        for k in [
-                            "F1",
-                            "F2",
-                            "F3",
-                            "F4",
-                            "F5",
-                            "F6",
-                            "F7",
-                            "F8",
-                            "CLEAR",
-                            "NIR",
-                        ]
-                    }
+                    state["baseline"] = np.array(
+                        [buf.get(k, 0.0) for k in AS7341_CHANNELS], dtype=float
+                    )
 
             tb.Button(
                 shadow_frame,
@@ -1631,57 +2513,149 @@ AI Assistant:
         # else: future sensor types
 
     def build_dht_plot(self, parent=None, compact=False, sensor_name=None):
-        import matplotlib
-
-        matplotlib.rcParams.update(
-            {
-                "axes.titlesize": 14,
-                "axes.titleweight": "bold",
-                "axes.labelsize": 12,
-                "axes.labelweight": "bold",
-                "xtick.labelsize": 10,
-                "ytick.labelsize": 10,
-                "legend.fontsize": 10,
-                "legend.frameon": True,
-                "legend.loc": "upper right",
-                "axes.grid": True,
-                "grid.alpha": 0.3,
-                "axes.facecolor": "#f8f9fa",
-                "figure.facecolor": "#f8f9fa",
-                "axes.edgecolor": "#22262A",
-                "axes.linewidth": 1.2,
-            }
-        )
         # If called from Sensors page, parent is provided
         if parent is None:
             parent = self.tab_sensors
-        # Clear previous
-        for w in parent.winfo_children():
-            if hasattr(w, "is_sensor_graph"):
-                w.destroy()
-        card = tb.Frame(parent, bootstyle="light", borderwidth=1, relief="solid")
-        card.is_sensor_graph = True
-        card.pack(side=LEFT, padx=10, pady=10, fill=None, expand=False)
+        with self._batched_tk(parent):
+            # Clear previous
+            for w in parent.winfo_children():
+                if hasattr(w, "is_sensor_graph"):
+                    w.destroy()
+            card = tb.Frame(parent, bootstyle="light", borderwidth=1, relief="solid")
+            card.is_sensor_graph = True
+            card.pack(side=LEFT, padx=10, pady=10, fill=None, expand=False)
+            _, FigureCanvasTkAgg = _mpl_tk()
+            # Plot data: only two lines, red for temp, blue for humidity
+            show_temp = getattr(self, "_show_temp", True)
+            show_hum = getattr(self, "_show_hum", True)
+            temp_color = getattr(self, "_temp_color", "#d62728")  # Red
+            hum_color = getattr(self, "_hum_color", "#1f77b4")  # Blue
+            temp_ylim = getattr(self, "_temp_ylim", (0, 50))
+            hum_ylim = getattr(self, "_hum_ylim", (0, 100))
+            # Sensors-tab refreshes rebuild this card often; only re-create the
+            # figure when something it is drawn from changed, else reattach it
+            fig_key = (
+                compact,
+                sensor_name,
+                show_temp,
+                show_hum,
+                temp_color,
+                hum_color,
+                temp_ylim,
+                hum_ylim,
+                bool(self.is_connected and self.time_data),
+            )
+            reuse = fig_key == self._dht_fig_key
+            if not reuse:
+                self._new_dht_figure(
+                    compact,
+                    sensor_name,
+                    show_temp,
+                    show_hum,
+                    temp_color,
+                    hum_color,
+                    temp_ylim,
+                    hum_ylim,
+                )
+                self._dht_fig_key = fig_key
+            if self.canvas is not None:
+                self.canvas.get_tk_widget().destroy()
+            self.canvas = FigureCanvasTkAgg(self.fig, master=card)
+            self.canvas.get_tk_widget().pack(padx=10, pady=10)
+            self._enable_blit(
+                "dht",
+                self.canvas,
+                self.ax1,
+                [l for l in (self._temp_line, self._hum_line) if l is not None],
+            )
+            if reuse:
+                # Bring the reattached lines up to the latest samples
+                self._update_dht_lines()
+
+            # Add a Graph Settings button for customization
+            def open_graph_settings():
+                popup = tk.Toplevel(self)
+                popup.title("Graph Settings")
+                popup.geometry("320x260")
+                popup.resizable(False, False)
+                tb.Label(
+                    popup,
+                    text="Graph Settings",
+                    font=("Segoe UI", 13, "bold"),
+                    bootstyle="info",
+                ).pack(pady=10)
+                # Show/hide lines
+                temp_var = tk.BooleanVar(value=show_temp)
+                hum_var = tk.BooleanVar(value=show_hum)
+                tb.Checkbutton(
+                    popup, text="Show Temperature (Red)", variable=temp_var
+                ).pack(anchor="w", padx=20)
+                tb.Checkbutton(
+                    popup, text="Show Humidity (Blue)", variable=hum_var
+                ).pack(anchor="w", padx=20)
+                # Axis limits
+                tb.Label(popup, text="Temperature Y-Axis (°C):").pack(
+                    anchor="w", padx=20, pady=(10, 0)
+                )
+                temp_min = tk.DoubleVar(value=temp_ylim[0])
+                temp_max = tk.DoubleVar(value=temp_ylim[1])
+                tb.Entry(popup, textvariable=temp_min, width=6).pack(
+                    side=LEFT, padx=(20, 2)
+                )
+                tb.Label(popup, text="to").pack(side=LEFT)
+                tb.Entry(popup, textvariable=temp_max, width=6).pack(
+                    side=LEFT, padx=(2, 0)
+                )
+                tb.Label(popup, text="").pack(side=LEFT, padx=10)
+                tb.Label(popup, text="Humidity Y-Axis (%):").pack(
+                    anchor="w", padx=20, pady=(10, 0)
+                )
+                hum_min = tk.DoubleVar(value=hum_ylim[0])
+                hum_max = tk.DoubleVar(value=hum_ylim[1])
+                tb.Entry(popup, textvariable=hum_min, width=6).pack(
+                    side=LEFT, padx=(20, 2)
+                )
+                tb.Label(popup, text="to").pack(side=LEFT)
+                tb.Entry(popup, textvariable=hum_max, width=6).pack(
+                    side=LEFT, padx=(2, 0)
+                )
+
+                def save_settings():
+                    self._show_temp = temp_var.get()
+                    self._show_hum = hum_var.get()
+                    self._temp_ylim = (temp_min.get(), temp_max.get())
+                    self._hum_ylim = (hum_min.get(), hum_max.get())
+                    popup.destroy()
+                    self.build_sensors_tab()
+
+                tb.Button(
+                    popup, text="Save", command=save_settings, bootstyle="success"
+                ).pack(pady=20)
+
+            tb.Button(
+                card,
+                text="Graph Settings",
+                command=open_graph_settings,
+                bootstyle="info-outline",
+            ).pack(pady=(0, 10))
+
+    def _new_dht_figure(
+        self,
+        compact,
+        sensor_name,
+        show_temp,
+        show_hum,
+        temp_color,
+        hum_color,
+        temp_ylim,
+        hum_ylim,
+    ):
+        Figure, _ = _mpl_tk()
         self.fig = Figure(figsize=(4, 2.5) if compact else (6, 4), dpi=100)
         self.ax1 = self.fig.add_subplot(111)
-        # Plot data: only two lines, red for temp, blue for humidity
-        show_temp = getattr(self, "_show_temp", True)
-        show_hum = getattr(self, "_show_hum", True)
-        temp_color = getattr(self, "_temp_color", "#d62728")  # Red
-        hum_color = getattr(self, "_hum_color", "#1f77b4")  # Blue
-        temp_ylim = getattr(self, "_temp_ylim", (0, 50))
-        hum_ylim = getattr(self, "_hum_ylim", (0, 100))
+        self._temp_line = self._hum_line = None
         if self.is_connected and self.time_data:
-            import pandas as pd
-
-            temp_series = pd.Series(self.temp_data)
-            hum_series = pd.Series(self.hum_data)
-            if len(self.time_data) > 10:
-                temp_smooth = temp_series.rolling(window=5, min_periods=1).mean()
-                hum_smooth = hum_series.rolling(window=5, min_periods=1).mean()
-            else:
-                temp_smooth = temp_series
-                hum_smooth = hum_series
+            temp_smooth, hum_smooth = self._dht_smoothed()
             lines = []
             labels = []
             if show_temp:
@@ -1696,6 +2670,7 @@ AI Assistant:
                 )
                 lines.append(l1)
                 labels.append("Temperature (°C)")
+                self._temp_line = l1
             if show_hum:
                 (l2,) = self.ax1.plot(
                     self.time_data,
@@ -1708,6 +2683,7 @@ AI Assistant:
                 )
                 lines.append(l2)
                 labels.append("Humidity (%)")
+                self._hum_line = l2
             self.ax1.set_xlabel("Time (s)", fontweight="bold")
             # Set y-axis limits and label
             if show_temp and not show_hum:
@@ -1739,71 +2715,6 @@ AI Assistant:
         for spine in self.ax1.spines.values():
             spine.set_edgecolor("#22262A")
             spine.set_linewidth(1.2)
-        if hasattr(self, "canvas"):
-            self.canvas.get_tk_widget().destroy()
-        self.canvas = FigureCanvasTkAgg(self.fig, master=card)
-        self.canvas.get_tk_widget().pack(padx=10, pady=10)
-
-        # Add a Graph Settings button for customization
-        def open_graph_settings():
-            popup = tk.Toplevel(self)
-            popup.title("Graph Settings")
-            popup.geometry("320x260")
-            popup.resizable(False, False)
-            tb.Label(
-                popup,
-                text="Graph Settings",
-                font=("Segoe UI", 13, "bold"),
-                bootstyle="info",
-            ).pack(pady=10)
-            # Show/hide lines
-            temp_var = tk.BooleanVar(value=show_temp)
-            hum_var = tk.BooleanVar(value=show_hum)
-            tb.Checkbutton(
-                popup, text="Show Temperature (Red)", variable=temp_var
-            ).pack(anchor="w", padx=20)
-            tb.Checkbutton(popup, text="Show Humidity (Blue)", variable=hum_var).pack(
-                anchor="w", padx=20
-            )
-            # Axis limits
-            tb.Label(popup, text="Temperature Y-Axis (°C):").pack(
-                anchor="w", padx=20, pady=(10, 0)
-            )
-            temp_min = tk.DoubleVar(value=temp_ylim[0])
-            temp_max = tk.DoubleVar(value=temp_ylim[1])
-            tb.Entry(popup, textvariable=temp_min, width=6).pack(
-                side=LEFT, padx=(20, 2)
-            )
-            tb.Label(popup, text="to").pack(side=LEFT)
-            tb.Entry(popup, textvariable=temp_max, width=6).pack(side=LEFT, padx=(2, 0))
-            tb.Label(popup, text="").pack(side=LEFT, padx=10)
-            tb.Label(popup, text="Humidity Y-Axis (%):").pack(
-                anchor="w", padx=20, pady=(10, 0)
-            )
-            hum_min = tk.DoubleVar(value=hum_ylim[0])
-            hum_max = tk.DoubleVar(value=hum_ylim[1])
-            tb.Entry(popup, textvariable=hum_min, width=6).pack(side=LEFT, padx=(20, 2))
-            tb.Label(popup, text="to").pack(side=LEFT)
-            tb.Entry(popup, textvariable=hum_max, width=6).pack(side=LEFT, padx=(2, 0))
-
-            def save_settings():
-                self._show_temp = temp_var.get()
-                self._show_hum = hum_var.get()
-                self._temp_ylim = (temp_min.get(), temp_max.get())
-                self._hum_ylim = (hum_min.get(), hum_max.get())
-                popup.destroy()
-                self.build_sensors_tab()
-
-            tb.Button(
-                popup, text="Save", command=save_settings, bootstyle="success"
-            ).pack(pady=20)
-
-        tb.Button(
-            card,
-            text="Graph Settings",
-            command=open_graph_settings,
-            bootstyle="info-outline",
-        ).pack(pady=(0, 10))
 
     def build_3d_plot(self, parent=None, compact=False):
         if parent is None:
@@ -1814,6 +2725,7 @@ AI Assistant:
         card = tb.Frame(parent, bootstyle="light", borderwidth=1, relief="solid")
         card.is_sensor_graph = True
         card.pack(side=LEFT, padx=10, pady=10, fill=None, expand=False)
+        Figure, FigureCanvasTkAgg = _mpl_tk()
         fig3d = Figure(figsize=(3, 2) if compact else (5, 4), dpi=100)
         self.ax3d = fig3d.add_subplot(111, projection="3d")
         self.ax3d.set_xlim([-1, 1])
@@ -1821,47 +2733,70 @@ AI Assistant:
         self.ax3d.set_zlim([-1, 1])
         self.ax3d.set_title("3D Orientation")
         self.cube_data = self.make_cube()
-        self.plot_cube(*self.cube_data)
+        self._cube_artists = self._make_cube_artists(self.ax3d, self.cube_data)
         self.canvas3d = FigureCanvasTkAgg(fig3d, master=card)
-        self.canvas3d.draw()
+        self._enable_blit(
+            "cube",
+            self.canvas3d,
+            self.ax3d,
+            list(self._cube_artists),
+        )
+        self.canvas3d.draw_idle()
         self.canvas3d.get_tk_widget().pack()
 
     def make_cube(self, size=0.5):
         """
         Generate the coordinates for a cube of the given size.
         """
-        r = [-size, size]
-        x, y, z = np.meshgrid(r, r, r)
-        return np.array([x.flatten(), y.flatten(), z.flatten()])
+        # Same corner order as np.meshgrid(r, r, r) flattened: index bits
+        # (4, 2, 1) select y, x, z, which _CUBE_EDGES relies on
+        s = size
+        return np.array(
+            [
+                [-s, -s, s, s, -s, -s, s, s],
+                [-s, -s, -s, -s, s, s, s, s],
+                [-s, s, -s, s, -s, s, -s, s],
+            ],
+            dtype=float,
+        )
+
+    def _make_cube_artists(self, ax, cube, markersize=6, linewidth=None):
+        """
+        Create the vertex markers and edge lines for a cube once; later frames
+        only move them (plot_cube / plot_cube_data_tab).
+        """
+        x, y, z = cube
+        (points,) = ax.plot(
+            x, y, z, "o", color="skyblue", markersize=markersize, linestyle="none"
+        )
+        (edges,) = ax.plot(
+            *self._cube_edge_coords(x, y, z), color="blue", linewidth=linewidth
+        )
+        return points, edges
+
+    def _cube_edge_coords(self, x, y, z):
+        """x, y, z of all 12 edges joined by NaN breaks, for a single Line3D."""
+        xyz = np.empty((3, 9))
+        xyz[:, :8] = x, y, z
+        xyz[:, 8] = np.nan
+        return xyz[:, _CUBE_EDGE_PATH]
+
+    def _move_cube_artists(self, artists, x, y, z):
+        points, edges = artists
+        points.set_data_3d(x, y, z)
+        edges.set_data_3d(*self._cube_edge_coords(x, y, z))
 
     def plot_cube(self, x, y, z):
         """
         Plot a cube in the 3D orientation plot.
         """
-        self.ax3d.cla()
-        self.ax3d.set_xlim([-1, 1])
-        self.ax3d.set_ylim([-1, 1])
-        self.ax3d.set_zlim([-1, 1])
-        self.ax3d.set_title("3D Orientation")
-        self.ax3d.scatter(x, y, z, color="skyblue")
-        for i in range(8):
-            for j in range(i + 1, 8):
-                if (
-                    np.sum(
-                        np.abs(
-                            np.array([x[i], y[i], z[i]]) - np.array([x[j], y[j], z[j]])
-                        )
-                    )
-                    == 1.0
-                ):
-                    self.ax3d.plot(
-                        [x[i], x[j]], [y[i], y[j]], [z[i], z[j]], color="blue"
-                    )
+        self._move_cube_artists(self._cube_artists, x, y, z)
 
     def _create_3d_orientation_for_data_tab(self, parent):
         """Create 3D orientation plot specifically for the data management tab"""
         try:
             # Create figure for data tab
+            Figure, FigureCanvasTkAgg = _mpl_tk()
             fig3d = Figure(figsize=(6, 4), dpi=100)
             self.ax3d_data = fig3d.add_subplot(111, projection="3d")
             self.ax3d_data.set_xlim([-1, 1])
@@ -1869,13 +2804,25 @@ AI Assistant:
             self.ax3d_data.set_zlim([-1, 1])
             self.ax3d_data.set_title("3D Orientation - Live MPU Data")
 
-            # Initialize cube data for data tab
-            self.cube_data_data_tab = self.make_cube()
-            self.plot_cube_data_tab(*self.cube_data_data_tab)
+            # Same corners as the sensors-tab cube (shared when it exists), so
+            # update_3d_orientation can rotate once and draw both
+            if self.cube_data is not None:
+                self.cube_data_data_tab = self.cube_data
+            else:
+                self.cube_data_data_tab = self.make_cube()
+            self._cube_artists_data = self._make_cube_artists(
+                self.ax3d_data, self.cube_data_data_tab, markersize=7, linewidth=2
+            )
 
             # Create canvas for data tab
             self.canvas3d_data = FigureCanvasTkAgg(fig3d, master=parent)
-            self.canvas3d_data.draw()
+            self._enable_blit(
+                "cube_data",
+                self.canvas3d_data,
+                self.ax3d_data,
+                list(self._cube_artists_data),
+            )
+            self.canvas3d_data.draw_idle()
             self.canvas3d_data.get_tk_widget().pack(fill=BOTH, expand=True)
 
         except Exception as e:
@@ -1884,29 +2831,7 @@ AI Assistant:
     def plot_cube_data_tab(self, x, y, z):
         """Plot cube specifically for data tab 3D orientation"""
         try:
-            self.ax3d_data.cla()
-            self.ax3d_data.set_xlim([-1, 1])
-            self.ax3d_data.set_ylim([-1, 1])
-            self.ax3d_data.set_zlim([-1, 1])
-            self.ax3d_data.set_title("3D Orientation - Live MPU Data")
-            self.ax3d_data.scatter(x, y, z, color="skyblue", s=50)
-
-            # Draw cube edges
-            for i in range(8):
-                for j in range(i + 1, 8):
-                    if (
-                        np.linalg.norm(
-                            np.array([x[i], y[i], z[i]]) - np.array([x[j], y[j], z[j]])
-                        )
-                        == 1.0
-                    ):
-                        self.ax3d_data.plot(
-                            [x[i], x[j]],
-                            [y[i], y[j]],
-                            [z[i], z[j]],
-                            color="blue",
-                            linewidth=2,
-                        )
+            self._move_cube_artists(self._cube_artists_data, x, y, z)
         except Exception as e:
             print(f"[ERROR] Failed to plot cube in data tab: {e}")
 
@@ -1914,8 +2839,11 @@ AI Assistant:
         """
         Update the 3D orientation plot based on the latest sensor data.
         """
+        # Only the sensors tab shows the cube; show_tab(1) catches it up
+        if self.current_tab != 1:
+            return
         try:
-            if not hasattr(self, "cube_data") or not hasattr(self, "ax3d"):
+            if self.cube_data is None or self.ax3d is None:
                 print("[WARNING] 3D plot not initialized, skipping update")
                 return
 
@@ -1923,52 +2851,34 @@ AI Assistant:
             pitch = radians(self.pitch - self.cal_pitch)
             roll = radians(self.roll - self.cal_roll)
 
-            Rz = np.array(
-                [[cos(yaw), -sin(yaw), 0], [sin(yaw), cos(yaw), 0], [0, 0, 1]]
-            )
-            Ry = np.array(
-                [[cos(pitch), 0, sin(pitch)], [0, 1, 0], [-sin(pitch), 0, cos(pitch)]]
-            )
-            Rx = np.array(
-                [[1, 0, 0], [0, cos(roll), -sin(roll)], [0, sin(roll), cos(roll)]]
-            )
+            # Rz(yaw) @ Ry(pitch) @ Rx(roll) written out, filled in place
+            cy, sy = cos(yaw), sin(yaw)
+            cp, sp = cos(pitch), sin(pitch)
+            cr, sr = cos(roll), sin(roll)
+            R = self._R
+            R[0] = cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr
+            R[1] = sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr
+            R[2] = -sp, cp * sr, cp * cr
 
-            rotated = Rz @ Ry @ Rx @ self.cube_data
+            rotated = np.dot(R, self.cube_data, out=self._rot_buf)
             self.plot_cube(rotated[0], rotated[1], rotated[2])
-            if hasattr(self, "canvas3d"):
-                self.canvas3d.draw()
-
-            # Also update data tab 3D orientation if it exists
-            if hasattr(self, "cube_data_data_tab") and hasattr(self, "ax3d_data"):
-                rotated_data_tab = Rz @ Ry @ Rx @ self.cube_data_data_tab
-                self.plot_cube_data_tab(
-                    rotated_data_tab[0], rotated_data_tab[1], rotated_data_tab[2]
-                )
-                if hasattr(self, "canvas3d_data"):
-                    self.canvas3d_data.draw()
+            self._blit_update("cube")
+
+            # Also update data tab 3D orientation if it exists; both tabs use
+            # the same make_cube() corners, so the rotated cube is shared
+            if self.cube_data_data_tab is not None and self.ax3d_data is not None:
+                self.plot_cube_data_tab(rotated[0], rotated[1], rotated[2])
+                self._blit_update("cube_data")
 
         except Exception as e:
             print(f"[ERROR] 3D orientation update failed: {e}")
 
-    def schedule_simulation(self):
-        # Avoid extra UI refresh when connected; rely on data-driven updates
-        if self.is_connected:
-            self.after_job = self.after(1000, self.schedule_simulation)
-            return
-            # If not connected, keep plots alive but minimal
-            self.update_dht_plot()
-        self.after_job = self.after(1000, self.schedule_simulation)
-
     def _load_templates_if_needed(self):
         if self._template_cache is None:
             try:
                 with open("sensor_templates.json", "r") as f:
                     templates = json.load(f)
-                # precompile
-                for t in templates:
-                    rx = t.get("parser", {}).get("regex", "")
-                    t["_compiled"] = re.compile(rx) if rx else None
-                # map by type
+                # map by type; regexes are compiled on first lookup
                 self._template_cache = {t["type"].upper(): t for t in templates}
             except Exception:
                 self._template_cache = {}
@@ -1976,7 +2886,14 @@ AI Assistant:
 
     def _get_template_by_type(self, type_str):
         cache = self._load_templates_if_needed()
-        return cache.get(type_str.upper())
+        t = cache.get(type_str.upper())
+        if t is not None and "_compiled" not in t:
+            rx = t.get("parser", {}).get("regex", "")
+            try:
+                t["_compiled"] = re.compile(rx) if rx else None
+            except re.error:
+                t["_compiled"] = None
+        return t
 
     def open_add_sensor_dialog(self):
         # Dialog for adding a sensor
@@ -2008,7 +2925,7 @@ AI Assistant:
         port_menu = tb.Combobox(
             popup,
             textvariable=port_var,
-            values=[p.device for p in serial.tools.list_ports.comports()],
+            values=list(self._list_ports()),
             state="readonly",
         )
         port_menu.pack(pady=2)
@@ -2033,11 +2950,11 @@ AI Assistant:
                     "_ranges": t.get("ranges", {}),
                 }
             )
+            self._template_rx = None
+            self._sensor_by_type = None
             # init stream buffers for non-DHT/IMU
             if s_name not in self.generic_streams:
-                self.generic_streams[s_name] = {"time": []}
-                for f in t.get("fields", []):
-                    self.generic_streams[s_name][f] = []
+                self.generic_streams[s_name] = self._new_stream(t.get("fields", []))
             self.build_sensors_tab()
             popup.destroy()
 
@@ -2045,36 +2962,50 @@ AI Assistant:
             side=LEFT, padx=5
         )
 
+    @contextlib.contextmanager
+    def _batched_tk(self, parent):
+        """
+        Rebuild `parent`'s children without it resizing after every pack;
+        Tk settles the geometry in one pass when it next goes idle.
+        """
+        propagate = parent.pack_propagate()
+        parent.pack_propagate(False)
+        try:
+            yield
+        finally:
+            parent.pack_propagate(propagate)
+
     def build_settings_tab(self):
-        for w in self.tab_settings.winfo_children():
-            w.destroy()
-        tb.Label(
-            self.tab_settings, text="Settings", font=("Segoe UI", 16, "bold")
-        ).pack(pady=20)
-        # Board name management
-        boards_frame = tb.Frame(self.tab_settings)
-        boards_frame.pack(pady=10)
-        tb.Label(
-            boards_frame, text="Saved Boards:", font=("Segoe UI", 12, "bold")
-        ).pack(anchor="w")
-        for port, name in self.board_names.items():
-            row = tb.Frame(boards_frame)
-            row.pack(fill=X, pady=2)
-            tb.Label(row, text=f"{name} ({port})", font=("Segoe UI", 11)).pack(
-                side=LEFT, padx=5
-            )
-            tb.Button(
-                row,
-                text="Edit",
-                command=lambda p=port: self.edit_board_name(p),
-                bootstyle="info-outline",
-            ).pack(side=RIGHT, padx=5)
-            tb.Button(
-                row,
-                text="Remove",
-                command=lambda p=port: self.remove_board_name(p),
-                bootstyle="danger-outline",
-            ).pack(side=RIGHT, padx=5)
+        with self._batched_tk(self.tab_settings):
+            for w in self.tab_settings.winfo_children():
+                w.destroy()
+            tb.Label(
+                self.tab_settings, text="Settings", font=("Segoe UI", 16, "bold")
+            ).pack(pady=20)
+            # Board name management
+            boards_frame = tb.Frame(self.tab_settings)
+            boards_frame.pack(pady=10)
+            tb.Label(
+                boards_frame, text="Saved Boards:", font=("Segoe UI", 12, "bold")
+            ).pack(anchor="w")
+            for port, name in self.board_names.items():
+                row = tb.Frame(boards_frame)
+                row.pack(fill=X, pady=2)
+                tb.Label(row, text=f"{name} ({port})", font=("Segoe UI", 11)).pack(
+                    side=LEFT, padx=5
+                )
+                tb.Button(
+                    row,
+                    text="Edit",
+                    command=lambda p=port: self.edit_board_name(p),
+                    bootstyle="info-outline",
+                ).pack(side=RIGHT, padx=5)
+                tb.Button(
+                    row,
+                    text="Remove",
+                    command=lambda p=port: self.remove_board_name(p),
+                    bootstyle="danger-outline",
+                ).pack(side=RIGHT, padx=5)
 
     def edit_board_name(self, port):
         def save_edit():
@@ -2131,149 +3062,153 @@ AI Assistant:
         )
 
     def build_about_tab(self):
-        for w in self.tab_about.winfo_children():
-            w.destroy()
-
-        # Main container with scrollable content
-        main_frame = tb.Frame(self.tab_about)
-        main_frame.pack(fill=BOTH, expand=True, padx=20, pady=20)
-
-        # Application header
-        header_frame = tb.Frame(main_frame)
-        header_frame.pack(fill=X, pady=(0, 20))
-
-        # App logo/icon area
-        logo_frame = tb.Frame(header_frame)
-        logo_frame.pack(side=LEFT, padx=(0, 20))
+        with self._batched_tk(self.tab_about):
+            for w in self.tab_about.winfo_children():
+                w.destroy()
 
-        # Create a simple logo placeholder
-        logo_label = tb.Label(
-            logo_frame, text="🌊", font=("Segoe UI", 48), bootstyle="info"
-        )
-        logo_label.pack()
+            # Main container with scrollable content
+            main_frame = tb.Frame(self.tab_about)
+            main_frame.pack(fill=BOTH, expand=True, padx=20, pady=20)
 
-        # App info
-        info_frame = tb.Frame(header_frame)
-        info_frame.pack(side=LEFT, fill=BOTH, expand=True)
+            # Application header
+            header_frame = tb.Frame(main_frame)
+            header_frame.pack(fill=X, pady=(0, 20))
 
-        tb.Label(
-            info_frame,
-            text=APP_NAME,
-            font=("Segoe UI", 24, "bold"),
-            bootstyle="primary",
-        ).pack(anchor="w")
+            # App logo/icon area
+            logo_frame = tb.Frame(header_frame)
+            logo_frame.pack(side=LEFT, padx=(0, 20))
 
-        tb.Label(
-            info_frame,
-            text=f"Version {APP_VERSION}",
-            font=("Segoe UI", 14),
-            bootstyle="secondary",
-        ).pack(anchor="w", pady=(5, 0))
+            # Create a simple logo placeholder
+            logo_label = tb.Label(
+                logo_frame, text="🌊", font=("Segoe UI", 48), bootstyle="info"
+            )
+            logo_label.pack()
 
-        tb.Label(
-            info_frame, text=APP_DESCRIPTION, font=("Segoe UI", 12), bootstyle="info"
-        ).pack(anchor="w", pady=(10, 0))
+            # App info
+            info_frame = tb.Frame(header_frame)
+            info_frame.pack(side=LEFT, fill=BOTH, expand=True)
 
-        # Features section
-        features_frame = tb.LabelFrame(
-            main_frame, text="Key Features", bootstyle="info"
-        )
-        features_frame.pack(fill=X, pady=(0, 20))
-
-        features = [
-            "🔌 Real-time Serial Communication with Arduino/microcontrollers",
-            "📊 Advanced Data Visualization with Interactive Charts",
-            "🤖 AI-Powered Data Analysis with GPT4All Integration",
-            "📈 Professional Statistical Analysis Tools",
-            "💾 Data Export and Reporting Capabilities",
-            "🎨 Modern, Professional User Interface",
-            "⚡ High-Performance Real-time Processing",
-            "🔧 Comprehensive Sensor Support (DHT, MPU6050, TDS, AS7341, etc.)",
-        ]
+            tb.Label(
+                info_frame,
+                text=APP_NAME,
+                font=("Segoe UI", 24, "bold"),
+                bootstyle="primary",
+            ).pack(anchor="w")
 
-        for feature in features:
             tb.Label(
-                features_frame,
-                text=feature,
-                font=("Segoe UI", 10),
+                info_frame,
+                text=f"Version {APP_VERSION}",
+                font=("Segoe UI", 14),
                 bootstyle="secondary",
-            ).pack(anchor="w", padx=10, pady=2)
-
-        # Technical info
-        tech_frame = tb.LabelFrame(
-            main_frame, text="Technical Information", bootstyle="success"
-        )
-        tech_frame.pack(fill=X, pady=(0, 20))
-
-        tech_info = [
-            f"Python Version: {sys.version.split()[0]}",
-            f"Platform: {sys.platform}",
-            f"Architecture: {sys.maxsize > 2**32 and '64-bit' or '32-bit'}",
-            f"Build Date: {datetime.now().strftime('%Y-%m-%d')}",
-            f"AI Support: {'Enabled' if GPT4ALL_AVAILABLE else 'Disabled'}",
-        ]
+            ).pack(anchor="w", pady=(5, 0))
 
-        for info in tech_info:
             tb.Label(
-                tech_frame, text=info, font=("Consolas", 9), bootstyle="secondary"
-            ).pack(anchor="w", padx=10, pady=1)
+                info_frame,
+                text=APP_DESCRIPTION,
+                font=("Segoe UI", 12),
+                bootstyle="info",
+            ).pack(anchor="w", pady=(10, 0))
 
-        # Company info
-        company_frame = tb.LabelFrame(
-            main_frame, text="Company Information", bootstyle="warning"
-        )
-        company_frame.pack(fill=X, pady=(0, 20))
+            # Features section
+            features_frame = tb.LabelFrame(
+                main_frame, text="Key Features", bootstyle="info"
+            )
+            features_frame.pack(fill=X, pady=(0, 20))
+
+            features = [
+                "🔌 Real-time Serial Communication with Arduino/microcontrollers",
+                "📊 Advanced Data Visualization with Interactive Charts",
+                "🤖 AI-Powered Data Analysis with GPT4All Integration",
+                "📈 Professional Statistical Analysis Tools",
+                "💾 Data Export and Reporting Capabilities",
+                "🎨 Modern, Professional User Interface",
+                "⚡ High-Performance Real-time Processing",
+                "🔧 Comprehensive Sensor Support (DHT, MPU6050, TDS, AS7341, etc.)",
+            ]
 
-        tb.Label(
-            company_frame,
-            text=f"Developed by {APP_AUTHOR}",
-            font=("Segoe UI", 12, "bold"),
-            bootstyle="warning",
-        ).pack(anchor="w", padx=10, pady=5)
+            for feature in features:
+                tb.Label(
+                    features_frame,
+                    text=feature,
+                    font=("Segoe UI", 10),
+                    bootstyle="secondary",
+                ).pack(anchor="w", padx=10, pady=2)
+
+            # Technical info
+            tech_frame = tb.LabelFrame(
+                main_frame, text="Technical Information", bootstyle="success"
+            )
+            tech_frame.pack(fill=X, pady=(0, 20))
+
+            tech_info = [
+                f"Python Version: {sys.version.split()[0]}",
+                f"Platform: {sys.platform}",
+                f"Architecture: {sys.maxsize > 2**32 and '64-bit' or '32-bit'}",
+                f"Build Date: {datetime.now().strftime('%Y-%m-%d')}",
+                f"AI Support: {'Enabled' if GPT4ALL_AVAILABLE else 'Disabled'}",
+            ]
 
-        tb.Label(
-            company_frame,
-            text=APP_COPYRIGHT,
-            font=("Segoe UI", 10),
-            bootstyle="secondary",
-        ).pack(anchor="w", padx=10, pady=2)
+            for info in tech_info:
+                tb.Label(
+                    tech_frame, text=info, font=("Consolas", 9), bootstyle="secondary"
+                ).pack(anchor="w", padx=10, pady=1)
 
-        # Action buttons
-        button_frame = tb.Frame(main_frame)
-        button_frame.pack(fill=X, pady=(0, 20))
+            # Company info
+            company_frame = tb.LabelFrame(
+                main_frame, text="Company Information", bootstyle="warning"
+            )
+            company_frame.pack(fill=X, pady=(0, 20))
 
-        tb.Button(
-            button_frame,
-            text="Visit Website",
-            command=lambda: webbrowser.open(APP_WEBSITE),
-            bootstyle="info-outline",
-        ).pack(side=LEFT, padx=(0, 10))
+            tb.Label(
+                company_frame,
+                text=f"Developed by {APP_AUTHOR}",
+                font=("Segoe UI", 12, "bold"),
+                bootstyle="warning",
+            ).pack(anchor="w", padx=10, pady=5)
 
-        tb.Button(
-            button_frame,
-            text="View Logs",
-            command=self.show_logs,
-            bootstyle="secondary-outline",
-        ).pack(side=LEFT, padx=(0, 10))
+            tb.Label(
+                company_frame,
+                text=APP_COPYRIGHT,
+                font=("Segoe UI", 10),
+                bootstyle="secondary",
+            ).pack(anchor="w", padx=10, pady=2)
+
+            # Action buttons
+            button_frame = tb.Frame(main_frame)
+            button_frame.pack(fill=X, pady=(0, 20))
+
+            tb.Button(
+                button_frame,
+                text="Visit Website",
+                command=lambda: webbrowser.open(APP_WEBSITE),
+                bootstyle="info-outline",
+            ).pack(side=LEFT, padx=(0, 10))
 
-        tb.Button(
-            button_frame,
-            text="System Info",
-            command=self.show_system_info,
-            bootstyle="success-outline",
-        ).pack(side=LEFT)
+            tb.Button(
+                button_frame,
+                text="View Logs",
+                command=self.show_logs,
+                bootstyle="secondary-outline",
+            ).pack(side=LEFT, padx=(0, 10))
 
-        # License info
-        license_frame = tb.Frame(main_frame)
-        license_frame.pack(fill=X)
+            tb.Button(
+                button_frame,
+                text="System Info",
+                command=self.show_system_info,
+                bootstyle="success-outline",
+            ).pack(side=LEFT)
 
-        tb.Label(
-            license_frame,
-            text="This software is provided as-is for educational and professional use.\nPlease refer to the license agreement for terms and conditions.",
-            font=("Segoe UI", 9),
-            bootstyle="secondary",
-            justify="center",
-        ).pack()
+            # License info
+            license_frame = tb.Frame(main_frame)
+            license_frame.pack(fill=X)
+
+            tb.Label(
+                license_frame,
+                text="This software is provided as-is for educational and professional use.\nPlease refer to the license agreement for terms and conditions.",
+                font=("Segoe UI", 9),
+                bootstyle="secondary",
+                justify="center",
+            ).pack()
 
     def show_logs(self):
         """Show application logs in a new window."""
@@ -2297,9 +3232,7 @@ AI Assistant:
         # Read and display log file
         try:
             if os.path.exists("sealink.log"):
-                with open("sealink.log", "r", encoding="utf-8") as f:
-                    log_content = f.read()
-                    text_widget.insert(tk.END, log_content)
+                text_widget.insert(tk.END, self._read_log_tail())
             else:
                 text_widget.insert(
                     tk.END,
@@ -2321,6 +3254,13 @@ AI Assistant:
             bootstyle="info-outline",
         ).pack(side=tk.LEFT)
 
+        tb.Button(
+            button_frame,
+            text="Load Full Log",
+            command=lambda: self.refresh_logs(text_widget, full=True),
+            bootstyle="secondary-outline",
+        ).pack(side=tk.LEFT, padx=(10, 0))
+
         tb.Button(
             button_frame,
             text="Clear Logs",
@@ -2335,16 +3275,14 @@ AI Assistant:
             bootstyle="success-outline",
         ).pack(side=tk.RIGHT)
 
-    def refresh_logs(self, text_widget):
+    def refresh_logs(self, text_widget, full=False):
         """Refresh the log display."""
         text_widget.config(state=tk.NORMAL)
         text_widget.delete(1.0, tk.END)
 
         try:
             if os.path.exists("sealink.log"):
-                with open("sealink.log", "r", encoding="utf-8") as f:
-                    log_content = f.read()
-                    text_widget.insert(tk.END, log_content)
+                text_widget.insert(tk.END, self._read_log_tail(full))
             else:
                 text_widget.insert(tk.END, "No log file found.")
         except Exception as e:
@@ -2353,6 +3291,26 @@ AI Assistant:
         text_widget.config(state=tk.DISABLED)
         text_widget.see(tk.END)
 
+    def _read_log_tail(self, full=False):
+        """
+        Return the last LOG_TAIL_BYTES of sealink.log (or all of it), so the
+        viewer opens in constant time however large the log has grown.
+        """
+        with open("sealink.log", "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = 0 if full else max(0, size - LOG_TAIL_BYTES)
+            f.seek(start)
+            data = f.read()
+        text = data.decode("utf-8", errors="replace")
+        if start:
+            # Drop the partial first line and say what was left out
+            text = text.partition("\n")[2]
+            text = (
+                f"... showing the last {LOG_TAIL_BYTES // 1024} KB of "
+                f"{size // 1024} KB; use Load Full Log for everything ...\n\n" + text
+            )
+        return text
+
     def clear_logs(self, text_widget):
         """Clear the log file and display."""
         if messagebox.askyesno(
@@ -2382,7 +3340,8 @@ AI Assistant:
                 if os.path.exists("sealink.log"):
                     import shutil
 
-                    shutil.copy("sealink.log", file)
+                    # copyfile uses sendfile/fcopyfile where the OS has them
+                    shutil.copyfile("sealink.log", file)
                     messagebox.showinfo("Success", f"Logs exported to {file}")
                 else:
                     messagebox.showwarning("Warning", "No log file found to export.")
@@ -2409,9 +3368,8 @@ AI Assistant:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Gather system information
-        import platform
-        import psutil
-
+        static = _static_system_info()
+        memory = psutil.virtual_memory()
         system_info = f"""
 SYSTEM INFORMATION
 {"=" * 50}
@@ -2425,33 +3383,33 @@ Python Environment:
   Python Version: {sys.version}
   Python Executable: {sys.executable}
   Platform: {sys.platform}
-  Architecture: {platform.architecture()[0]}
+  Architecture: {static['architecture']}
 
 Operating System:
-  System: {platform.system()}
-  Release: {platform.release()}
-  Version: {platform.version()}
-  Machine: {platform.machine()}
-  Processor: {platform.processor()}
+  System: {static['system']}
+  Release: {static['release']}
+  Version: {static['version']}
+  Machine: {static['machine']}
+  Processor: {static['processor']}
 
 Hardware:
-  CPU Count: {psutil.cpu_count()}
-  CPU Usage: {psutil.cpu_percent()}%
-  Memory Total: {psutil.virtual_memory().total / (1024**3):.1f} GB
-  Memory Available: {psutil.virtual_memory().available / (1024**3):.1f} GB
-  Memory Usage: {psutil.virtual_memory().percent}%
+  CPU Count: {static['cpu_count']}
+  CPU Usage: {psutil.cpu_percent(interval=None)}%
+  Memory Total: {static['mem_total_gb']:.1f} GB
+  Memory Available: {memory.available / (1024**3):.1f} GB
+  Memory Usage: {memory.percent}%
   Disk Usage: {psutil.disk_usage("/").percent}%
 
 Dependencies:
   NumPy: {np.__version__}
   Pandas: {pd.__version__}
-  Matplotlib: {plt.matplotlib.__version__}
+  Matplotlib: {static['matplotlib']}
   Tkinter: Available
   Serial: Available
   GPT4All: {"Available" if GPT4ALL_AVAILABLE else "Not Available"}
 
 Application Status:
-  Serial Ports: {len(serial.tools.list_ports.comports())} available
+  Serial Ports: {len(self._list_ports())} available
   AI Status: {getattr(self, "ai_mode", "Unknown")}
   Theme: {self.settings.get("theme", "Unknown")}
   Data Points: {len(self.data_log) if hasattr(self, "data_log") else 0}
@@ -2547,7 +3505,6 @@ Application Status:
         """
         Export sensor data to a CSV file.
         """
-        import csv
         from tkinter import filedialog
 
         file = filedialog.asksaveasfilename(
@@ -2555,11 +3512,12 @@ Application Status:
         )
         if not file:
             return
-        with open(file, "w", newline="") as f:
+        with open(
+            file, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES
+        ) as f:
             writer = csv.writer(f)
             writer.writerow(["Time (s)", "Temperature (C)", "Humidity (%)"])
-            for t, temp, hum in zip(self.time_data, self.temp_data, self.hum_data):
-                writer.writerow([t, temp, hum])
+            _write_csv_rows(writer, zip(self.time_data, self.temp_data, self.hum_data))
         self.show_notification("All data exported!", style="success")
         self.status_lbl.config(text="All data exported!", bootstyle="success")
         self.after(
@@ -2571,7 +3529,6 @@ Application Status:
         )
 
     def export_all_data(self):
-        import csv
         from tkinter import filedialog
 
         file = filedialog.asksaveasfilename(
@@ -2579,20 +3536,22 @@ Application Status:
         )
         if not file:
             return
-        with open(file, "w", newline="") as f:
+        with open(
+            file, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES
+        ) as f:
             writer = csv.writer(f)
             writer.writerow(["Timestamp", "Sensor", "Value1", "Value2", "Value3"])
-            for entry in self.data_log:
-                vals = list(entry["values"]) + ["", ""]
-                writer.writerow(
-                    [entry["timestamp"], entry["sensor"], vals[0], vals[1], vals[2]]
-                )
+            _write_csv_rows(
+                writer,
+                (
+                    (e["timestamp"], e["sensor"], *_padded(e["values"], 3))
+                    for e in self.data_log
+                ),
+            )
         self.show_notification("All data exported!", style="success")
 
     def calculate_statistics(self):
         """Calculate statistical metrics for selected sensor data."""
-        import numpy as np
-        import pandas as pd
         from datetime import datetime
 
         selected_sensor = self.stats_sensor_var.get()
@@ -2602,115 +3561,97 @@ Application Status:
             return
 
         # Filter data by sensor if not "All Sensors"
-        if selected_sensor != "All Sensors":
-            filtered_data = [
-                entry for entry in self.data_log if entry["sensor"] == selected_sensor
-            ]
-        else:
-            filtered_data = self.data_log
+        sensor = None if selected_sensor == "All Sensors" else selected_sensor
+        values, rows, entries = self._log_values(sensor)
 
-        if not filtered_data:
+        if not entries:
             self._update_stats_display(f"No data found for sensor: {selected_sensor}")
             return
 
-        # Convert to DataFrame for easier analysis
-        df_data = []
-        for entry in filtered_data:
-            for i, value in enumerate(entry["values"]):
-                if value is not None and value != "":
-                    df_data.append(
-                        {
-                            "timestamp": entry["timestamp"],
-                            "sensor": entry["sensor"],
-                            "value": float(value),
-                            "value_index": i,
-                        }
-                    )
-
-        if not df_data:
+        if not len(values):
             self._update_stats_display("No numeric data found for analysis.")
             return
 
-        df = pd.DataFrame(df_data)
+        timestamps = [self.data_log[r]["timestamp"] for r in np.unique(rows).tolist()]
+        # Basic statistics come from the running aggregate kept at ingestion
+        n, mean, m2, vmin, vmax = self._agg[sensor]
+        var = m2 / (n - 1) if n > 1 else float("nan")
+        p25, p50, p75, p90, p95 = np.quantile(values, [0.25, 0.5, 0.75, 0.9, 0.95])
 
         # Calculate statistics
         stats_text = f"📊 STATISTICAL ANALYSIS REPORT\n"
         stats_text += f"{'=' * 50}\n"
         stats_text += f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         stats_text += f"Sensor: {selected_sensor}\n"
-        stats_text += f"Total Data Points: {len(df)}\n"
-        stats_text += (
-            f"Time Range: {df['timestamp'].min()} to {df['timestamp'].max()}\n\n"
-        )
+        stats_text += f"Total Data Points: {len(values)}\n"
+        stats_text += f"Time Range: {min(timestamps)} to {max(timestamps)}\n\n"
 
-        # Basic statistics
+        # Basic statistics (sample std/var, as pandas reports them)
         stats_text += "📈 BASIC STATISTICS\n"
         stats_text += f"{'─' * 30}\n"
-        stats_text += f"Mean:           {df['value'].mean():.4f}\n"
-        stats_text += f"Median:         {df['value'].median():.4f}\n"
-        stats_text += f"Standard Dev:   {df['value'].std():.4f}\n"
-        stats_text += f"Variance:       {df['value'].var():.4f}\n"
-        stats_text += f"Minimum:        {df['value'].min():.4f}\n"
-        stats_text += f"Maximum:        {df['value'].max():.4f}\n"
-        stats_text += f"Range:          {df['value'].max() - df['value'].min():.4f}\n\n"
+        stats_text += f"Mean:           {mean:.4f}\n"
+        stats_text += f"Median:         {p50:.4f}\n"
+        stats_text += f"Standard Dev:   {var ** 0.5:.4f}\n"
+        stats_text += f"Variance:       {var:.4f}\n"
+        stats_text += f"Minimum:        {vmin:.4f}\n"
+        stats_text += f"Maximum:        {vmax:.4f}\n"
+        stats_text += f"Range:          {vmax - vmin:.4f}\n\n"
 
         # Percentiles
         stats_text += "📊 PERCENTILES\n"
         stats_text += f"{'─' * 30}\n"
-        stats_text += f"25th Percentile: {df['value'].quantile(0.25):.4f}\n"
-        stats_text += f"50th Percentile: {df['value'].quantile(0.50):.4f}\n"
-        stats_text += f"75th Percentile: {df['value'].quantile(0.75):.4f}\n"
-        stats_text += f"90th Percentile: {df['value'].quantile(0.90):.4f}\n"
-        stats_text += f"95th Percentile: {df['value'].quantile(0.95):.4f}\n\n"
+        stats_text += f"25th Percentile: {p25:.4f}\n"
+        stats_text += f"50th Percentile: {p50:.4f}\n"
+        stats_text += f"75th Percentile: {p75:.4f}\n"
+        stats_text += f"90th Percentile: {p90:.4f}\n"
+        stats_text += f"95th Percentile: {p95:.4f}\n\n"
 
         # Data quality
         stats_text += "🔍 DATA QUALITY\n"
         stats_text += f"{'─' * 30}\n"
-        stats_text += f"Valid Values:    {len(df)}\n"
-        stats_text += f"Missing Values:  {len(filtered_data) * 10 - len(df)}\n"
+        stats_text += f"Valid Values:    {len(values)}\n"
+        stats_text += f"Missing Values:  {entries * 10 - len(values)}\n"
         stats_text += (
-            f"Data Completeness: {(len(df) / (len(filtered_data) * 10)) * 100:.1f}%\n\n"
+            f"Data Completeness: {(len(values) / (entries * 10)) * 100:.1f}%\n\n"
         )
 
         # Trend analysis
-        if len(df) > 1:
+        if len(values) > 1:
             # Simple linear trend
-            x = np.arange(len(df))
-            y = df["value"].values
-            slope, intercept = np.polyfit(x, y, 1)
+            slope, intercept, r = _linear_fit(np.arange(len(values)), values)
             stats_text += "📈 TREND ANALYSIS\n"
             stats_text += f"{'─' * 30}\n"
             stats_text += f"Linear Trend:    {slope:.6f} units/point\n"
             stats_text += f"Trend Direction: {'Increasing' if slope > 0 else 'Decreasing' if slope < 0 else 'Stable'}\n"
-            stats_text += f"Correlation:     {np.corrcoef(x, y)[0, 1]:.4f}\n\n"
+            stats_text += f"Correlation:     {r:.4f}\n\n"
 
         # Sensor-specific insights
         if selected_sensor == "Temperature":
             stats_text += "🌡️ TEMPERATURE INSIGHTS\n"
             stats_text += f"{'─' * 30}\n"
-            if df["value"].mean() < 0:
+            if mean < 0:
                 stats_text += "⚠️  Below freezing point\n"
-            elif df["value"].mean() > 50:
+            elif mean > 50:
                 stats_text += "⚠️  High temperature detected\n"
             else:
                 stats_text += "✅ Temperature within normal range\n"
         elif selected_sensor == "Humidity":
             stats_text += "💧 HUMIDITY INSIGHTS\n"
             stats_text += f"{'─' * 30}\n"
-            if df["value"].mean() < 30:
+            if mean < 30:
                 stats_text += "⚠️  Low humidity (dry conditions)\n"
-            elif df["value"].mean() > 70:
+            elif mean > 70:
                 stats_text += "⚠️  High humidity (moist conditions)\n"
             else:
                 stats_text += "✅ Humidity within comfortable range\n"
         elif selected_sensor == "TDS":
             stats_text += "💧 WATER QUALITY INSIGHTS\n"
             stats_text += f"{'─' * 30}\n"
-            if df["value"].mean() < 50:
+            if mean < 50:
                 stats_text += "✅ Excellent water quality (low TDS)\n"
-            elif df["value"].mean() < 200:
+            elif mean < 200:
                 stats_text += "✅ Good water quality\n"
-            elif df["value"].mean() < 500:
+            elif mean < 500:
                 stats_text += "⚠️  Fair water quality\n"
             else:
                 stats_text += "⚠️  Poor water quality (high TDS)\n"
@@ -2719,7 +3660,6 @@ Application Status:
 
     def generate_data_report(self):
         """Generate a comprehensive data analysis report."""
-        import pandas as pd
         from datetime import datetime
         from tkinter import filedialog
 
@@ -2739,68 +3679,37 @@ Application Status:
             return
 
         # Generate comprehensive report
-        report = f"SENSOR DATA ANALYSIS REPORT\n"
-        report += f"{'=' * 60}\n"
-        report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        report += f"Total Data Entries: {len(self.data_log)}\n\n"
+        report = [f"SENSOR DATA ANALYSIS REPORT\n"]
+        report.append(f"{'=' * 60}\n")
+        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        report.append(f"Total Data Entries: {len(self.data_log)}\n\n")
 
         # Sensor summary
-        sensor_counts = {}
-        for entry in self.data_log:
-            sensor = entry["sensor"]
-            sensor_counts[sensor] = sensor_counts.get(sensor, 0) + 1
-
-        report += "SENSOR SUMMARY\n"
-        report += f"{'─' * 30}\n"
-        for sensor, count in sensor_counts.items():
-            report += f"{sensor}: {count} entries\n"
-        report += "\n"
-
-        # Detailed analysis for each sensor
-        for sensor in sensor_counts.keys():
-            sensor_data = [
-                entry for entry in self.data_log if entry["sensor"] == sensor
-            ]
-            if not sensor_data:
-                continue
-
-            report += f"DETAILED ANALYSIS: {sensor}\n"
-            report += f"{'─' * 40}\n"
-
-            # Extract numeric values
-            values = []
-            for entry in sensor_data:
-                for value in entry["values"]:
-                    if value is not None and value != "":
-                        try:
-                            values.append(float(value))
-                        except:
-                            pass
-
-            if values:
-                import numpy as np
-
-                report += f"Data Points: {len(values)}\n"
-                report += f"Mean: {np.mean(values):.4f}\n"
-                report += f"Std Dev: {np.std(values):.4f}\n"
-                report += f"Min: {np.min(values):.4f}\n"
-                report += f"Max: {np.max(values):.4f}\n"
-                report += f"Range: {np.max(values) - np.min(values):.4f}\n\n"
-            else:
-                report += "No numeric data available\n\n"
+        report.append("SENSOR SUMMARY\n")
+        report.append(f"{'─' * 30}\n")
+        for sensor, rows in self._sensor_rows.items():
+            report.append(f"{sensor}: {len(rows)} entries\n")
+        report.append("\n")
+
+        # Detailed analysis for each sensor (NumPy releases the GIL on big arrays)
+        sensors = list(self._sensor_rows)
+        arrays = [self._get_floats(s) for s in sensors]
+        if len(sensors) > 1 and len(self._flat_values) >= REPORT_PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(sensors))) as pool:
+                report.extend(pool.map(_sensor_summary, sensors, arrays))
+        else:
+            report.extend(map(_sensor_summary, sensors, arrays))
 
         # Save report with UTF-8 encoding
         with open(file, "w", encoding="utf-8") as f:
-            f.write(report)
+            f.writelines(report)
 
         self.show_notification(f"Data report saved to: {file}", style="success")
 
     def plot_data_trends(self):
         """Create trend plots for sensor data."""
         try:
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            import numpy as np
+            Figure, FigureCanvasTkAgg = _mpl_tk()
 
             if not self.data_log:
                 self.show_notification(
@@ -2814,45 +3723,42 @@ Application Status:
             plot_window.geometry("800x600")
 
             # Get data for plotting
-            sensors = list(set(entry["sensor"] for entry in self.data_log))
+            sensors = list(self._sensor_rows)
 
             # Create subplots
-            fig, axes = plt.subplots(len(sensors), 1, figsize=(10, 6 * len(sensors)))
+            fig = Figure(figsize=(10, 6 * len(sensors)))
+            axes = fig.subplots(len(sensors), 1)
             if len(sensors) == 1:
                 axes = [axes]
 
             for i, sensor in enumerate(sensors):
-                sensor_data = [
-                    entry for entry in self.data_log if entry["sensor"] == sensor
-                ]
+                values = self._get_floats(sensor)
+                times = np.arange(len(values))  # Use reading index as time proxy
 
-                # Extract time and values
-                times = []
-                values = []
-                for entry in sensor_data:
-                    for j, value in enumerate(entry["values"]):
-                        if value is not None and value != "":
-                            try:
-                                times.append(j)  # Use index as time proxy
-                                values.append(float(value))
-                            except:
-                                pass
-
-                if values:
-                    axes[i].plot(times, values, "b-", linewidth=2, label=sensor)
+                if len(values):
+                    step = max(1, len(values) // PLOT_MAX_POINTS)
+                    axes[i].plot(
+                        times[::step], values[::step], "b-", linewidth=2, label=sensor
+                    )
                     axes[i].set_title(f"{sensor} Trend Analysis")
                     axes[i].set_xlabel("Data Point Index")
                     axes[i].set_ylabel("Value")
                     axes[i].grid(True, alpha=0.3)
                     axes[i].legend()
 
-                    # Add trend line
+                    # Add trend line (fit on every reading, drawn by its endpoints)
                     if len(values) > 1:
-                        z = np.polyfit(times, values, 1)
-                        p = np.poly1d(z)
-                        axes[i].plot(times, p(times), "r--", alpha=0.8, label="Trend")
+                        slope, intercept, _ = _linear_fit(times, values)
+                        ends = times[[0, -1]]
+                        axes[i].plot(
+                            ends,
+                            slope * ends + intercept,
+                            "r--",
+                            alpha=0.8,
+                            label="Trend",
+                        )
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Embed plot in tkinter window
             canvas = FigureCanvasTkAgg(fig, plot_window)
@@ -2866,12 +3772,6 @@ Application Status:
     def advanced_data_analysis(self):
         """Perform advanced statistical analysis with visualizations."""
         try:
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            import numpy as np
-            import pandas as pd
-            from scipy import stats
-
             if not self.data_log:
                 self.show_notification(
                     "No data available for advanced analysis.", style="warning"
@@ -2887,189 +3787,219 @@ Application Status:
             notebook = tb.Notebook(analysis_window)
             notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-            # 1. Distribution Analysis Tab
-            dist_frame = tb.Frame(notebook)
-            notebook.add(dist_frame, text="Distributions")
-
-            # Get all numeric data
-            all_values = []
-            sensor_values = {}
-            for entry in self.data_log:
-                sensor = entry["sensor"]
-                if sensor not in sensor_values:
-                    sensor_values[sensor] = []
-                for value in entry["values"]:
-                    if value is not None and value != "":
-                        try:
-                            val = float(value)
-                            all_values.append(val)
-                            sensor_values[sensor].append(val)
-                        except:
-                            pass
-
-            if all_values:
-                # Create distribution plots
-                fig1, axes1 = plt.subplots(2, 2, figsize=(12, 8))
-                fig1.suptitle("Data Distribution Analysis", fontsize=16)
-
-                # Histogram
-                axes1[0, 0].hist(
-                    all_values, bins=30, alpha=0.7, color="blue", edgecolor="black"
-                )
-                axes1[0, 0].set_title("Overall Data Distribution")
-                axes1[0, 0].set_xlabel("Value")
-                axes1[0, 0].set_ylabel("Frequency")
-                axes1[0, 0].grid(True, alpha=0.3)
-
-                # Box plot by sensor
-                sensor_data_for_box = [
-                    sensor_values[sensor]
-                    for sensor in sensor_values.keys()
-                    if sensor_values[sensor]
-                ]
-                sensor_names = [
-                    sensor for sensor in sensor_values.keys() if sensor_values[sensor]
-                ]
-                if sensor_data_for_box:
-                    axes1[0, 1].boxplot(sensor_data_for_box, labels=sensor_names)
-                    axes1[0, 1].set_title("Data Distribution by Sensor")
-                    axes1[0, 1].set_ylabel("Value")
-                    axes1[0, 1].tick_params(axis="x", rotation=45)
-                    axes1[0, 1].grid(True, alpha=0.3)
-
-                # Q-Q plot for normality
-                stats.probplot(all_values, dist="norm", plot=axes1[1, 0])
-                axes1[1, 0].set_title("Q-Q Plot (Normality Test)")
-                axes1[1, 0].grid(True, alpha=0.3)
-
-                # Cumulative distribution
-                sorted_values = np.sort(all_values)
-                cumulative = np.arange(1, len(sorted_values) + 1) / len(sorted_values)
-                axes1[1, 1].plot(sorted_values, cumulative, "b-", linewidth=2)
-                axes1[1, 1].set_title("Cumulative Distribution Function")
-                axes1[1, 1].set_xlabel("Value")
-                axes1[1, 1].set_ylabel("Cumulative Probability")
-                axes1[1, 1].grid(True, alpha=0.3)
-
-                plt.tight_layout()
-
-                # Embed in tkinter
-                canvas1 = FigureCanvasTkAgg(fig1, dist_frame)
-                canvas1.draw()
-                canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-            # 2. Correlation Analysis Tab
-            corr_frame = tb.Frame(notebook)
-            notebook.add(corr_frame, text="Correlations")
-
-            # Create correlation matrix
-            if len(sensor_values) > 1:
-                # Create DataFrame for correlation analysis
-                max_len = max(
-                    len(sensor_values[sensor]) for sensor in sensor_values.keys()
-                )
-                corr_data = {}
-                for sensor in sensor_values.keys():
-                    values = sensor_values[sensor]
-                    # Pad with NaN to make all arrays same length
-                    padded_values = values + [np.nan] * (max_len - len(values))
-                    corr_data[sensor] = padded_values
-
-                df_corr = pd.DataFrame(corr_data)
-                correlation_matrix = df_corr.corr()
-
-                fig2, ax2 = plt.subplots(figsize=(10, 8))
-                im = ax2.imshow(
-                    correlation_matrix, cmap="coolwarm", aspect="auto", vmin=-1, vmax=1
-                )
-                ax2.set_xticks(range(len(correlation_matrix.columns)))
-                ax2.set_yticks(range(len(correlation_matrix.columns)))
-                ax2.set_xticklabels(correlation_matrix.columns, rotation=45)
-                ax2.set_yticklabels(correlation_matrix.columns)
-                ax2.set_title("Sensor Correlation Matrix")
-
-                # Add correlation values to the plot
-                for i in range(len(correlation_matrix.columns)):
-                    for j in range(len(correlation_matrix.columns)):
-                        text = ax2.text(
-                            j,
-                            i,
-                            f"{correlation_matrix.iloc[i, j]:.2f}",
-                            ha="center",
-                            va="center",
-                            color="black",
-                            fontweight="bold",
-                        )
-
-                plt.colorbar(im, ax=ax2)
-                plt.tight_layout()
-
-                canvas2 = FigureCanvasTkAgg(fig2, corr_frame)
-                canvas2.draw()
-                canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-            # 3. Statistical Tests Tab
-            tests_frame = tb.Frame(notebook)
-            notebook.add(tests_frame, text="Statistical Tests")
-
-            # Perform statistical tests
-            tests_text = "📊 STATISTICAL TESTS RESULTS\n"
-            tests_text += "=" * 50 + "\n\n"
-
-            if all_values:
-                # Normality test
-                shapiro_stat, shapiro_p = stats.shapiro(
-                    all_values[:5000]
-                )  # Limit for performance
-                tests_text += f"🔍 NORMALITY TEST (Shapiro-Wilk)\n"
-                tests_text += f"{'─' * 30}\n"
-                tests_text += f"Statistic: {shapiro_stat:.6f}\n"
-                tests_text += f"P-value: {shapiro_p:.6f}\n"
-                tests_text += f"Result: {'Data appears normal' if shapiro_p > 0.05 else 'Data is not normal'}\n\n"
-
-                # Outlier detection using IQR
-                Q1 = np.percentile(all_values, 25)
-                Q3 = np.percentile(all_values, 75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                outliers = [x for x in all_values if x < lower_bound or x > upper_bound]
-
-                tests_text += f"🎯 OUTLIER DETECTION (IQR Method)\n"
-                tests_text += f"{'─' * 30}\n"
-                tests_text += f"Q1: {Q1:.4f}\n"
-                tests_text += f"Q3: {Q3:.4f}\n"
-                tests_text += f"IQR: {IQR:.4f}\n"
-                tests_text += f"Lower Bound: {lower_bound:.4f}\n"
-                tests_text += f"Upper Bound: {upper_bound:.4f}\n"
-                tests_text += f"Outliers Found: {len(outliers)}\n"
-                tests_text += f"Outlier Percentage: {(len(outliers) / len(all_values) * 100):.2f}%\n\n"
-
-                # Descriptive statistics
-                tests_text += f"📈 DESCRIPTIVE STATISTICS\n"
-                tests_text += f"{'─' * 30}\n"
-                tests_text += f"Skewness: {stats.skew(all_values):.4f}\n"
-                tests_text += f"Kurtosis: {stats.kurtosis(all_values):.4f}\n"
-                tests_text += f"Mean: {np.mean(all_values):.4f}\n"
-                tests_text += f"Median: {np.median(all_values):.4f}\n"
-                tests_text += (
-                    f"Mode: {stats.mode(all_values, keepdims=True)[0][0]:.4f}\n"
-                )
-                tests_text += f"Standard Error: {stats.sem(all_values):.4f}\n"
+            # Tabs are filled in the first time they are selected
+            pending = {}
+            for text, build in (
+                ("Distributions", self._analysis_distributions),
+                ("Correlations", self._analysis_correlations),
+                ("Statistical Tests", self._analysis_tests),
+            ):
+                frame = tb.Frame(notebook)
+                notebook.add(frame, text=text)
+                pending[str(frame)] = build
+
+            def fill_selected(event=None):
+                selected = str(notebook.select())
+                build = pending.pop(selected, None)
+                if build is None:
+                    return
+                try:
+                    build(notebook.nametowidget(selected))
+                except Exception as e:
+                    print(f"[ERROR] Advanced analysis failed: {e}")
+                    self.show_notification(
+                        f"Advanced analysis failed: {e}", style="danger"
+                    )
 
-            # Display tests results
-            tests_display = tk.Text(tests_frame, wrap=tk.WORD, font=("Consolas", 10))
-            tests_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            tests_display.insert(tk.END, tests_text)
-            tests_display.config(state=tk.DISABLED)
+            notebook.bind("<<NotebookTabChanged>>", fill_selected)
+            fill_selected()
 
         except Exception as e:
             print(f"[ERROR] Advanced analysis failed: {e}")
             self.show_notification(f"Advanced analysis failed: {e}", style="danger")
 
+    def _analysis_distributions(self, dist_frame):
+        """Histogram, per-sensor box plot, Q-Q plot and CDF of every reading."""
+        Figure, FigureCanvasTkAgg = _mpl_tk()
+        stats = _scipy_stats()
+        all_values = self._get_floats()
+        sensor_values = {s: self._get_floats(s) for s in self._sensor_rows}
+
+        if len(all_values):
+            # Create distribution plots
+            fig1 = Figure(figsize=(12, 8))
+            axes1 = fig1.subplots(2, 2)
+            fig1.suptitle("Data Distribution Analysis", fontsize=16)
+
+            # Histogram
+            counts, edges = np.histogram(all_values, bins=30)
+            axes1[0, 0].bar(
+                edges[:-1],
+                counts,
+                width=np.diff(edges),
+                align="edge",
+                alpha=0.7,
+                color="blue",
+                edgecolor="black",
+            )
+            axes1[0, 0].set_title("Overall Data Distribution")
+            axes1[0, 0].set_xlabel("Value")
+            axes1[0, 0].set_ylabel("Frequency")
+            axes1[0, 0].grid(True, alpha=0.3)
+
+            # Box plot by sensor
+            sensor_data_for_box = [
+                sensor_values[sensor]
+                for sensor in sensor_values.keys()
+                if len(sensor_values[sensor])
+            ]
+            sensor_names = [
+                sensor for sensor in sensor_values.keys() if len(sensor_values[sensor])
+            ]
+            if sensor_data_for_box:
+                axes1[0, 1].boxplot(sensor_data_for_box, labels=sensor_names)
+                axes1[0, 1].set_title("Data Distribution by Sensor")
+                axes1[0, 1].set_ylabel("Value")
+                axes1[0, 1].tick_params(axis="x", rotation=45)
+                axes1[0, 1].grid(True, alpha=0.3)
+
+            # Q-Q plot for normality
+            stats.probplot(all_values, dist="norm", plot=axes1[1, 0])
+            axes1[1, 0].set_title("Q-Q Plot (Normality Test)")
+            axes1[1, 0].grid(True, alpha=0.3)
+
+            # Cumulative distribution
+            sorted_values = np.sort(all_values)
+            cumulative = np.arange(1, len(sorted_values) + 1) / len(sorted_values)
+            step = max(1, len(sorted_values) // PLOT_MAX_POINTS)
+            axes1[1, 1].plot(
+                sorted_values[::step], cumulative[::step], "b-", linewidth=2
+            )
+            axes1[1, 1].set_title("Cumulative Distribution Function")
+            axes1[1, 1].set_xlabel("Value")
+            axes1[1, 1].set_ylabel("Cumulative Probability")
+            axes1[1, 1].grid(True, alpha=0.3)
+
+            fig1.tight_layout()
+
+            # Embed in tkinter
+            canvas1 = FigureCanvasTkAgg(fig1, dist_frame)
+            canvas1.draw()
+            canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _analysis_correlations(self, corr_frame):
+        """Heatmap of the pairwise correlation between sensors' readings."""
+        Figure, FigureCanvasTkAgg = _mpl_tk()
+        sensor_values = {s: self._get_floats(s) for s in self._sensor_rows}
+
+        # Create correlation matrix
+        if len(sensor_values) > 1:
+            # Correlate readings by index over the length every sensor has;
+            # sensors without numeric data stay NaN
+            names = list(sensor_values)
+            present = [i for i, s in enumerate(names) if len(sensor_values[s])]
+            corr = np.full((len(names), len(names)), np.nan)
+            if len(present) > 1:
+                n = min(len(sensor_values[names[i]]) for i in present)
+                stacked = np.vstack([sensor_values[names[i]][:n] for i in present])
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    corr[np.ix_(present, present)] = np.corrcoef(stacked)
+            correlation_matrix = pd.DataFrame(corr, index=names, columns=names)
+
+            fig2 = Figure(figsize=(10, 8))
+            ax2 = fig2.subplots()
+            im = ax2.imshow(
+                correlation_matrix, cmap="coolwarm", aspect="auto", vmin=-1, vmax=1
+            )
+            ax2.set_xticks(range(len(correlation_matrix.columns)))
+            ax2.set_yticks(range(len(correlation_matrix.columns)))
+            ax2.set_xticklabels(correlation_matrix.columns, rotation=45)
+            ax2.set_yticklabels(correlation_matrix.columns)
+            ax2.set_title("Sensor Correlation Matrix")
+
+            # Add correlation values to the plot (undefined cells left blank)
+            corr = correlation_matrix.to_numpy()
+            labels = np.char.mod("%.2f", corr)
+            for (i, j), label in np.ndenumerate(labels):
+                if np.isfinite(corr[i, j]):
+                    ax2.text(
+                        j,
+                        i,
+                        label,
+                        ha="center",
+                        va="center",
+                        color="black",
+                        fontweight="bold",
+                    )
+
+            fig2.colorbar(im, ax=ax2)
+            fig2.tight_layout()
+
+            canvas2 = FigureCanvasTkAgg(fig2, corr_frame)
+            canvas2.draw()
+            canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _analysis_tests(self, tests_frame):
+        """Normality, outlier and descriptive statistics over every reading."""
+        stats = _scipy_stats()
+        all_values = self._get_floats()
+
+        # Perform statistical tests
+        tests_text = "📊 STATISTICAL TESTS RESULTS\n"
+        tests_text += "=" * 50 + "\n\n"
+
+        if len(all_values):
+            # Normality test
+            shapiro_stat, shapiro_p = stats.shapiro(np.array(self._sample))
+            tests_text += f"🔍 NORMALITY TEST (Shapiro-Wilk)\n"
+            tests_text += f"{'─' * 30}\n"
+            tests_text += f"Statistic: {shapiro_stat:.6f}\n"
+            tests_text += f"P-value: {shapiro_p:.6f}\n"
+            tests_text += f"Result: {'Data appears normal' if shapiro_p > 0.05 else 'Data is not normal'}\n\n"
+
+            # Outlier detection using IQR
+            Q1, Q3 = np.quantile(all_values, [0.25, 0.75])
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            n_outliers = np.count_nonzero(
+                (all_values < lower_bound) | (all_values > upper_bound)
+            )
+
+            tests_text += f"🎯 OUTLIER DETECTION (IQR Method)\n"
+            tests_text += f"{'─' * 30}\n"
+            tests_text += f"Q1: {Q1:.4f}\n"
+            tests_text += f"Q3: {Q3:.4f}\n"
+            tests_text += f"IQR: {IQR:.4f}\n"
+            tests_text += f"Lower Bound: {lower_bound:.4f}\n"
+            tests_text += f"Upper Bound: {upper_bound:.4f}\n"
+            tests_text += f"Outliers Found: {n_outliers}\n"
+            tests_text += (
+                f"Outlier Percentage: {(n_outliers / len(all_values) * 100):.2f}%\n\n"
+            )
+
+            # Descriptive statistics
+            tests_text += f"📈 DESCRIPTIVE STATISTICS\n"
+            tests_text += f"{'─' * 30}\n"
+            tests_text += f"Skewness: {stats.skew(all_values):.4f}\n"
+            tests_text += f"Kurtosis: {stats.kurtosis(all_values):.4f}\n"
+            tests_text += f"Mean: {np.mean(all_values):.4f}\n"
+            tests_text += f"Median: {np.median(all_values):.4f}\n"
+            # Readings are continuous, so report the centre of the fullest bin
+            counts, edges = np.histogram(all_values, bins=50)
+            peak = counts.argmax()
+            mode = (edges[peak] + edges[peak + 1]) / 2
+            tests_text += f"Mode (hist peak): {mode:.4f}\n"
+            tests_text += f"Standard Error: {stats.sem(all_values):.4f}\n"
+
+        # Display tests results
+        tests_display = tk.Text(tests_frame, wrap=tk.WORD, font=("Consolas", 10))
+        tests_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        tests_display.insert(tk.END, tests_text)
+        tests_display.config(state=tk.DISABLED)
+
     def export_filtered_csv(self):
         """Export filtered data to CSV based on selected sensor."""
-        import csv
         from tkinter import filedialog
 
         selected_sensor = self.stats_sensor_var.get()
@@ -3080,9 +4010,7 @@ Application Status:
 
         # Filter data
         if selected_sensor != "All Sensors":
-            filtered_data = [
-                entry for entry in self.data_log if entry["sensor"] == selected_sensor
-            ]
+            filtered_data = self._sensor_entries(selected_sensor)
         else:
             filtered_data = self.data_log
 
@@ -3102,31 +4030,20 @@ Application Status:
             return
 
         # Export with enhanced format
-        with open(file, "w", newline="", encoding="utf-8") as f:
+        with open(
+            file, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES
+        ) as f:
             writer = csv.writer(f)
             # Enhanced header
-            writer.writerow(
-                [
-                    "Timestamp",
-                    "Sensor",
-                    "Value1",
-                    "Value2",
-                    "Value3",
-                    "Value4",
-                    "Value5",
-                    "Value6",
-                    "Value7",
-                    "Value8",
-                    "Value9",
-                    "Value10",
-                ]
-            )
+            writer.writerow(LOG_COLUMNS)
 
-            for entry in filtered_data:
-                vals = list(entry["values"])[:10]
-                if len(vals) < 10:
-                    vals += [""] * (10 - len(vals))
-                writer.writerow([entry["timestamp"], entry["sensor"]] + vals)
+            _write_csv_rows(
+                writer,
+                (
+                    (e["timestamp"], e["sensor"], *_padded(e["values"], 10))
+                    for e in filtered_data
+                ),
+            )
 
         self.show_notification(f"Filtered data exported to: {file}", style="success")
 
@@ -3158,26 +4075,10 @@ Application Status:
 
             # Create the CSV file with headers
             try:
-                import csv
-
                 with open(file, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
-                    writer.writerow(
-                        [
-                            "Timestamp",
-                            "Sensor",
-                            "Value1",
-                            "Value2",
-                            "Value3",
-                            "Value4",
-                            "Value5",
-                            "Value6",
-                            "Value7",
-                            "Value8",
-                            "Value9",
-                            "Value10",
-                        ]
-                    )
+                    writer.writerow(LOG_COLUMNS)
+                self._start_record_writer(file)
 
                 # Update UI
                 self.record_button.config(
@@ -3197,6 +4098,7 @@ Application Status:
     def stop_recording(self):
         """Stop recording data."""
         self.is_recording = False
+        self._stop_record_writer()
         self.record_button.config(text="🔴 Start Recording", bootstyle="danger-outline")
         self.rec_status_lbl.config(text="⚪ Not Recording", bootstyle="secondary")
         logger.info("Stopped recording")
@@ -3208,9 +4110,9 @@ Application Status:
             "Are you sure you want to clear all data? This action cannot be undone.",
         ):
             self.data_log.clear()
+            self._reset_log_index()
             # Clear the table
-            for item in self.data_table.get_children():
-                self.data_table.delete(item)
+            self.data_table.delete(*self.data_table.get_children())
             # Update summary
             self.data_summary.config(text="Data Points: 0")
             logger.info("Data cleared by user")
@@ -3218,11 +4120,15 @@ Application Status:
     def _update_stats_display(self, text):
         """Update the statistics display text widget."""
         self.stats_display.config(state="normal")
-        self.stats_display.delete(1.0, tk.END)
-        self.stats_display.insert(1.0, text)
+        self.stats_display.replace("1.0", "end-1c", text)
         self.stats_display.config(state="disabled")
 
     def show_tab(self, idx):
+        self.current_tab = idx
+        lazy = {3: self.build_settings_tab, 4: self.build_about_tab}
+        if idx in lazy and idx not in self._tabs_built:
+            self._tabs_built.add(idx)
+            lazy[idx]()
         for i, tab in enumerate(self.tabs):
             if i == idx:
                 tab.lift()
@@ -3230,28 +4136,83 @@ Application Status:
                 tab.lower()
         # Update dashboard quick stats and sensor list if on dashboard
         if idx == 0:
-            self.build_dashboard()
+            self._schedule_dashboard()
+        elif idx == 1:
+            # Plots skip updates while hidden; repaint them with the latest data
+            self.update_dht_plot()
+            if self.ax3d is not None:
+                self.update_3d_orientation()
 
     def show_notification(self, message, style="info"):
-        if hasattr(self, "_notif") and self._notif.winfo_exists():
-            self._notif.destroy()
-        self._notif = tb.Label(
-            self.topbar, text=message, bootstyle=style, font=("Segoe UI", 10, "bold")
-        )
+        if self._notif is None:
+            self._notif = tb.Label(self.topbar, font=("Segoe UI", 10, "bold"))
+        self._notif.configure(text=message, bootstyle=style)
         self._notif.pack(side=RIGHT, padx=10)
-        self.after(2000, self._notif.destroy)
+        # A newer message restarts the 2 s display
+        if self._notif_after is not None:
+            self.after_cancel(self._notif_after)
+        self._notif_after = self.after(2000, self._notif.pack_forget)
+
+    def _logo_photo(self):
+        """The 48x48 app logo, loaded once and shared by the sidebar and dashboard."""
+        if self._logo is None:
+            logo_img = Image.open("Sealielogo.png").resize((48, 48), Image.LANCZOS)
+            self._logo = ImageTk.PhotoImage(logo_img)
+        return self._logo
+
+    def _schedule_dashboard(self):
+        """Queue one build_dashboard for when Tk is idle; repeats coalesce."""
+        if not self._dash_pending:
+            self._dash_pending = True
+            self.after_idle(self._run_dashboard_rebuild)
+
+    def _run_dashboard_rebuild(self):
+        self._dash_pending = False
+        if self.current_tab == 0:
+            self.build_dashboard()
+
+    def _last(self, name, default=0):
+        """Latest sample of the named history deque, or default when empty."""
+        data = getattr(self, name, None)
+        return data[-1] if data else default
+
+    def _dashboard_layout(self):
+        """What decides which widgets the dashboard shows (not their values)."""
+        return (
+            tuple((s["name"], s["type"], s["icon"]) for s in self.active_sensors),
+            bool(self.temp_data),
+            bool(self.hum_data),
+            self._last("tds_data", None) is not None,
+            self.yaw != 0 or self.pitch != 0 or self.roll != 0,
+            self.night_mode,
+        )
+
+    def _refresh_dashboard(self):
+        """Push the latest readings into the dashboard's existing widgets."""
+        for meter, get in self._dash_meters:
+            meter.update(get())
+        for widgets, get in self._dash_bars:
+            self._set_enhanced_meter(widgets, get())
+        text = self.get_quick_stats()
+        if text != self._last_quick_stats:
+            self._last_quick_stats = text
+            self.quick_stats.config(text=text)
 
     def build_dashboard(self):
+        # Rebuild only when the set of cards/meters changes; otherwise update
+        layout = self._dashboard_layout()
+        if layout == self._dash_layout and self.tab_dashboard.winfo_children():
+            self._refresh_dashboard()
+            return
+        self._dash_layout = layout
+        self._dash_meters = []
+        self._dash_bars = []
         for w in self.tab_dashboard.winfo_children():
             w.destroy()
         # Modern, welcoming header
         header = tb.Frame(self.tab_dashboard, relief="ridge", borderwidth=1)
         header.pack(fill=X, pady=(20, 10))
-        logo_img = Image.open("Sealielogo.png")
-        logo_img = logo_img.resize((48, 48), Image.LANCZOS)
-        logo_photo = ImageTk.PhotoImage(logo_img)
-        logo_label = tk.Label(header, image=logo_photo)
-        logo_label.image = logo_photo
+        logo_label = tk.Label(header, image=self._logo_photo())
         logo_label.pack(side=LEFT, padx=10)
         tb.Label(
             header,
@@ -3282,6 +4243,12 @@ Application Status:
         # Modern meters/cards for each sensor (dashboard only)
         meters_frame = tb.Frame(self.tab_dashboard)
         meters_frame.pack(fill=X, pady=10)
+
+        def gauge(parent, total, subtext, suffix, style, get):
+            meter = SharedMeterCanvas(parent, total, subtext, suffix, style)
+            meter.update(get()).canvas.pack(pady=8)
+            self._dash_meters.append((meter, get))
+
         for sensor in self.active_sensors:
             meter_card = tb.Frame(
                 meters_frame,
@@ -3296,105 +4263,27 @@ Application Status:
                 font=("Segoe UI", 13, "bold"),
             ).pack(pady=(0, 8))
             if sensor["type"] == "DHT" and (self.temp_data or self.hum_data):
-                temp_val = self.temp_data[-1] if self.temp_data else 0
-                hum_val = self.hum_data[-1] if self.hum_data else 0
                 # Professional flat meters with color zones
-                tb.Meter(
+                gauge(
                     meter_card,
-                    amountused=temp_val,
-                    metertype="full",
-                    subtext="Temp (°C)",
-                    bootstyle="danger",
-                    stripethickness=10,
-                    interactive=False,
-                    amounttotal=50,
-                    textfont=("Segoe UI", 14, "bold"),
-                    subtextfont=("Segoe UI", 10),
-                    metersize=140,
-                    showtext=True,
-                    textright="°C",
-                    arcrange=270,
-                    arcoffset=135,
-                    stepsize=1,
-                    stripestyle="flat",
-                ).pack(pady=8)
-                tb.Meter(
+                    50,
+                    "Temp (°C)",
+                    "°C",
+                    "danger",
+                    lambda: self._last("temp_data"),
+                )
+                gauge(
                     meter_card,
-                    amountused=hum_val,
-                    metertype="full",
-                    subtext="Humidity (%)",
-                    bootstyle="info",
-                    stripethickness=10,
-                    interactive=False,
-                    amounttotal=100,
-                    textfont=("Segoe UI", 14, "bold"),
-                    subtextfont=("Segoe UI", 10),
-                    metersize=140,
-                    showtext=True,
-                    textright="%",
-                    arcrange=270,
-                    arcoffset=135,
-                    stepsize=1,
-                    stripestyle="flat",
-                ).pack(pady=8)
+                    100,
+                    "Humidity (%)",
+                    "%",
+                    "info",
+                    lambda: self._last("hum_data"),
+                )
             elif sensor["type"] == "IMU":
-                tb.Meter(
-                    meter_card,
-                    amountused=self.yaw,
-                    metertype="full",
-                    subtext="Yaw (°)",
-                    bootstyle="primary",
-                    stripethickness=10,
-                    interactive=False,
-                    amounttotal=180,
-                    textfont=("Segoe UI", 14, "bold"),
-                    subtextfont=("Segoe UI", 10),
-                    metersize=140,
-                    showtext=True,
-                    textright="°",
-                    arcrange=270,
-                    arcoffset=135,
-                    stepsize=1,
-                    stripestyle="flat",
-                ).pack(pady=8)
-                tb.Meter(
-                    meter_card,
-                    amountused=self.pitch,
-                    metertype="full",
-                    subtext="Pitch (°)",
-                    bootstyle="warning",
-                    stripethickness=10,
-                    interactive=False,
-                    amounttotal=90,
-                    textfont=("Segoe UI", 14, "bold"),
-                    subtextfont=("Segoe UI", 10),
-                    metersize=140,
-                    showtext=True,
-                    textright="°",
-                    arcrange=270,
-                    arcoffset=135,
-                    stepsize=1,
-                    stripestyle="flat",
-                ).pack(pady=8)
-                tb.Meter(
-                    meter_card,
-                    amountused=self.roll,
-                    metertype="full",
-                    subtext="Roll (°)",
-                    bootstyle="success",
-                    stripethickness=10,
-                    interactive=False,
-                    amounttotal=180,
-                    textfont=("Segoe UI", 14, "bold"),
-                    subtextfont=("Segoe UI", 10),
-                    metersize=140,
-                    showtext=True,
-                    textright="°",
-                    arcrange=270,
-                    arcoffset=135,
-                    stepsize=1,
-                    stripestyle="flat",
-                ).pack(pady=8)
+                gauge(meter_card, 180, "Yaw (°)", "°", "primary", lambda: self.yaw)
+                gauge(meter_card, 90, "Pitch (°)", "°", "warning", lambda: self.pitch)
+                gauge(meter_card, 180, "Roll (°)", "°", "success", lambda: self.roll)
             else:
                 tb.Label(
                     meter_card, text="No data", font=("Segoe UI", 11, "italic")
@@ -3402,7 +4291,7 @@ Application Status:
             tb.Button(
                 meter_card,
                 text="Configure",
-                command=lambda s=sensor: self.configure_sensor(s),
+                command=functools.partial(self.configure_sensor, sensor),
                 bootstyle="info-outline",
             ).pack(pady=5)
         # Quick stats
@@ -3411,8 +4300,9 @@ Application Status:
         tb.Label(stats_frame, text="Quick Stats", font=("Segoe UI", 14, "bold")).pack(
             anchor="w"
         )
+        self._last_quick_stats = self.get_quick_stats()
         self.quick_stats = tb.Label(
-            stats_frame, text=self.get_quick_stats(), font=("Segoe UI", 12)
+            stats_frame, text=self._last_quick_stats, font=("Segoe UI", 12)
         )
         self.quick_stats.pack()
         # Live Sensor Meters - REPLACED Recent Activity
@@ -3425,83 +4315,71 @@ Application Status:
         meters_container = tb.Frame(meters_section)
         meters_container.pack(fill=BOTH, expand=True, padx=10, pady=10)
 
+        def bar(parent, label, get, vmin, vmax, color):
+            widgets = self._draw_enhanced_meter(parent, label, get(), vmin, vmax, color)
+            self._dash_bars.append((widgets, get))
+
         # Temperature meter
-        if hasattr(self, "temp_data") and self.temp_data:
+        if self.temp_data:
             temp_frame = tb.Frame(meters_container)
             temp_frame.pack(fill=X, pady=5)
-            self._draw_enhanced_meter(
+            bar(
                 temp_frame,
                 "🌡️ Temperature",
-                self.temp_data[-1] if self.temp_data else 0,
+                lambda: self._last("temp_data"),
                 -10,
                 60,
                 "#ff6b6b",
             )
 
         # Humidity meter
-        if hasattr(self, "hum_data") and self.hum_data:
+        if self.hum_data:
             hum_frame = tb.Frame(meters_container)
             hum_frame.pack(fill=X, pady=5)
-            self._draw_enhanced_meter(
+            bar(
                 hum_frame,
                 "💧 Humidity",
-                self.hum_data[-1] if self.hum_data else 0,
+                lambda: self._last("hum_data"),
                 0,
                 100,
                 "#4ecdc4",
             )
 
         # TDS meter
-        if hasattr(self, "tds_data") and self.tds_data:
+        if self._last("tds_data", None) is not None:
             tds_frame = tb.Frame(meters_container)
             tds_frame.pack(fill=X, pady=5)
-            self._draw_enhanced_meter(
+            bar(
                 tds_frame,
                 "💧 Water Quality (TDS)",
-                self.tds_data[-1] if self.tds_data else 0,
+                lambda: self._last("tds_data"),
                 0,
                 1500,
                 "#45b7d1",
             )
 
         # IMU orientation meters
-        if hasattr(self, "yaw") and (
-            self.yaw != 0 or self.pitch != 0 or self.roll != 0
-        ):
+        if self.yaw != 0 or self.pitch != 0 or self.roll != 0:
             imu_frame = tb.Frame(meters_container)
             imu_frame.pack(fill=X, pady=5)
 
             # Yaw meter
             yaw_subframe = tb.Frame(imu_frame)
             yaw_subframe.pack(fill=X, pady=2)
-            self._draw_enhanced_meter(
-                yaw_subframe, "🧭 Yaw", self.yaw, -180, 180, "#96ceb4"
-            )
+            bar(yaw_subframe, "🧭 Yaw", lambda: self.yaw, -180, 180, "#96ceb4")
 
             # Pitch meter
             pitch_subframe = tb.Frame(imu_frame)
             pitch_subframe.pack(fill=X, pady=2)
-            self._draw_enhanced_meter(
-                pitch_subframe, "📐 Pitch", self.pitch, -90, 90, "#feca57"
-            )
+            bar(pitch_subframe, "📐 Pitch", lambda: self.pitch, -90, 90, "#feca57")
 
             # Roll meter
             roll_subframe = tb.Frame(imu_frame)
             roll_subframe.pack(fill=X, pady=2)
-            self._draw_enhanced_meter(
-                roll_subframe, "🔄 Roll", self.roll, -180, 180, "#ff9ff3"
-            )
+            bar(roll_subframe, "🔄 Roll", lambda: self.roll, -180, 180, "#ff9ff3")
 
-        # No data message
-        if not any(
-            [
-                hasattr(self, "temp_data") and self.temp_data,
-                hasattr(self, "hum_data") and self.hum_data,
-                hasattr(self, "tds_data") and self.tds_data,
-                hasattr(self, "yaw")
-                and (self.yaw != 0 or self.pitch != 0 or self.roll != 0),
-            ]
-        ):
+        # No data message: none of the readings in the layout key are present
+        if not any(layout[1:5]):
             no_data_frame = tb.Frame(meters_container)
             no_data_frame.pack(fill=BOTH, expand=True)
 
@@ -3533,6 +4411,20 @@ Application Status:
             side=LEFT, padx=2
         )
 
+    def _meter_gradient(self, color, width):
+        """20 px high PhotoImage of color ramping from 30% to full brightness."""
+        photo = self._gradient_cache.get((color, width))
+        if photo is None:
+            rgb = np.array([int(color[i : i + 2], 16) for i in (1, 3, 5)])
+            ramp = 0.3 + 0.7 * np.arange(width) / width
+            row = (ramp[:, None] * rgb).astype(np.uint8)
+            image = Image.fromarray(
+                np.ascontiguousarray(np.broadcast_to(row, (20, width, 3)))
+            )
+            photo = ImageTk.PhotoImage(image, master=self)
+            self._gradient_cache[(color, width)] = photo
+        return photo
+
     def _draw_enhanced_meter(self, parent, label, value, vmin, vmax, color):
         """Draw an enhanced meter with better styling and status indicators"""
         frame = tb.Frame(parent)
@@ -3544,35 +4436,15 @@ Application Status:
 
         tb.Label(label_frame, text=label, font=("Segoe UI", 11, "bold")).pack(side=LEFT)
 
-        # Calculate percentage and status
-        pct = (float(value) - vmin) / (vmax - vmin) if vmax != vmin else 0
-        pct = max(0, min(1, pct))
-
         # Status indicator
-        if pct < 0.3:
-            status = "🟢 Low"
-            status_color = "#28a745"
-        elif pct < 0.7:
-            status = "🟡 Normal"
-            status_color = "#ffc107"
-        else:
-            status = "🔴 High"
-            status_color = "#dc3545"
-
-        tb.Label(
-            label_frame,
-            text=status,
-            font=("Segoe UI", 9),
-            bootstyle="success" if pct < 0.3 else "warning" if pct < 0.7 else "danger",
-        ).pack(side=RIGHT)
+        status = tb.Label(label_frame, font=("Segoe UI", 9))
+        status.pack(side=RIGHT)
 
         # Value display
-        tb.Label(
-            label_frame,
-            text=f"{value:.2f}",
-            font=("Segoe UI", 12, "bold"),
-            bootstyle="primary",
-        ).pack(side=RIGHT, padx=(0, 10))
+        value_lbl = tb.Label(
+            label_frame, font=("Segoe UI", 12, "bold"), bootstyle="primary"
+        )
+        value_lbl.pack(side=RIGHT, padx=(0, 10))
 
         # Enhanced progress bar
         bar_frame = tb.Frame(frame)
@@ -3589,26 +4461,6 @@ Application Status:
         )
         bg_bar.pack(fill=X)
 
-        # Progress fill
-        bar_width = bg_bar.winfo_reqwidth() if bg_bar.winfo_reqwidth() > 0 else 200
-        fill_width = bar_width * pct
-
-        # Create gradient effect
-        for i in range(int(fill_width)):
-            intensity = i / fill_width if fill_width > 0 else 0
-            # Create color gradient
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-
-            # Darken based on intensity
-            r = int(r * (0.3 + 0.7 * intensity))
-            g = int(g * (0.3 + 0.7 * intensity))
-            b = int(b * (0.3 + 0.7 * intensity))
-
-            gradient_color = f"#{r:02x}{g:02x}{b:02x}"
-            bg_bar.create_rectangle(i, 0, i + 1, 20, fill=gradient_color, outline="")
-
         # Range labels
         range_frame = tb.Frame(frame)
         range_frame.pack(fill=X, pady=(2, 0))
@@ -3621,13 +4473,60 @@ Application Status:
             range_frame, text=f"{vmax}", font=("Segoe UI", 8), bootstyle="muted"
         ).pack(side=RIGHT)
 
+        widgets = {
+            "status": status,
+            "value": value_lbl,
+            "bar": bg_bar,
+            "range": (vmin, vmax),
+            "color": color,
+            "shown": [None, None, None],  # status, value text, fill width on screen
+        }
+        self._set_enhanced_meter(widgets, value)
+        return widgets
+
+    def _set_enhanced_meter(self, widgets, value):
+        """Show value on a meter built by _draw_enhanced_meter."""
+        vmin, vmax = widgets["range"]
+        pct = (float(value) - vmin) / (vmax - vmin) if vmax != vmin else 0
+        pct = max(0, min(1, pct))
+
+        # Only touch the widgets whose content changed since the last reading
+        shown = widgets["shown"]
+        status = METER_STATUS[(pct >= 0.3) + (pct >= 0.7)]
+        if status != shown[0]:
+            shown[0] = status
+            widgets["status"].config(text=status[0], bootstyle=status[1])
+        text = f"{value:.2f}"
+        if text != shown[1]:
+            shown[1] = text
+            widgets["value"].config(text=text)
+
+        # Progress fill
+        bg_bar = widgets["bar"]
+        bar_width = bg_bar.winfo_reqwidth() if bg_bar.winfo_reqwidth() > 0 else 200
+        fill_width = bar_width * pct
+
+        # Create gradient effect (widths snap to 8 px to keep the cache small)
+        fill_width = 8 * round(fill_width / 8)
+        if fill_width == shown[2]:
+            return
+        shown[2] = fill_width
+        bg_bar.delete("fill")
+        if fill_width:
+            bg_bar.create_image(
+                0,
+                0,
+                anchor="nw",
+                image=self._meter_gradient(widgets["color"], fill_width),
+                tags="fill",
+            )
+
     def get_quick_stats(self):
         if self.time_data:
-            return f"Temp: {self.temp_data[-1]:.1f}°C, Humidity: {self.hum_data[-1]:.1f}%, Yaw: {self.yaw:.1f}°"
-        elif self.yaw != 0 or self.pitch != 0 or self.roll != 0:
-            return f"Yaw: {self.yaw:.1f}°, Pitch: {self.pitch:.1f}°, Roll: {self.roll:.1f}°"
-        else:
-            return "No data yet. Connect a sensor."
+            return _QUICK_STATS_DHT(self.temp_data[-1], self.hum_data[-1], self.yaw)
+        if self.yaw or self.pitch or self.roll:
+            return _QUICK_STATS_IMU(self.yaw, self.pitch, self.roll)
+        return "No data yet. Connect a sensor."
 
     def build_data_tab(self):
         for w in self.tab_data.winfo_children():
@@ -3732,46 +4631,20 @@ Application Status:
         table_container.pack(fill=BOTH, expand=True, padx=10, pady=10)
 
         # Create enhanced Treeview
-        columns = (
-            "Timestamp",
-            "Sensor",
-            "Value1",
-            "Value2",
-            "Value3",
-            "Value4",
-            "Value5",
-            "Value6",
-            "Value7",
-            "Value8",
-            "Value9",
-            "Value10",
-        )
+        columns = LOG_COLUMNS
 
         self.data_table = tb.Treeview(
             table_container, columns=columns, show="headings", height=12
         )
 
-        # Configure column headings with better widths
-        column_widths = {
-            "Timestamp": 150,
-            "Sensor": 120,
-            "Value1": 80,
-            "Value2": 80,
-            "Value3": 80,
-            "Value4": 80,
-            "Value5": 80,
-            "Value6": 80,
-            "Value7": 80,
-            "Value8": 80,
-            "Value9": 80,
-            "Value10": 80,
-        }
-
+        # Configure column headings with better widths; calling the Tcl
+        # command directly skips ttk's per-call option formatting
+        call, table = self.data_table.tk.call, str(self.data_table)
+        column_widths = {"Timestamp": 150, "Sensor": 120}  # values get 80
         for col in columns:
-            self.data_table.heading(col, text=col, anchor="center")
-            self.data_table.column(
-                col, width=column_widths[col], minwidth=60, anchor="center"
-            )
+            call(table, "heading", col, "-text", col, "-anchor", "center")
+            width = ("-width", column_widths.get(col, 80), "-minwidth", 60)
+            call(table, "column", col, *width, "-anchor", "center")
 
         # Enhanced scrollbars
         v_scrollbar = tb.Scrollbar(
@@ -3798,16 +4671,7 @@ Application Status:
         table_container.grid_rowconfigure(0, weight=1)
         table_container.grid_columnconfigure(0, weight=1)
 
-        # Populate table with existing data
-        for entry in self.data_log:
-            vals = list(entry["values"])[:10]
-            if len(vals) < 10:
-                vals += [""] * (10 - len(vals))
-            self.data_table.insert(
-                "",
-                "end",
-                values=(entry["timestamp"], entry["sensor"], *vals),
-            )
+        self._fill_data_table()
         # Statistical Analysis Tools - ENHANCED
         stats_frame = tb.LabelFrame(
             main_container, text="📈 Statistical Analysis Tools", bootstyle="warning"
@@ -4059,10 +4923,17 @@ Application Status:
             return
         self.ai_chat_entry.delete(0, tk.END)
         self.append_ai_chat(f"You: {user_msg}\n")
-        # Route to selected AI provider (with fallback)
-        reply = ""
+        # Route to selected AI provider (with fallback); model inference can
+        # take seconds, so it runs on the AI thread and the reply comes back
+        # through _ingest_q, which the UI thread drains
+        future = self._ai_pool.submit(self.ai_func, user_msg)
+        future.add_done_callback(
+            lambda f: self._ingest_q.put((self._deliver_ai_reply, f))
+        )
+
+    def _deliver_ai_reply(self, future):
         try:
-            reply = self.ai_func(user_msg)
+            reply = future.result()
         except Exception as e:
             reply = f"AI error: {e}"
         self.append_ai_chat(f"AI ({self.ai_mode}): {reply}\n")
@@ -4086,34 +4957,27 @@ Application Status:
                 return
 
             # Calculate correlation matrix
-            corr_matrix = df[numeric_cols].corr()
+            corr = self._correlation_frame().to_numpy()
+
+            # Classify every pair in the upper triangle at once
+            rows, cols = np.triu_indices_from(corr, k=1)
+            vals = corr[rows, cols]
+            size = np.abs(vals)
+            strength = np.where(
+                size > 0.7, "Strong", np.where(size > 0.3, "Moderate", "Weak")
+            )
+            direction = np.where(vals > 0, "Positive", "Negative")
 
             # Display results
-            self.stats_display.config(state="normal")
-            self.stats_display.delete(1.0, tk.END)
-
-            result = "📊 CORRELATION ANALYSIS\n"
-            result += "=" * 50 + "\n\n"
-
-            for i, col1 in enumerate(numeric_cols):
-                for j, col2 in enumerate(numeric_cols):
-                    if i < j:  # Only upper triangle
-                        corr_val = corr_matrix.loc[col1, col2]
-                        strength = (
-                            "Strong"
-                            if abs(corr_val) > 0.7
-                            else "Moderate"
-                            if abs(corr_val) > 0.3
-                            else "Weak"
-                        )
-                        direction = "Positive" if corr_val > 0 else "Negative"
-
-                        result += f"{col1} ↔ {col2}:\n"
-                        result += f"  Correlation: {corr_val:.3f}\n"
-                        result += f"  Strength: {strength} {direction}\n\n"
-
-            self.stats_display.insert(tk.END, result)
-            self.stats_display.config(state="disabled")
+            names = list(numeric_cols)
+            blocks = [
+                f"{names[i]} ↔ {names[j]}:\n"
+                f"  Correlation: {r:.3f}\n"
+                f"  Strength: {s} {d}\n\n"
+                for i, j, r, s, d in zip(rows, cols, vals, strength, direction)
+            ]
+            result = "📊 CORRELATION ANALYSIS\n" + "=" * 50 + "\n\n"
+            self._update_stats_display(result + "".join(blocks))
 
         except Exception as e:
             self.show_notification(f"Correlation analysis failed: {e}", style="danger")
@@ -4137,13 +5001,9 @@ Application Status:
 
             # Simple linear regression between first two numeric columns
             x_col, y_col = numeric_cols[0], numeric_cols[1]
-            x_data = df[x_col].dropna()
-            y_data = df[y_col].dropna()
-
-            # Align data
-            common_idx = x_data.index.intersection(y_data.index)
-            x_vals = x_data.loc[common_idx].values
-            y_vals = y_data.loc[common_idx].values
+            # Rows where both columns have a value
+            pair = df[[x_col, y_col]].dropna().to_numpy(dtype=np.float64)
+            x_vals, y_vals = pair[:, 0], pair[:, 1]
 
             if len(x_vals) < 3:
                 self.show_notification(
@@ -4151,45 +5011,33 @@ Application Status:
                 )
                 return
 
-            # Calculate regression coefficients
-            n = len(x_vals)
-            sum_x = np.sum(x_vals)
-            sum_y = np.sum(y_vals)
-            sum_xy = np.sum(x_vals * y_vals)
-            sum_x2 = np.sum(x_vals**2)
-
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
-            intercept = (sum_y - slope * sum_x) / n
-
-            # Calculate R-squared
-            y_pred = slope * x_vals + intercept
-            ss_res = np.sum((y_vals - y_pred) ** 2)
-            ss_tot = np.sum((y_vals - np.mean(y_vals)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-
-            # Display results
-            self.stats_display.config(state="normal")
-            self.stats_display.delete(1.0, tk.END)
-
-            result = "📈 REGRESSION ANALYSIS\n"
-            result += "=" * 50 + "\n\n"
-            result += f"Predicting: {y_col} from {x_col}\n"
-            result += f"Data points: {len(x_vals)}\n\n"
-            result += f"Equation: {y_col} = {slope:.3f} × {x_col} + {intercept:.3f}\n"
-            result += f"R-squared: {r_squared:.3f}\n"
-            result += f"Slope: {slope:.3f}\n"
-            result += f"Intercept: {intercept:.3f}\n\n"
+            # Least squares on centred data; for a line R-squared is r squared
+            slope, intercept, r = _linear_fit(x_vals, y_vals)
+            r_squared = r**2 if np.isfinite(r) else 0
 
             # Interpretation
             if r_squared > 0.7:
-                result += "✅ Strong linear relationship\n"
+                verdict = "✅ Strong linear relationship"
             elif r_squared > 0.3:
-                result += "⚠️ Moderate linear relationship\n"
+                verdict = "⚠️ Moderate linear relationship"
             else:
-                result += "❌ Weak linear relationship\n"
+                verdict = "❌ Weak linear relationship"
 
-            self.stats_display.insert(tk.END, result)
-            self.stats_display.config(state="disabled")
+            # Display results
+            result = "".join(
+                [
+                    "📈 REGRESSION ANALYSIS\n",
+                    "=" * 50 + "\n\n",
+                    f"Predicting: {y_col} from {x_col}\n",
+                    f"Data points: {len(x_vals)}\n\n",
+                    f"Equation: {y_col} = {slope:.3f} × {x_col} + {intercept:.3f}\n",
+                    f"R-squared: {r_squared:.3f}\n",
+                    f"Slope: {slope:.3f}\n",
+                    f"Intercept: {intercept:.3f}\n\n",
+                    verdict + "\n",
+                ]
+            )
+            self._update_stats_display(result)
 
         except Exception as e:
             self.show_notification(f"Regression analysis failed: {e}", style="danger")
@@ -4223,11 +5071,23 @@ Application Status:
         except Exception as e:
             self.show_notification(f"Chart export failed: {e}", style="danger")
 
+    def _fill_data_table(self):
+        """Reload the data table rows from data_log."""
+        table = self.data_table
+        table.delete(*table.get_children())
+        # Calling the Tcl command directly skips ttk's per-row option formatting
+        call, name = table.tk.call, str(table)
+        for e in self.data_log:
+            row = (e["timestamp"], e["sensor"], *_padded(e["values"], 10))
+            call(name, "insert", "", "end", "-values", row)
+        self.data_summary.config(text=f"Data Points: {len(self.data_log)}")
+
     def refresh_analysis_data(self):
         """Refresh the analysis data and recalculate statistics"""
         try:
-            # Rebuild the data tab to refresh all displays
-            self.build_data_tab()
+            # Reload the table in place; rebuilding the tab would also wipe the
+            # stats output and AI chat
+            self._fill_data_table()
             self.show_notification(
                 "Analysis data refreshed successfully", style="success"
             )
@@ -4235,47 +5095,33 @@ Application Status:
             self.show_notification(f"Data refresh failed: {e}", style="danger")
 
     def append_ai_chat(self, msg):
+        # Messages queued within one event-loop pass reach the widget together
+        if not self._chat_buffer:
+            self.after_idle(self._flush_chat)
+        self._chat_buffer.append(msg)
+
+    def _flush_chat(self):
         self.ai_chat_log.config(state="normal")
-        self.ai_chat_log.insert(tk.END, msg)
+        self.ai_chat_log.insert(tk.END, "".join(self._chat_buffer))
+        self._chat_buffer.clear()
         self.ai_chat_log.see(tk.END)
         self.ai_chat_log.config(state="disabled")
 
     def process_ai_query(self, query):
         # Offline rules-based parser for common stats/plots
-        df = self.get_data_df()
         query_l = query.lower()
         try:
-            if "mean" in query_l or "average" in query_l:
-                if "temp" in query_l:
-                    return f"Mean temperature: {df['Value1'].mean():.2f}"
-                if "humidity" in query_l:
-                    return f"Mean humidity: {df['Value2'].mean():.2f}"
-                if "yaw" in query_l:
-                    return f"Mean yaw: {df['Value1'][df['Sensor'] == '3D Orientation'].mean():.2f}"
-                return f"Mean (Value1): {df['Value1'].mean():.2f}"
-            if "std" in query_l or "standard deviation" in query_l:
-                if "temp" in query_l:
-                    return f"Std temperature: {df['Value1'].std():.2f}"
-                if "humidity" in query_l:
-                    return f"Std humidity: {df['Value2'].std():.2f}"
-                return f"Std (Value1): {df['Value1'].std():.2f}"
-            if "min" in query_l:
-                if "temp" in query_l:
-                    return f"Min temperature: {df['Value1'].min():.2f}"
-                if "humidity" in query_l:
-                    return f"Min humidity: {df['Value2'].min():.2f}"
-                return f"Min (Value1): {df['Value1'].min():.2f}"
-            if "max" in query_l:
-                if "temp" in query_l:
-                    return f"Max temperature: {df['Value1'].max():.2f}"
-                if "humidity" in query_l:
-                    return f"Max humidity: {df['Value2'].max():.2f}"
-                return f"Max (Value1): {df['Value1'].max():.2f}"
+            # Stats answers depend only on the question and data_log, so they
+            # are kept until the log changes; plots and the LLM always rerun
+            if self._ai_answers[0] != self._log_version:
+                self._ai_answers = (self._log_version, {})
+            answers = self._ai_answers[1]
+            if query_l not in answers:
+                answers[query_l] = self._answer_stats_query(query_l)
+            if answers[query_l] is not None:
+                return answers[query_l]
+            df = self.get_data_df()
             if "histogram" in query_l or "plot" in query_l:
-                import matplotlib.pyplot as plt
-                import tempfile
-                import os
-
                 if "temp" in query_l:
                     col = "Value1"
                     label = "Temperature"
@@ -4285,23 +5131,19 @@ Application Status:
                 else:
                     col = "Value1"
                     label = "Value1"
-                fig, ax = plt.subplots()
-                df[col].dropna().plot(kind="hist", ax=ax, bins=20, color="#304674")
+                # Rendered at the popup's 400x300 straight into memory
+                Figure, _ = _mpl_tk()
+                fig = Figure(figsize=(4, 3), dpi=100)
+                ax = fig.add_subplot(111)
+                ax.hist(df[col].dropna(), bins=20, color="#304674")
                 ax.set_title(f"Histogram of {label}")
                 ax.set_xlabel(label)
                 ax.set_ylabel("Frequency")
-                tmpfile = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-                fig.savefig(tmpfile.name)
-                plt.close(fig)
-                self.show_ai_image(tmpfile.name)
-                os.unlink(tmpfile.name)
+                png = io.BytesIO()
+                fig.savefig(png, format="png")
+                png.seek(0)
+                self.show_ai_image(png)
                 return f"Histogram of {label} plotted."
-            if "correlation" in query_l:
-                corr = df.corr(numeric_only=True)
-                return f"Correlation matrix:\n{corr.to_string()}"
-            if "describe" in query_l or "summary" in query_l:
-                desc = df.describe().to_string()
-                return f"Summary statistics:\n{desc}"
             # Fallback: use local LLM if available
             if self.llm:
                 response = self.llm.generate(query, max_tokens=200)
@@ -4310,32 +5152,94 @@ Application Status:
         except Exception as e:
             return f"Error: {e}"
 
+    def _answer_stats_query(self, query_l):
+        """process_ai_query's reply to a statistics question, or None when it
+        asks for a plot or something else."""
+        for words, name, method in AI_STAT_OPS:
+            if not any(word in query_l for word in words):
+                continue
+            for word, col, label, sensor in AI_STAT_COLUMNS:
+                if word in query_l:
+                    stats = self._ai_stats((col, sensor))
+                    return f"{name} {label}: {stats[method]:.2f}"
+            return f"{name} (Value1): {self._ai_stats(('Value1', None))[method]:.2f}"
+        if "histogram" in query_l or "plot" in query_l:
+            return None
+        if "correlation" in query_l:
+            corr = self._correlation_frame()
+            return f"Correlation matrix:\n{corr.to_string()}"
+        if "describe" in query_l or "summary" in query_l:
+            desc = self._ai_stats("describe")
+            return f"Summary statistics:\n{desc}"
+        return None
+
+    def _ai_stats(self, key):
+        """Statistics behind the AI answers, kept until data_log changes:
+        "describe" gives the describe() table, (column, sensor or None) the
+        mean/std/min/max of that column computed together."""
+        if self._ai_stats_cache[0] != self._log_version:
+            self._ai_stats_cache = (self._log_version, {})
+        cache = self._ai_stats_cache[1]
+        if key not in cache:
+            df = self.get_data_df()
+            if key == "describe":
+                cache[key] = df.describe().to_string()
+            else:
+                col, sensor = key
+                series = df[col]
+                if sensor is not None:
+                    # df rows are data_log rows, so the index applies
+                    series = series.iloc[self._sensor_rows.get(sensor, [])]
+                cache[key] = series.agg(["mean", "std", "min", "max"])
+        return cache[key]
+
+    def _correlation_frame(self):
+        """Correlations between get_data_df's numeric columns, kept until
+        data_log changes."""
+        if self._corr_cache[0] != self._log_version:
+            df = self.get_data_df()
+            cols = df.select_dtypes(include=[np.number]).columns
+            corr = _nan_corrcoef(df[cols].to_numpy(dtype=np.float64))
+            frame = pd.DataFrame(corr, index=cols, columns=cols)
+            self._corr_cache = (self._log_version, frame)
+        return self._corr_cache[1]
+
     def get_data_df(self):
-        # Convert data_log to pandas DataFrame
-        if not self.data_log:
-            return pd.DataFrame(
-                columns=["Timestamp", "Sensor", "Value1", "Value2", "Value3"]
-            )
-        rows = []
-        for entry in self.data_log:
-            vals = list(entry["values"]) + [None, None]
-            rows.append(
-                {
-                    "Timestamp": entry["timestamp"],
-                    "Sensor": entry["sensor"],
-                    "Value1": vals[0],
-                    "Value2": vals[1],
-                    "Value3": vals[2],
-                }
-            )
-        return pd.DataFrame(rows)
+        # Convert data_log to pandas DataFrame; callers only read it, so the
+        # frame is shared until data_log changes
+        if self._df_cache[0] == self._log_version:
+            return self._df_cache[1]
+        df = self._build_data_df()
+        self._df_cache = (self._log_version, df)
+        return df
+
+    def _build_data_df(self):
+        # Fill one float column per value rather than a dict per row
+        log = self.data_log
+        values = np.full((3, len(log)), np.nan)
+        for i, entry in enumerate(log):
+            for j, value in enumerate(entry["values"][:3]):
+                try:
+                    values[j, i] = value
+                except (TypeError, ValueError):
+                    pass  # None, "" and non-numeric text stay NaN
+        return pd.DataFrame(
+            {
+                "Timestamp": [e["timestamp"] for e in log],
+                "Sensor": [e["sensor"] for e in log],
+                "Value1": values[0],
+                "Value2": values[1],
+                "Value3": values[2],
+            }
+        )
 
     def show_ai_image(self, img_path):
-        # Show image in a popup window
+        # Show image (a path or file object) in a 400x300 popup window
         popup = tk.Toplevel(self)
         popup.title("AI Analysis Result")
         img = Image.open(img_path)
-        img = img.resize((400, 300), Image.LANCZOS)
+        if img.size != (400, 300):
+            img = img.resize((400, 300), Image.LANCZOS)
         photo = ImageTk.PhotoImage(img)
         label = tk.Label(popup, image=photo)
         label.image = photo
@@ -4354,11 +5258,7 @@ Application Status:
         logo_frame = tb.Frame(self.sidebar_content, bootstyle="dark")
         logo_frame.pack(pady=(10, 10))
         try:
-            logo_img = Image.open("Sealielogo.png").resize((48, 48), Image.LANCZOS)
-            _photo = ImageTk.PhotoImage(logo_img)
-            lbl = tk.Label(logo_frame, image=_photo)
-            lbl.image = _photo
-            lbl.pack()
+            tk.Label(logo_frame, image=self._logo_photo()).pack()
         except Exception:
             tb.Label(logo_frame, text="SeaLink", font=("Segoe UI", 18, "bold")).pack()
 
@@ -4439,8 +5339,16 @@ Application Status:
         Handle application close event: cleanup and exit.
         """
         self.is_connected = False
-        if self.after_job:
-            self.after_cancel(self.after_job)
+        self._stop.set()
+        self._stop_record_writer(timeout=2.0)
+        self._ai_pool.shutdown(wait=False, cancel_futures=True)
+        with self._llm_cache_lock:
+            if isinstance(self._llm_cache, shelve.Shelf):
+                self._llm_cache.close()
+            # A reply still running on _ai_pool is then cached in memory only
+            self._llm_cache = {}
+        if self._drain_job:
+            self.after_cancel(self._drain_job)
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
         self.destroy()
@@ -4452,16 +5360,11 @@ Application Status:
         popup.geometry("600x400")
         text = tk.Text(popup, state="normal")
         text.pack(fill=BOTH, expand=True)
-        for line in getattr(self, "_serial_debug_log", []):
-            text.insert(tk.END, line + "\n")
+        text.insert(tk.END, "".join(line + "\n" for line in self._serial_debug_log))
         text.config(state="disabled")
 
     def log_serial_debug(self, line):
-        if not hasattr(self, "_serial_debug_log"):
-            self._serial_debug_log = []
-        self._serial_debug_log.append(line)
-        # Keep last 200 lines
-        self._serial_debug_log = self._serial_debug_log[-200:]
+        self._serial_debug_log.append(line)  # the deque drops the oldest
 
     def configure_sensor(self, sensor=None):
         # Dialog for configuring a sensor (port, name, etc.)
@@ -4497,7 +5400,7 @@ Application Status:
         port_menu = tb.Combobox(
             popup,
             textvariable=port_var,
-            values=[p.device for p in serial.tools.list_ports.comports()],
+            values=list(self._list_ports()),
             state="readonly",
         )
         port_menu.pack(pady=2)
@@ -4540,6 +5443,8 @@ Application Status:
                         ),
                     }
                 )
+                self._template_rx = None
+            self._sensor_by_type = None  # the type may have been edited
             self.build_sensors_tab()
             popup.destroy()
 
@@ -4559,23 +5464,27 @@ Application Status:
 
                 openai.api_key = key
 
+                def _openai_reply(prompt):
+                    resp = openai.ChatCompletion.create(
+                        model="gpt-3.5-turbo",
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.2,
+                        max_tokens=400,
+                    )
+                    return resp.choices[0].message["content"]
+
                 def _ask_openai(prompt: str) -> str:
                     try:
-                        resp = openai.ChatCompletion.create(
-                            model="gpt-3.5-turbo",
-                            messages=[{"role": "user", "content": prompt}],
-                            temperature=0.2,
-                            max_tokens=400,
+                        reply = self._cached_reply(
+                            "openai/gpt-3.5-turbo", prompt, _openai_reply
                         )
-                        return resp.choices[0].message["content"].strip()
+                        return reply.strip()
                     except Exception as e:
                         return f"OpenAI error: {e}"
 
                 self.ai_func = _ask_openai
                 self.ai_mode = "Online (OpenAI)"
                 tried_openai = True
-                if hasattr(self, "ai_status_lbl"):
-                    self.ai_status_lbl.config(text="AI: Online", bootstyle="success")
             except Exception:
                 tried_openai = True
         # Try GPT4All if allowed or OpenAI failed
@@ -4614,8 +5523,10 @@ Application Status:
                         try:
                             print(f"[AI] Generating response for: '{prompt[:50]}...'")
                             # Use simpler parameters for faster generation
-                            response = self.llm.generate(
-                                prompt, max_tokens=50, temp=0.1
+                            response = self._cached_reply(
+                                f"gpt4all/{model_name}",
+                                prompt,
+                                lambda p: self.llm.generate(p, max_tokens=50, temp=0.1),
                             ).strip()
 
                             print(f"[AI] GPT4All response: '{response[:100]}...'")
@@ -4641,8 +5552,6 @@ Application Status:
 
                 self.ai_func = _ask_gpt4all
                 self.ai_mode = "Ready (GPT4All)"
-                if hasattr(self, "ai_status_lbl"):
-                    self.ai_status_lbl.config(text="AI: Ready", bootstyle="success")
                 print(
                     "[AI] GPT4All initialized successfully (CPU mode - CUDA warnings are normal)"
                 )
@@ -4674,8 +5583,6 @@ Application Status:
 
                     self.ai_func = _ask_gpt4all_fallback
                     self.ai_mode = "Ready (GPT4All-Falcon)"
-                    if hasattr(self, "ai_status_lbl"):
-                        self.ai_status_lbl.config(text="AI: Ready", bootstyle="success")
                     print("[AI] GPT4All Falcon model initialized successfully")
                 except Exception as e2:
                     print(f"[AI] Fallback model also failed: {e2}")
@@ -4691,99 +5598,16 @@ Application Status:
             else:
                 # Enhanced conversational AI for fast, natural responses
                 def _simple_ai(prompt: str) -> str:
-                    prompt_lower = prompt.lower()
-
-                    # Greeting responses
-                    if any(
-                        word in prompt_lower
-                        for word in ["hello", "hi", "hey", "greetings"]
-                    ):
-                        return "Hello! I'm your IoT assistant. I can help you with sensor data analysis, Arduino projects, and technical questions. What would you like to know?"
-
-                    # General conversation
-                    elif any(
-                        word in prompt_lower
-                        for word in ["how are you", "how's it going", "what's up"]
-                    ):
-                        return "I'm doing great! I'm here to help you with your IoT project. I can see you have sensors connected and data flowing in. What would you like to explore?"
-
-                    # Weather/General questions
-                    elif any(
-                        word in prompt_lower
-                        for word in ["weather", "temperature outside", "hot", "cold"]
-                    ):
-                        return "I can see your sensor data, but I don't have access to external weather data. However, I can help you interpret your temperature sensor readings! Your sensors show real-time environmental data."
-
-                    # Chemical/Educational questions
-                    elif "chemical formula" in prompt_lower and "water" in prompt_lower:
-                        return "The chemical formula for water is H₂O - two hydrogen atoms and one oxygen atom. This is a fundamental compound in chemistry and essential for life!"
-
-                    # Technology questions
-                    elif any(
-                        word in prompt_lower
-                        for word in ["computer", "laptop", "technology", "programming"]
-                    ):
-                        return "I can help with programming and technology questions! For your IoT project, I can assist with Arduino code, sensor integration, and data analysis. What specific tech topic interests you?"
-
-                    # Temperature questions
-                    elif "temperature" in prompt_lower or "temp" in prompt_lower:
-                        return "Temperature sensors like DHT11/DHT22 measure ambient temperature. Normal range is 0-50°C for most applications. Your current readings show real-time temperature data from your connected sensors."
-
-                    # Humidity questions
-                    elif "humidity" in prompt_lower or "hum" in prompt_lower:
-                        return "Humidity sensors measure water vapor in air. Normal indoor range is 30-70% RH. Your sensor data shows current humidity levels that you can monitor in real-time."
-
-                    # IMU/Motion questions
-                    elif any(
-                        word in prompt_lower
-                        for word in [
-                            "imu",
-                            "gyro",
-                            "accelerometer",
-                            "motion",
-                            "orientation",
-                            "mpu6050",
-                        ]
-                    ):
-                        return "IMU sensors (MPU6050) measure orientation and motion. Values are in degrees for pitch/roll/yaw. You can see the 3D orientation visualization in the Sensors tab when your MPU6050 is connected."
-
-                    # Water quality questions
-                    elif any(
-                        word in prompt_lower
-                        for word in ["tds", "water", "quality", "ppm"]
-                    ):
-                        return "TDS sensors measure water quality in parts per million (ppm). Lower values indicate purer water. Your TDS readings are displayed in real-time on the dashboard."
-
-                    # Light/Color questions
-                    elif any(
-                        word in prompt_lower
-                        for word in [
-                            "spectrometer",
-                            "as7341",
-                            "light",
-                            "color",
-                            "spectrum",
-                        ]
-                    ):
-                        return "AS7341 spectrometer measures light across different wavelengths. It's useful for color analysis and light sensing. The bar chart in the Sensors tab shows the spectral data from your AS7341 sensor."
-
-                    # Help questions
-                    elif any(
-                        word in prompt_lower
-                        for word in ["help", "what", "how", "explain"]
-                    ):
-                        return "I can help you with:\n• Sensor data interpretation\n• Arduino project guidance\n• IoT system troubleshooting\n• Data analysis and insights\n• General technical questions\n\nWhat specific question do you have?"
-
+                    topic = _simple_ai_topic(prompt.lower(), _SIMPLE_AI_REPLIES)
+                    if topic is not None:
+                        return _SIMPLE_AI_REPLIES[topic]
                     # Default response - more conversational and helpful
-                    else:
-                        return f"I understand you're asking about: '{prompt}'. I can help with sensor data analysis, Arduino projects, IoT systems, and general technical questions. Could you be more specific about what you'd like to know? For example, you could ask about your temperature readings, IMU orientation data, water quality measurements, or any other technical topic!"
+                    return f"I understand you're asking about: '{prompt}'. I can help with sensor data analysis, Arduino projects, IoT systems, and general technical questions. Could you be more specific about what you'd like to know? For example, you could ask about your temperature readings, IMU orientation data, water quality measurements, or any other technical topic!"
 
                 self.ai_func = _simple_ai
                 self.ai_mode = "Simple Rules"
-                if hasattr(self, "ai_status_lbl"):
-                    self.ai_status_lbl.config(text="AI: Simple", bootstyle="warning")
         # Update AI status label
-        if hasattr(self, "ai_status_lbl"):
+        if self.ai_status_lbl is not None:
             if self.ai_mode == "Disabled":
                 self.ai_status_lbl.config(text="AI: Disabled", bootstyle="secondary")
             elif "GPT4All" in self.ai_mode:
@@ -4793,37 +5617,31 @@ Application Status:
             elif "Simple" in self.ai_mode:
                 self.ai_status_lbl.config(text="AI: Simple", bootstyle="warning")
 
+    def _cached_reply(self, model, prompt, ask):
+        """ask(prompt), remembered in LLM_CACHE_FILE per model and prompt so a
+        repeated question skips inference, also in later sessions."""
+        key = f"{model}\0{prompt}".encode()
+        key = hashlib.blake2b(key, digest_size=16).hexdigest()
+        with self._llm_cache_lock:
+            if self._llm_cache is None:
+                try:
+                    self._llm_cache = shelve.open(LLM_CACHE_FILE)
+                except Exception as e:
+                    logger.error(f"LLM cache unavailable: {e}")
+                    self._llm_cache = {}
+            reply = self._llm_cache.get(key)
+        if reply is None:
+            reply = ask(prompt)
+            with self._llm_cache_lock:
+                self._llm_cache[key] = reply
+        return reply
+
     def _simple_ai_fallback(self, prompt: str) -> str:
         """Simple AI fallback for when GPT4All times out."""
-        prompt_lower = prompt.lower()
-
-        if any(word in prompt_lower for word in ["hello", "hi", "hey", "greetings"]):
-            return "Hello! I'm your IoT assistant. I can help you with sensor data analysis, Arduino projects, and technical questions. What would you like to know?"
-        elif "temperature" in prompt_lower or "temp" in prompt_lower:
-            return "Temperature sensors like DHT11/DHT22 measure ambient temperature. Normal range is 0-50°C for most applications. Your current readings show real-time temperature data from your connected sensors."
-        elif "humidity" in prompt_lower or "hum" in prompt_lower:
-            return "Humidity sensors measure water vapor in air. Normal indoor range is 30-70% RH. Your sensor data shows current humidity levels that you can monitor in real-time."
-        elif any(
-            word in prompt_lower
-            for word in [
-                "imu",
-                "gyro",
-                "accelerometer",
-                "motion",
-                "orientation",
-                "mpu6050",
-            ]
-        ):
-            return "IMU sensors (MPU6050) measure orientation and motion. Values are in degrees for pitch/roll/yaw. You can see the 3D orientation visualization in the Sensors tab when your MPU6050 is connected."
-        elif any(word in prompt_lower for word in ["tds", "water", "quality", "ppm"]):
-            return "TDS sensors measure water quality in parts per million (ppm). Lower values indicate purer water. Your TDS readings are displayed in real-time on the dashboard."
-        elif any(
-            word in prompt_lower
-            for word in ["spectrometer", "as7341", "light", "color", "spectrum"]
-        ):
-            return "AS7341 spectrometer measures light across different wavelengths. It's useful for color analysis and light sensing. The bar chart in the Sensors tab shows the spectral data from your AS7341 sensor."
-        else:
-            return f"I understand you're asking about: '{prompt}'. I can help with sensor data analysis, Arduino projects, and IoT systems. Could you be more specific about what you'd like to know?"
+        topic = _simple_ai_topic(prompt.lower(), SIMPLE_AI_FALLBACK_TOPICS)
+        if topic is not None:
+            return _SIMPLE_AI_REPLIES[topic]
+        return f"I understand you're asking about: '{prompt}'. I can help with sensor data analysis, Arduino projects, and IoT systems. Could you be more specific about what you'd like to know?"
 
     def _retry_gpt4all_init(self):
         """Retry GPT4All initialization after a delay."""
@@ -4831,16 +5649,44 @@ Application Status:
             print("[AI] Retrying GPT4All initialization...")
             self.init_ai()
 
+    def _new_stream(self, fields):
+        """
+        Allocate a ring buffer for a generic sensor: one row per sample holding
+        [time, field1, field2, ...], written at idx % GENERIC_STREAM_LEN.
+        """
+        return {
+            "fields": list(fields),
+            "buf": np.zeros((GENERIC_STREAM_LEN, len(fields) + 1)),
+            "idx": 0,
+        }
+
+    def _stream_append(self, stream, t, values):
+        buf = stream["buf"]
+        row = buf[stream["idx"] % len(buf)]
+        row[0] = t
+        row[1:] = values
+        stream["idx"] += 1
+
+    def _stream_view(self, stream):
+        """Return the buffered samples oldest-first as an (n, 1 + fields) array."""
+        buf, idx = stream["buf"], stream["idx"]
+        if idx <= len(buf):
+            return buf[:idx]
+        return np.roll(buf, -(idx % len(buf)), axis=0)
+
     def _ingest_template_sensor(self, sensor, data):
         s_type = sensor.get("type", "").upper()
         s_name = sensor.get("name", s_type)
         now = time.time() - self.start_time
-        # Normalize floats
-        for k, v in list(data.items()):
-            try:
-                data[k] = float(v)
-            except Exception:
-                pass
+        # Normalize floats; key by key only if some value is not numeric
+        try:
+            data.update(zip(data, list(map(float, data.values()))))
+        except (TypeError, ValueError):
+            for k, v in data.items():
+                try:
+                    data[k] = float(v)
+                except (TypeError, ValueError):
+                    pass
         if s_type in ("DHT11", "DHT22"):
             temp = float(data.get("TEMP", 0.0))
             hum = float(data.get("HUM", 0.0))
@@ -4864,63 +5710,39 @@ Application Status:
             self.update_all_meters()
         elif s_type == "AS7341":
             # Spectrometer: baseline subtraction, normalize, smooth, update bars
-            keys = ["F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "CLEAR", "NIR"]
             state = self.as7341_state.setdefault(
-                s_name, {"baseline": {}, "smoothed": [0.0] * 10}
+                s_name, {"baseline": np.zeros(10), "smoothed": np.zeros(8)}
             )
-            baseline = state.get("baseline", {})
-            vals = [
-                max((data.get(k, 0.0) - baseline.get(k, 0.0)), 0.0) for k in keys[:8]
-            ]
-            max_val = max(vals) if max(vals) > 0 else 1.0
-            normalized = [v / max_val for v in vals]
+            raw = np.fromiter(
+                (data.get(k, 0.0) for k in AS7341_CHANNELS[:8]), dtype=float, count=8
+            )
+            vals = np.maximum(raw - state["baseline"][:8], 0.0)
+            peak = vals.max()
+            normalized = vals / peak if peak > 0 else vals
             alpha = 0.2
-            smoothed = [
-                alpha * n + (1 - alpha) * s
-                for n, s in zip(normalized, state.get("smoothed", [0.0] * 8))
-            ]
+            smoothed = alpha * normalized + (1 - alpha) * state["smoothed"][:8]
             state["smoothed"] = smoothed
             # If bars exist, update in-place
             bars = state.get("bars", [])
             if bars:
                 try:
-                    import matplotlib
-                    from matplotlib.colors import LinearSegmentedColormap
-
-                    bar_colors = [
-                        [(148 / 255, 0, 211 / 255), (75 / 255, 0, 130 / 255)],
-                        [(75 / 255, 0, 130 / 255), (0, 0, 1)],
-                        [(0, 0, 1), (0, 1, 1)],
-                        [(0, 1, 1), (0, 1, 0)],
-                        [(0, 1, 0), (1, 1, 0)],
-                        [(1, 1, 0), (1, 127 / 255, 0)],
-                        [(1, 127 / 255, 0), (1, 0, 0)],
-                        [(1, 0, 0), (148 / 255, 0, 211 / 255)],
-                    ]
-                    for i, bar in enumerate(bars):
-                        cmap = LinearSegmentedColormap.from_list(
-                            f"bar{i}", bar_colors[i]
-                        )
-                        bar.set_height(smoothed[i])
-                        bar.set_color(cmap(smoothed[i]))
-                    canvas = state.get("canvas")
-                    if canvas:
-                        canvas.draw()
+                    for bar, cmap, h in zip(bars, _as7341_cmaps(), smoothed):
+                        bar.set_height(h)
+                        bar.set_color(cmap(h))
+                    self._blit_update(f"as7341:{s_name}")
                 except Exception:
                     pass
             else:
                 # No bars yet; request UI to build the card (debounced)
                 self.request_sensors_refresh()
-            self.log_data("AS7341", tuple(vals))
+            self.log_data("AS7341", tuple(vals.tolist()))
         else:
             # Generic multi-field ingest into generic_streams
-            stream = self.generic_streams.setdefault(s_name, {"time": []})
-            stream["time"].append(now)
-            for f in sensor.get("fields", []):
-                stream.setdefault(f, []).append(float(data.get(f, 0.0)))
-                # limit
-                stream[f] = stream[f][-200:]
-            stream["time"] = stream["time"][-200:]
+            fields = sensor.get("fields", [])
+            stream = self.generic_streams.get(s_name)
+            if stream is None or stream["fields"] != fields:
+                stream = self.generic_streams[s_name] = self._new_stream(fields)
+            self._stream_append(stream, now, [float(data.get(f, 0.0)) for f in fields])
             self.log_data(
                 s_type, tuple(data.get(f, None) for f in sensor.get("fields", []))
             )
@@ -4929,20 +5751,12 @@ Application Status:
     def _parse_csv_sensor_line(self, line: str) -> bool:
         # Handle lines like: SENSOR,VAL[,VAL2,VAL3]
         try:
-            parts = [p.strip() for p in line.split(",")]
+            parts = line.split(",")
             if len(parts) < 2:
                 return False
-            sensor_type = parts[0].upper()
+            sensor_type = parts[0].strip().upper()
             # Find matching active sensor by type or alias
-            match_sensor = None
-            for s in self.active_sensors:
-                t = s.get("type", "").upper()
-                if t == sensor_type:
-                    match_sensor = s
-                    break
-                if sensor_type == "MPU6050" and t in ("MPU6050", "ITG/MPU6050"):
-                    match_sensor = s
-                    break
+            match_sensor = self._sensor_for_type(sensor_type)
             # If not found, auto-attach a sensor from templates
             if match_sensor is None:
                 tpl = self._get_template_by_type(sensor_type)
@@ -4971,22 +5785,9 @@ Application Status:
                         "_labels": tpl.get("labels", {}),
                         "_ranges": tpl.get("ranges", {}),
                     }
-                self.active_sensors.append(match_sensor)
-                if match_sensor["name"] not in self.generic_streams:
-                    self.generic_streams[match_sensor["name"]] = {"time": []}
-                    for f in match_sensor.get("fields", []):
-                        self.generic_streams[match_sensor["name"]][f] = []
-                try:
-                    self.build_sensors_tab()
-                except Exception:
-                    pass
+                self._ingest_q.put((self._attach_sensor, match_sensor))
             # Map values to fields in order
-            values = []
-            for v in parts[1:]:
-                try:
-                    values.append(float(v))
-                except Exception:
-                    values.append(0.0)
+            values = _csv_floats(parts[1:])
             fields = match_sensor.get("fields", [])
             # Special case: DS18B20 sometimes outputs -127 as error; ignore
             if sensor_type == "DS18B20" and len(values) >= 1 and values[0] <= -120:
@@ -4999,31 +5800,49 @@ Application Status:
             ):
                 values = [0.0] + values
             # Pad or trim to fields length
-            if len(values) < len(fields):
-                values += [0.0] * (len(fields) - len(values))
-            if len(values) > len(fields):
-                values = values[: len(fields)]
-            data = {f: values[i] for i, f in enumerate(fields)}
-            try:
-                self.after(
-                    0, lambda s=match_sensor, d=data: self._ingest_template_sensor(s, d)
-                )
-            except Exception as e:
-                print(f"[CSV PARSE WARN] {e}")
+            values += [0.0] * (len(fields) - len(values))
+            data = dict(zip(fields, values))
+            self._ingest_q.put((self._ingest_template_sensor, match_sensor, data))
             return True
         except Exception:
             return False
 
+    def _attach_sensor(self, sensor):
+        """UI-thread half of auto-attaching a sensor first seen on the port."""
+        # Lines parsed before this ran may have queued the same type again
+        if self._sensor_for_type(sensor["type"].upper()) is not None:
+            return
+        self.active_sensors.append(sensor)
+        self._template_rx = None
+        self._sensor_by_type = None
+        if sensor["name"] not in self.generic_streams:
+            self.generic_streams[sensor["name"]] = self._new_stream(
+                sensor.get("fields", [])
+            )
+        self.request_sensors_refresh()
+
+    def _drain_sensor_queue(self):
+        """
+        Run, on the UI thread, every (handler, *args) the serial and AI threads
+        queued since the last tick.
+        """
+        # Capped so a burst cannot hold up the UI; the rest waits a tick
+        for _ in range(SENSOR_DRAIN_BATCH):
+            try:
+                handler, *args = self._ingest_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(*args)
+            except Exception as e:
+                print(f"[INGEST WARN] {e}")
+        self._drain_job = self.after(SENSOR_DRAIN_MS, self._drain_sensor_queue)
+
     def _try_parse_as7341(self, line: str) -> bool:
         # Supports lines like:
         #  "AS7341, F1:123, F2:456, ..., CLEAR:789, NIR:101"
         #  or per-line prints like "F1 415nm: 123"
-        keys = ["F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "CLEAR", "NIR"]
-        rx = re.compile(
-            r"\b(F[1-8]|CLEAR|NIR)\b(?:\s*\d*nm)?\s*:\s*(-?\d+(?:\.\d+)?)",
-            re.IGNORECASE,
-        )
-        matches = rx.findall(line)
+        matches = _AS7341_RX.findall(line)
         if not matches and not line.upper().startswith("AS7341"):
             return False
         # If it is an AS7341 line with CSV of only numbers, let CSV parser handle it
@@ -5041,14 +5860,11 @@ Application Status:
             except Exception:
                 pass
         # If we have all keys, ingest
-        if all(k in self._as7341_buf["data"] for k in keys):
-            data = {k: self._as7341_buf["data"][k] for k in keys}
+        buf = self._as7341_buf["data"]
+        if buf.keys() >= _AS7341_CHANNEL_SET:
+            data = {k: buf[k] for k in AS7341_CHANNELS}
             # Find or add sensor
-            sensor = None
-            for s in self.active_sensors:
-                if s.get("type", "").upper() == "AS7341":
-                    sensor = s
-                    break
+            sensor = self._sensor_for_type("AS7341")
             if sensor is None:
                 tpl = self._get_template_by_type("AS7341") or {}
                 sensor = {
@@ -5056,20 +5872,15 @@ Application Status:
                     "name": "AS7341",
                     "port": "",
                     "icon": tpl.get("icon", "🌈"),
-                    "fields": tpl.get("fields", keys),
+                    "fields": tpl.get("fields", list(AS7341_CHANNELS)),
                     "graph": tpl.get("graph_type", "multi-line"),
                     "_compiled": tpl.get("_compiled"),
-                    "_labels": tpl.get("labels", {k: k for k in keys}),
+                    "_labels": tpl.get("labels", {k: k for k in AS7341_CHANNELS}),
                     "_ranges": tpl.get("ranges", {}),
                 }
-                self.active_sensors.append(sensor)
-                if sensor["name"] not in self.generic_streams:
-                    self.generic_streams[sensor["name"]] = {"time": []}
-                    for f in sensor.get("fields", []):
-                        self.generic_streams[sensor["name"]][f] = []
-                self.request_sensors_refresh()
+                self._ingest_q.put((self._attach_sensor, sensor))
             # Ingest through the same path as generic sensors
-            self._ingest_template_sensor(sensor, data)
+            self._ingest_q.put((self._ingest_template_sensor, sensor, data))
             # Reset buffer for next frame
             self._as7341_buf = {"data": {}, "t": now}
             return True